@@ -0,0 +1,51 @@
+"""Bulk card funding and payout throughput, 100 items against a server answering in 5ms."""
+
+import itertools
+
+import pytest
+
+from maplerad_python.payouts import PayoutEngine, PayoutJournal
+
+ITEMS = 100
+CONCURRENCY = [1, 4, 16, 64]
+batches = itertools.count()
+
+
+@pytest.fixture(scope="module")
+def slow_auth(slow_fake):
+    return slow_fake.client(pool_maxsize=max(CONCURRENCY), pool_block=True)
+
+
+@pytest.fixture(scope="module")
+def cards(slow_auth):
+    issuing = slow_auth.issuing()
+    return [issuing.create_card({"customer_id": "cus_bench", "currency": "USD"}).json()["data"]["id"]
+            for _ in range(10)]
+
+
+@pytest.mark.benchmark(group="bulk fund_cards")
+@pytest.mark.parametrize("workers", CONCURRENCY)
+def test_fund_cards(benchmark, slow_auth, cards, workers):
+    items = [(cards[i % len(cards)], 100) for i in range(ITEMS)]
+    report = benchmark.pedantic(
+        slow_auth.issuing().fund_cards, args=(items,), kwargs={"max_workers": workers}, rounds=3
+    )
+    assert report.counts()["success"] == ITEMS
+
+
+@pytest.mark.benchmark(group="bulk payouts")
+@pytest.mark.parametrize("workers", CONCURRENCY)
+def test_payout_engine(benchmark, slow_auth, tmp_path, workers):
+    def batch():
+        number = next(batches)
+        payouts = [
+            {"amount": 100, "account_number": "0123456789", "bank_code": "058", "reference": f"bench-{number}-{i}"}
+            for i in range(ITEMS)
+        ]
+        engine = PayoutEngine(
+            slow_auth.transfer(), PayoutJournal(tmp_path / f"{number}.ndjson", fsync=False), max_workers=workers
+        )
+        return (engine, payouts), {}
+
+    report = benchmark.pedantic(lambda engine, payouts: engine.run(payouts), setup=batch, rounds=3)
+    assert report.counts()["success"] == ITEMS
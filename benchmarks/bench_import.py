@@ -0,0 +1,16 @@
+"""Cold import time, every round in a fresh interpreter (startup included, see ``interpreter``)."""
+
+import subprocess
+import sys
+
+import pytest
+
+from import_time import SCENARIOS
+
+CASES = dict({"interpreter": "pass"}, **SCENARIOS)
+
+
+@pytest.mark.benchmark(group="import", min_rounds=10, warmup=False)
+@pytest.mark.parametrize("scenario", list(CASES))
+def test_import(benchmark, scenario):
+    benchmark(subprocess.run, [sys.executable, "-c", CASES[scenario]], check=True)
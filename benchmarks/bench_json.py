@@ -0,0 +1,35 @@
+"""Decode cost of a transaction page with every installed serializer."""
+
+import pytest
+import requests
+
+from maplerad_python.models import ApiResponse
+from maplerad_python.serializers import SERIALIZERS
+
+from json_codec import page
+
+
+def backend(name):
+    try:
+        return SERIALIZERS[name]()
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+
+@pytest.mark.benchmark(group="json decode")
+@pytest.mark.parametrize("size", [10, 100, 1000])
+@pytest.mark.parametrize("name", list(SERIALIZERS))
+def test_decode_page(benchmark, name, size):
+    serializer = backend(name)
+    encoded = SERIALIZERS["json"]().dumps(page(size))
+    assert len(benchmark(serializer.loads, encoded)["data"]) == size
+
+
+@pytest.mark.benchmark(group="json decode")
+@pytest.mark.parametrize("name", list(SERIALIZERS))
+def test_api_response_from_page(benchmark, name):
+    serializer = backend(name)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = SERIALIZERS["json"]().dumps(page(100))
+    benchmark(lambda: ApiResponse.from_response(response, loads=serializer.loads).data)
@@ -0,0 +1,15 @@
+"""Throughput of walking 500 customers page by page."""
+
+import pytest
+
+
+@pytest.mark.benchmark(group="pagination")
+@pytest.mark.parametrize("prefetch, concurrency", [(False, 1), (True, 1), (True, 4)])
+@pytest.mark.parametrize("page_size", [25, 100])
+def test_iter_customers(benchmark, auth, page_size, prefetch, concurrency):
+    customers = auth.customer()
+
+    def walk():
+        return sum(1 for _ in customers.iter_customers(page_size, prefetch=prefetch, concurrency=concurrency))
+
+    assert benchmark(walk) == 500
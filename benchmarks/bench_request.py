@@ -0,0 +1,56 @@
+"""Per-call overhead of the client, against a raw ``requests`` call to the same server."""
+
+import pytest
+import requests
+
+
+@pytest.mark.benchmark(group="request overhead")
+def test_raw_requests_session(benchmark, fake):
+    session = requests.Session()
+    headers = {"Authorization": "Bearer sk_fake"}
+    benchmark(session.get, fake.url + "/wallets", headers=headers)
+
+
+@pytest.mark.benchmark(group="request overhead")
+def test_authenticate_request(benchmark, auth):
+    response = benchmark(auth.__request__, "GET", "/wallets")
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group="request overhead")
+def test_authenticate_request_coalesced(benchmark, fake):
+    auth = fake.client()
+    benchmark(auth.__request__, "GET", "/wallets")
+
+
+@pytest.mark.benchmark(group="request overhead")
+def test_cached_request(benchmark, auth):
+    auth.misc().get_currencies()
+    benchmark(auth.misc().get_currencies)
+
+
+RESOURCE_CALLS = {
+    "customer.get_customer": lambda auth, ids: auth.customer().get_customer(ids["customer"]),
+    "issuing.get_card": lambda auth, ids: auth.issuing().get_card(ids["card"]),
+    "transfer.get_transfer": lambda auth, ids: auth.transfer().get_transfer(ids["transfer"]),
+    "wallet.get_wallets": lambda auth, ids: auth.wallet().get_wallets(),
+    "institution.resolve_institution": lambda auth, ids: auth.institution().resolve_institution(
+        {"account_number": "0123456789", "bank_code": "058"}, refresh=True
+    ),
+    "issuing.fund_card": lambda auth, ids: auth.issuing().fund_card(ids["card"], 100),
+}
+
+
+@pytest.fixture(scope="module")
+def ids(auth):
+    customer = auth.customer().get_all_customers(page_size=1).data[0]
+    card = auth.issuing().create_card({"customer_id": customer.id, "currency": "USD"}).json()["data"]
+    transfer = auth.transfer().naira_transfer({"amount": 100, "account_number": "0123456789"}).json()["data"]
+    return {"customer": customer.id, "card": card["id"], "transfer": transfer["id"]}
+
+
+@pytest.mark.benchmark(group="resource methods")
+@pytest.mark.parametrize("call", list(RESOURCE_CALLS))
+def test_resource_method(benchmark, auth, ids, call):
+    response = benchmark(RESOURCE_CALLS[call], auth, ids)
+    assert response.status_code in (200, 201)
@@ -0,0 +1,40 @@
+"""
+    Fixtures for the benchmark suite.
+
+    Everything runs against :class:`maplerad_python.fake.FakeMaplerad` on the
+    loopback interface, so numbers measure the client rather than the network.
+    Baselines live in ``benchmarks/baselines`` whatever the working directory.
+"""
+
+import os
+
+import pytest
+
+from maplerad_python.fake import FakeMaplerad, constant
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = "file://" + BASELINES
+
+
+@pytest.fixture(scope="session")
+def fake():
+    """zero latency server, for per-call overhead"""
+    with FakeMaplerad(customers=500, seed=1) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def slow_fake():
+    """server answering in 5ms, so concurrency has something to hide"""
+    with FakeMaplerad(latency=constant(0.005), customers=0, seed=1) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def auth(fake):
+    return fake.client(coalesce_gets=False)
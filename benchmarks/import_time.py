@@ -0,0 +1,80 @@
+"""
+    Cold start import benchmark.
+
+    Every scenario runs in a fresh interpreter, so nothing is cached in
+    ``sys.modules``. It reports the best wall time over several runs and the
+    modules the scenario pulled in.
+
+    Usage::
+        $ python benchmarks/import_time.py --runs 20
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+SCENARIOS = {
+    "import package": "import maplerad_python",
+    "import Authenticate": "from maplerad_python import Authenticate",
+    "client + one resource": (
+        "from maplerad_python import Authenticate\n"
+        "Authenticate('sk_test', 'DEVELOPMENT').customer()"
+    ),
+    "client + all resources": (
+        "from maplerad_python import Authenticate\n"
+        "auth = Authenticate('sk_test', 'DEVELOPMENT')\n"
+        "for name in ('customer', 'issuing', 'bills', 'collections', 'counterparty', 'fx',\n"
+        "             'identity', 'institution', 'misc', 'transactions', 'transfer', 'wallet'):\n"
+        "    getattr(auth, name)()"
+    ),
+}
+
+PROBE = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(loaded),
+    "requests": "requests" in loaded,
+    "resources": sorted(m for m in loaded if m.startswith("maplerad_python.")),
+}}))
+"""
+
+
+def measure(code, runs):
+    best = None
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", "import json\n" + PROBE.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1].strip())
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<26}{'best ms':>10}{'modules':>10}  requests  maplerad modules")
+    for name, code in SCENARIOS.items():
+        result = measure(code, args.runs)
+        print(
+            f"{name:<26}{result['seconds'] * 1000:>10.2f}{result['modules']:>10}"
+            f"  {str(result['requests']):<8}  {len(result['resources'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+    JSON backend micro-benchmark.
+
+    Encodes a transfer payload and decodes transaction list pages of several
+    sizes with every installed serializer, reporting the best time per call
+    and the speed-up over the standard library.
+
+    Usage, from the repository root::
+        $ PYTHONPATH=. python benchmarks/json_codec.py
+"""
+
+import timeit
+
+from maplerad_python.serializers import SERIALIZERS
+
+
+def transaction(i):
+    return {
+        "id": f"7c9a1d3e-{i:08d}",
+        "reference": f"ref-{i}",
+        "type": "CARD",
+        "entry": "DEBIT" if i % 3 else "CREDIT",
+        "status": "SUCCESS",
+        "amount": 125000 + i,
+        "fee": 150,
+        "currency": "NGN",
+        "description": "POS purchase at merchant",
+        "summary": {"merchant": {"name": "Shoprite", "city": "Lagos", "country": "NG"}},
+        "created_at": "2023-07-01T12:34:56.000Z",
+        "updated_at": "2023-07-01T12:35:01.000Z",
+    }
+
+
+def page(size):
+    return {
+        "status": True,
+        "message": "transactions fetched",
+        "data": [transaction(i) for i in range(size)],
+        "meta": {"page": 1, "page_size": size, "total": size * 10},
+    }
+
+
+TRANSFER = {
+    "account_number": "0123456789",
+    "bank_code": "058",
+    "amount": 500000,
+    "reason": "payout",
+    "currency": "NGN",
+    "reference": "payout-2023-07-01-000001",
+}
+
+
+def best(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    backends = {}
+    for name, cls in SERIALIZERS.items():
+        try:
+            backends[name] = cls()
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    baseline = backends["json"]
+    cases = [("encode transfer", TRANSFER, 20000)] + [
+        (f"decode page of {size}", page(size), number)
+        for size, number in ((10, 5000), (100, 500), (1000, 50))
+    ]
+    print(f"{'case':<22}" + "".join(f"{name:>16}" for name in backends))
+    for label, obj, number in cases:
+        encoded = baseline.dumps(obj)
+        row = []
+        base_time = None
+        for name, backend in backends.items():
+            if label.startswith("encode"):
+                seconds = best(lambda: backend.dumps(obj), number)
+            else:
+                seconds = best(lambda: backend.loads(encoded), number)
+            base_time = base_time or seconds
+            row.append(f"{seconds * 1e6:>8.1f}us x{base_time / seconds:>4.1f}")
+        print(f"{label:<22}" + "".join(f"{cell:>16}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
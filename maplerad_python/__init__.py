@@ -1 +1,37 @@
 __version__ = '0.1.0'
+
+
+# Names resolve to their submodule on first access, so ``import maplerad_python``
+# stays cheap and a process only pays for the resources it actually uses.
+import importlib
+
+_LAZY = {
+    "Authenticate": "auth",
+    "Customer": "customer",
+    "Issuing": "issuing",
+    "Bills": "bill",
+    "Collections": "collections",
+    "Counterparty": "counterparty",
+    "Fx": "fx",
+    "Identity": "identity",
+    "Institution": "institution",
+    "Transactions": "transactions",
+    "Misc": "misc",
+    "Transfers": "transfer",
+    "Wallets": "wallets",
+}
+
+__all__ = ["__version__"] + list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
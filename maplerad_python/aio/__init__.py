@@ -0,0 +1,40 @@
+"""
+    Asyncio client for the Maplerad API.
+
+    Mirrors :class:`maplerad_python.auth.Authenticate` and every resource class,
+    with each API method turned into a coroutine. Requires ``httpx``.
+    Submodules are imported on first attribute access.
+"""
+
+import importlib
+
+_LAZY = {
+    "AsyncAuthenticate": "auth",
+    "AsyncCustomer": "customer",
+    "AsyncIssuing": "issuing",
+    "AsyncBills": "bill",
+    "AsyncCollections": "collections",
+    "AsyncCounterparty": "counterparty",
+    "AsyncFx": "fx",
+    "AsyncIdentity": "identity",
+    "AsyncInstitution": "institution",
+    "AsyncTransactions": "transactions",
+    "AsyncMisc": "misc",
+    "AsyncTransfers": "transfer",
+    "AsyncWallets": "wallets",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
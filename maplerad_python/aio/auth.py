@@ -0,0 +1,328 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import asyncio
+import time
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "maplerad_python.aio requires httpx, install it with "
+        "`pip install maplerad-python[async]`"
+    )
+
+from ..cache import DEFAULT_TTLS, NEGATIVE_STATUSES, NEGATIVE_TTLS, MemoryCache, cache_key, validators
+from ..idempotency import MemoryIdempotencyStore, assign_reference
+from ..models import ApiResponse
+from ..retry import RetryPolicy, build_policies
+from ..serializers import get_serializer
+from ..singleflight import AsyncSingleFlight
+
+
+class AsyncAuthenticate:
+
+    def __init__(
+        self,
+        secret_key,
+        environment,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 30.0,
+        retry_policy: RetryPolicy = None,
+        method_retry_policies: dict = None,
+        rate_limiter=None,
+        circuit_breakers=None,
+        serializer="auto",
+        idempotency_store=None,
+        cache=None,
+        cache_ttls: dict = None,
+        resolve_cache=None,
+        negative_ttls: dict = None,
+        coalesce_gets: bool = True,
+        conditional=None,
+        base_url: str = None,
+    ):
+        """
+            :param environment -> PRODUCTION || DEVELOPMENT
+            :param max_connections -> upper bound on connections held by the shared pool
+            :param max_keepalive_connections -> idle connections kept open for reuse
+            :param timeout -> per request timeout in seconds
+            :param retry_policy -> RetryPolicy for idempotent methods, see ``Authenticate``
+            :param method_retry_policies -> {method: RetryPolicy} overrides
+            :param rate_limiter -> optional ``ratelimit.RateLimiter``, waited on without blocking the loop
+            :param circuit_breakers -> optional ``circuit.CircuitBreakers``, see ``Authenticate``
+            :param serializer -> JSON backend, see ``serializers.get_serializer``
+            :param idempotency_store -> idempotency keys and references, see ``Authenticate``
+            :param cache -> reference data cache, see ``Authenticate``
+            :param cache_ttls -> cache lifetimes, see ``Authenticate``
+            :param resolve_cache -> opt-in account resolution cache, see ``Authenticate``
+            :param negative_ttls -> "not found" cache lifetimes, see ``Authenticate``
+            :param coalesce_gets -> share one call between identical concurrent GETs of the loop
+            :param conditional -> optional ``cache.ConditionalCache``, see ``Authenticate``
+            :param base_url -> API root overriding ``environment``, see ``Authenticate``
+
+        All resource classes returned by this object share one ``httpx.AsyncClient``,
+        so a single event loop can keep many calls in flight over one connection pool.
+
+        Usage::
+            >>> from maplerad_python.aio import AsyncAuthenticate
+            >>> async with AsyncAuthenticate(secret_key,"DEVELOPMENT") as auth:
+            ...     customers = await asyncio.gather(
+            ...         *(auth.customer().get_customer(i) for i in customer_ids)
+            ...     )
+        """
+        self.secret_key = secret_key
+        self.environment = environment
+        if base_url is None:
+            base_url = (
+                "https://api.maplerad.com/v1" if environment == "PRODUCTION"
+                else "https://sandbox.api.maplerad.com/v1"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_policies = build_policies(self.retry_policy, method_retry_policies)
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.serializer = get_serializer(serializer)
+        self.idempotency_store = (
+            idempotency_store if idempotency_store is not None else MemoryIdempotencyStore()
+        )
+        self.cache = MemoryCache() if cache is None else (None if cache is False else cache)
+        self.cache_ttls = dict(DEFAULT_TTLS, **(cache_ttls or {}))
+        self.negative_ttls = dict(NEGATIVE_TTLS, **(negative_ttls or {}))
+        self.caches = {"resolve": resolve_cache}
+        self.conditional = conditional
+        self.single_flight = AsyncSingleFlight(share=ApiResponse.copy) if coalesce_gets else None
+        self.client = self.__client__(max_connections, max_keepalive_connections, timeout)
+
+    def __client__(self, max_connections, max_keepalive_connections, timeout):
+        """
+        default async client
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        return httpx.AsyncClient(
+            headers={
+                "accept": "application/json",
+                "content-type": "application/json",
+                "Authorization": f"Bearer {self.secret_key}",
+            },
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(limits=limits),
+        )
+
+    async def __cached__(self, cache, family, key, method, path, refresh=False, **kwargs):
+        """serve a request from ``cache`` for ``cache_ttls[family]`` (``negative_ttls`` when not found)"""
+        if not refresh:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[0]
+        response = await self.__request__(method, path, **kwargs)
+        if response.ok:
+            ttl = self.cache_ttls[family]
+        elif response.status_code in NEGATIVE_STATUSES and family in self.negative_ttls:
+            ttl = self.negative_ttls[family]
+        else:
+            return response
+        cache.set(key, response, time.time() + ttl)
+        return response
+
+    async def __request__(self, method, path, **kwargs):
+        url = self.base_url + path
+
+        family = kwargs.pop("cache", None)
+        cache = self.caches.get(family, self.cache) if family is not None else None
+        if cache is not None:
+            key = cache_key(url, kwargs.get("params"), kwargs.get("json"))
+            return await self.__cached__(cache, family, key, method, path, **kwargs)
+        kwargs.pop("refresh", None)
+
+        send = self.__send__
+        if kwargs.pop("conditional", False) and self.conditional is not None:
+            send = self.__conditional__
+        # a GET carrying a body (credit_test_wallet) changes state, never share it
+        if self.single_flight is not None and method.upper() == "GET" and kwargs.get("json") is None:
+            key = cache_key(url, kwargs.get("params"))
+            return await self.single_flight.do(key, lambda: send(method, path, url, **kwargs))
+        return await send(method, path, url, **kwargs)
+
+    async def __conditional__(self, method, path, url, **kwargs):
+        """send with the validators of the last response for ``url`` and reuse it on 304"""
+        key = cache_key(url, kwargs.get("params"))
+        cached = self.conditional.get(key)
+        if cached is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **validators(cached))
+        response = await self.__send__(method, path, url, **kwargs)
+        return self.conditional.update(key, cached, response)
+
+    async def __send__(self, method, path, url, **kwargs):
+        policy = self.retry_policies.get(method.upper())
+        lookup = kwargs.pop("lookup", None)
+        reference, in_doubt = None, False
+        if lookup is not None:
+            reference, in_doubt = assign_reference(self.idempotency_store, kwargs)
+            policy = policy or self.retry_policy
+
+        if kwargs.get("json") is not None:
+            kwargs["content"] = self.serializer.dumps(kwargs.pop("json"))
+
+        breaker = self.circuit_breakers.for_path(path) if self.circuit_breakers else None
+        start = time.monotonic()
+        attempt = 0
+        last = None
+        while True:
+            attempt += 1
+            if in_doubt:
+                landed = await self.__request__("GET", lookup + reference)
+                if landed.ok:
+                    return landed
+                if landed.status_code != 404:
+                    if isinstance(last, Exception):
+                        raise last
+                    return last if last is not None else landed
+                in_doubt = False
+            probe = breaker.before_call() if breaker is not None else False
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(path)
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as error:
+                if breaker is not None:
+                    breaker.record_failure()
+                active = policy
+                if active is None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+                    active = self.retry_policy
+                delay = active.next_delay(attempt, time.monotonic() - start) if active else None
+                if delay is None:
+                    raise
+                in_doubt = reference is not None and not isinstance(
+                    error, (httpx.ConnectError, httpx.ConnectTimeout)
+                )
+                last = error
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if probe:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                if self.circuit_breakers.is_failure(response.status_code):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+            if policy is not None and policy.retries_status(response.status_code):
+                delay = policy.next_delay(attempt, time.monotonic() - start, response.headers)
+                if delay is not None:
+                    if reference is not None and response.status_code >= 500:
+                        in_doubt = True
+                        last = ApiResponse.from_response(response, loads=self.serializer.loads)
+                    await response.aclose()
+                    await asyncio.sleep(delay)
+                    continue
+
+            return ApiResponse.from_response(response, loads=self.serializer.loads)
+
+    async def aclose(self):
+        """close the shared connection pool"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def customer(self):
+        """
+        customer related
+        """
+        from .customer import AsyncCustomer
+        return AsyncCustomer(self.__request__)
+
+    def issuing(self):
+        """issuing related"""
+        from .issuing import AsyncIssuing
+        return AsyncIssuing(self.__request__)
+
+    def bills(self):
+        """for bills"""
+        from .bill import AsyncBills
+        return AsyncBills(self.__request__)
+
+    def collections(self):
+        """for collections"""
+        from .collections import AsyncCollections
+        return AsyncCollections(self.__request__)
+
+    def counterparty(self):
+        """country party"""
+        from .counterparty import AsyncCounterparty
+        return AsyncCounterparty(self.__request__)
+
+    def fx(self):
+        """foreign exchange"""
+        from .fx import AsyncFx
+        return AsyncFx(self.__request__)
+
+    def identity(self):
+        """Identity"""
+        from .identity import AsyncIdentity
+        return AsyncIdentity(self.__request__)
+
+    def institution(self):
+        "institutions"
+        from .institution import AsyncInstitution
+        return AsyncInstitution(self.__request__)
+
+    def misc(self):
+        from .misc import AsyncMisc
+        return AsyncMisc(self.__request__)
+
+    def transactions(self):
+        from .transactions import AsyncTransactions
+        return AsyncTransactions(self.__request__)
+
+    def transfer(self):
+        from .transfer import AsyncTransfers
+        return AsyncTransfers(self.__request__)
+
+    def wallet(self):
+        from .wallets import AsyncWallets
+        return AsyncWallets(self.__request__)
@@ -0,0 +1,115 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from typing import Dict, Optional
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException
+from ..models import Quote, Transaction
+
+class AsyncFx:
+    def __init__(self, request):
+        self.request = request
+
+    async def generate_quote(self, payload: Dict[str, str]):
+        """
+        Generate a currency exchange quote.
+
+        :param payload: Quote payload containing source currency, target currency, and amount.
+        :return: ApiResponse whose ``data`` is a Quote.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> fx = auth.fx()
+        >>> result = await fx.generate_quote(payload)
+        """
+        try:
+            endpoint = "/fx/quote"
+            response = await self.request("POST", endpoint, json=payload)
+
+            return response.typed(Quote)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def exchange_currency(self, quote_reference: str, idempotency_key: Optional[str] = None):
+        """
+        Exchange currency based on a quote reference.
+
+        :param quote_reference: Reference ID of the quote.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> fx = auth.fx()
+        >>> result = await fx.exchange_currency(quote_reference)
+        """
+        try:
+            endpoint = "/fx"
+            payload = {"quote_reference": quote_reference}
+            response = await self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_fx_history(self):
+        """
+        Get FX history.
+
+        :return: ApiResponse whose ``data`` is a list of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> fx = auth.fx()
+        >>> result = await fx.get_fx_history()
+
+        """
+        try:
+            endpoint = "/fx"
+            response = await self.request("GET", endpoint)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -0,0 +1,102 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from typing import Dict
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException
+from ..models import Institution, ResolvedAccount
+
+
+class AsyncInstitution:
+    def __init__(self, request):
+        self.request = request
+
+    async def get_all_institutions(self, params: Dict[str, str], refresh: bool = False):
+        """
+        Get all institutions.
+
+        :param params: Query parameters to filter the institutions.
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse whose ``data`` is a list of Institution.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> institution = auth.institution()
+        >>> params = {
+                "page": "1",
+                "pageSize": "10",
+                "type": "bank",
+                "country": "US"
+            }
+        >>> result = await institution.get_all_institutions(params)
+        """
+        try:
+            endpoint = "/institutions"
+            response = await self.request("GET", endpoint, params=params, cache="institutions", refresh=refresh)
+
+            return response.typed(Institution)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def resolve_institution(self, payload: Dict[str, str], refresh: bool = False):
+        """
+        Resolve institution using account number and bank code.
+
+        :param payload: Request payload containing account number and bank code.
+        :param refresh: bypass the resolution cache, when one is configured.
+        :return: ApiResponse whose ``data`` is a ResolvedAccount.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> institution = auth.institution()
+        >>> payload = {
+                "account_number": "1234567890",
+                "bank_code": "ABC123"
+            }
+        >>> result = await institution.resolve_institution(payload)
+        """
+        try:
+            endpoint = "/institutions/resolve"
+            response = await self.request(
+                "POST", endpoint, json=payload, cache="resolve", refresh=refresh
+            )
+
+            return response.typed(ResolvedAccount)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -0,0 +1,359 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from typing import Dict, Optional
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException
+from ..models import Card, Transaction
+from ..pagination import aiter_items
+from enum import Enum
+
+class CardType(Enum):
+    PHYSICAL = "PHYSICAL"
+    VIRTUAL = "VIRTUAL"
+
+class AsyncIssuing:
+    def __init__(self, request):
+        self.request = request
+
+    async def create_card(self, payload: Dict[str, any]):
+        """
+        Create a card.
+
+        :param payload: Request payload for creating a card.
+        :return: ApiResponse whose ``data`` is a Card.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> payload = {
+                "customer_id": "123456789",
+                "type": "VIRTUAL",
+                "currency": "USD",
+                "auto_approve": True,
+                "brand": "VISA",
+                "amount": 1000,
+                "card_pin": 1234
+            }
+        >>> result = await issuing.create_card(payload)
+        """
+        try:
+            endpoint = "/issuing"
+            response = await self.request("POST", endpoint, json=payload)
+
+            return response.typed(Card)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def create_business_card(self, payload: Dict[str, any]):
+        """
+        Create a business card.
+
+        :param payload: Request payload for creating a business card.
+        :return: ApiResponse whose ``data`` is a Card.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> payload = {
+                "customer_id": "123456789",
+                "type": CardType.PHYSICAL.value,
+                "currency": "USD",
+                "auto_approve": True,
+                "brand": "MASTERCARD",
+                "amount": 2000,
+                "card_pin": 5678,
+                "name": "Business Card"
+            }
+        >>> result = await issuing.create_business_card(payload)
+        """
+        try:
+            endpoint = "/issuing/business"
+            response = await self.request("POST", endpoint, json=payload)
+
+            return response.typed(Card)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def set_card_pin(self, cardID: str, pin: str):
+        """
+        Set the PIN for a card.
+
+        :param cardID: ID of the card.
+        :param pin: PIN to set for the card.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> pin = "4321"
+        >>> result = await issuing.set_card_pin(cardID, pin)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}/set-pin"
+            payload = {
+                "card_pin": pin
+            }
+            response = await self.request("PATCH", endpoint, json=payload)
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_card(self, cardID: str):
+        """
+        Get a card by ID.
+
+        :param cardID: ID of the card.
+        :return: ApiResponse whose ``data`` is a Card.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> result = await issuing.get_card(cardID)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}"
+            response = await self.request("GET", endpoint)
+
+            return response.typed(Card)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_all_cards(self, params: Optional[Dict[str, str]] = None):
+        """
+        Get all cards.
+
+        :param params: optional paging keys, ``page`` and ``page_size``.
+        :return: ApiResponse whose ``data`` is a list of Card.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> result = await issuing.get_all_cards()
+        """
+        try:
+            endpoint = "/issuing"
+            response = await self.request("GET", endpoint, params=params, conditional=True)
+
+            return response.typed(Card)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_card_transactions(self, cardID: str, params: Optional[Dict[str, str]]):
+        """
+        Get the transactions for a card.
+
+        :param cardID: ID of the card.
+        :param params: Query parameters for filtering the transactions.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> params = {
+                "page": "1",
+                "pageSize": "10",
+                "type": "purchase",
+                "status": "success"
+            }
+        >>> result = await issuing.get_card_transactions(cardID, params)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}/transactions"
+            response = await self.request("GET", endpoint, params=params)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    def iter_card_transactions(
+        self,
+        cardID: str,
+        params: Optional[Dict[str, str]] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ):
+        """
+        Iterate over every transaction of a card, walking the pages of ``get_card_transactions``.
+
+        :param cardID: ID of the card.
+        :param params: extra filters such as ``type`` or ``status``; paging keys are managed here.
+        :param page_size: transactions fetched per request.
+        :param prefetch: request the next page while the current one is consumed.
+        :param concurrency: once the first page reports the total, fetch up to this many
+            pages in parallel. Transactions are still yielded in order.
+        :return: async generator of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> async for transaction in issuing.iter_card_transactions(cardID, {"status": "SUCCESS"}, concurrency=8):
+        ...     print(transaction.amount)
+        """
+        def fetch(page):
+            query = dict(params or {}, page=str(page), pageSize=str(page_size))
+            return self.get_card_transactions(cardID, query)
+
+        return aiter_items(fetch, page_size, prefetch=prefetch, concurrency=concurrency)
+
+    async def fund_card(self, cardID: str, amount: int, idempotency_key: Optional[str] = None):
+        """
+        Fund a card.
+
+        :param cardID: ID of the card.
+        :param amount: Amount to fund the card.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> amount = 1000
+        >>> result = await issuing.fund_card(cardID, amount)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}/fund"
+            payload = {
+                "amount": amount
+            }
+            response = await self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def withdraw_from_card(self, cardID: str, amount: int, idempotency_key: Optional[str] = None):
+        """
+        Withdraw funds from a card.
+
+        :param cardID: ID of the card.
+        :param amount: Amount to withdraw from the card.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> amount = 500
+        >>> result = await issuing.withdraw_from_card(cardID, amount)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}/withdraw"
+            payload = {
+                "amount": amount
+            }
+            response = await self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def freeze_card(self, cardID: str):
+        """
+        Freeze a card.
+
+        :param cardID: ID of the card.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> result = await issuing.freeze_card(cardID)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}/freeze"
+            response = await self.request("PATCH", endpoint)
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def unfreeze_card(self, cardID: str):
+        """
+        Unfreeze a card.
+
+        :param cardID: ID of the card.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> cardID = "123456789"
+        >>> result = await issuing.unfreeze_card(cardID)
+        """
+        try:
+            endpoint = f"/issuing/{cardID}/unfreeze"
+            response = await self.request("PATCH", endpoint)
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -0,0 +1,113 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException
+
+
+class AsyncMisc:
+    def __init__(self, request) -> None:
+        self.request = request
+
+
+    async def get_currencies(self, refresh: bool = False):
+        """
+        Get all currencies.
+
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> misc = auth.misc()
+        >>> result = await misc.get_currencies()
+        """
+        try:
+            endpoint = "/currencies"
+            response = await self.request("GET", endpoint, cache="currencies", refresh=refresh)
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_countries(self, refresh: bool = False):
+        """
+        Get all countries.
+
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> misc = auth.misc()
+        >>> result = await misc.get_countries()
+        """
+        try:
+            endpoint = "/countries"
+            response = await self.request("GET", endpoint, cache="countries", refresh=refresh)
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def credit_test_wallet(self, payload: dict):
+        """
+        Credit the test wallet.
+
+        :param payload: Payload for crediting the test wallet.
+        :return: ApiResponse from the API.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> misc = auth.misc()
+        >>> payload = {
+                "amount": "100",
+                "currency": "USD"
+            }
+        >>> result = await misc.credit_test_wallet(payload)
+        """
+        try:
+            endpoint = "/test/wallet/credit"
+            response = await self.request("GET", endpoint, json=payload)
+
+            return response
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
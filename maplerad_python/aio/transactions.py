@@ -0,0 +1,111 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from typing import Dict, Optional
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException
+from ..models import Transaction
+
+
+class AsyncTransactions:
+    def __init__(self, request):
+        self.request = request
+
+
+    async def get_all_transactions(self, params: Optional[Dict[str, str]] = None):
+        """
+        Get all transactions.
+
+        :param params: Query parameters such as ``page`` and ``page_size`` (optional).
+        :return: ApiResponse whose ``data`` is a list of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transactions = auth.transactions()
+        >>> result = await transactions.get_all_transactions()
+        """
+        try:
+            endpoint = "/transactions"
+            response = await self.request("GET", endpoint, params=params)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_transaction(self, transaction_id: str):
+        """
+        Get a specific transaction.
+
+        :param transaction_id: The ID or reference of the transaction.
+        :return: ApiResponse whose ``data`` is a Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transactions = auth.transactions()
+        >>> result = await transactions.get_transaction("transaction_id")
+        """
+        try:
+            endpoint = f"/transactions/{transaction_id}"
+            response = await self.request("GET", endpoint)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def verify_collection_transaction(self, transaction_id: str):
+        """
+        Verify a collection transaction.
+
+        :param transaction_id: The ID or reference of the transaction.
+        :return: ApiResponse whose ``data`` is a Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transactions = auth.transactions()
+        >>> result = await transactions.verify_collection_transaction("transaction_id")
+        """
+        try:
+            endpoint = f"/transactions/verify/{transaction_id}"
+            response = await self.request("GET", endpoint)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -0,0 +1,175 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from typing import Optional, Dict
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException, ValidationError
+from ..models import Transfer
+
+
+
+class AsyncTransfers:
+    def __init__(self, request) -> None:
+        self.request = request
+
+    async def naira_transfer(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
+        """
+        Initiate a Naira transfer.
+
+        :param payload: Transfer payload.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transfer.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transfers = auth.transfer()
+        >>> result = await transfers.naira_transfer(payload)
+        """
+        try:
+            endpoint = "/transfers"
+            response = await self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transfers/", idempotency_key=idempotency_key,
+            )
+
+            return response.typed(Transfer)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def dom_transfer(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
+        """
+        Initiate a DOM transfer.
+
+        :param payload: Transfer payload.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transfer.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transfers = auth.transfer()
+        >>> result = await transfers.dom_transfer(payload)
+        """
+        if payload["meta"]["scheme"] != "DOM":
+            raise ValidationError("Invalid Scheme type for this method")
+
+        try:
+            endpoint = "/transfers"
+            response = await self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transfers/", idempotency_key=idempotency_key,
+            )
+
+            return response.typed(Transfer)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def cash_pickup_transfer(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
+        """
+        Initiate a Cash Pickup transfer.
+
+        :param payload: Transfer payload.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transfer.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transfers = auth.transfer()
+        >>> result = await transfers.cash_pickup_transfer(payload)
+        """
+        if payload["meta"]["scheme"] != "CASHPICKUP":
+            raise ValidationError("Invalid Scheme type for this method")
+
+        try:
+            endpoint = "/transfers"
+            response = await self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transfers/", idempotency_key=idempotency_key,
+            )
+
+            return response.typed(Transfer)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_transfer(self, transfer_id: str):
+        """
+        Get details of a specific transfer.
+
+        :param transfer_id: The ID of the transfer.
+        :return: ApiResponse whose ``data`` is a Transfer.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transfers = auth.transfer()
+        >>> result = await transfers.get_transfer("transfer_id")
+        """
+        try:
+            endpoint = f"/transfers/{transfer_id}"
+            response = await self.request("GET", endpoint)
+
+            return response.typed(Transfer)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_all_transfers(self):
+        """
+        Get details of all transfers.
+
+        :return: ApiResponse whose ``data`` is a list of Transfer.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> transfers = auth.transfer()
+        >>> result = await transfers.get_all_transfers()
+        """
+        try:
+            endpoint = "/transfers"
+            response = await self.request("GET", endpoint)
+
+            return response.typed(Transfer)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
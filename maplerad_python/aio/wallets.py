@@ -0,0 +1,149 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from typing import Optional, Dict
+from httpx import TransportError
+from ..exceptions import APIConnectionError, PostException
+from ..models import Transaction, Wallet
+from ..pagination import aiter_items
+
+
+class AsyncWallets:
+    def __init__(self, request) -> None:
+        self.request = request
+
+
+    async def get_wallets(self):
+        """
+        Get all wallets.
+
+        :return: ApiResponse whose ``data`` is a list of Wallet.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> wallets = auth.wallet()
+        >>> result = await wallets.get_wallets()
+        """
+        try:
+            endpoint = "/wallets"
+            response = await self.request("GET", endpoint, conditional=True)
+
+            return response.typed(Wallet)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_wallets_history(self, params: Optional[Dict[str, str]] = None):
+        """
+        Get the history of all wallets.
+
+        :param params: Query parameters for filtering the history (optional).
+        :return: ApiResponse whose ``data`` is a list of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> wallets = auth.wallet()
+        >>> result = await wallets.get_wallets_history()
+        """
+        try:
+            endpoint = "/wallets/history"
+            response = await self.request("GET", endpoint, params=params)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    async def get_wallets_history_by_currency(
+        self, currency_code: str, params: Optional[Dict[str, str]] = None
+    ):
+        """
+        Get the history of wallets by currency.
+
+        :param currency_code: The currency code.
+        :param params: Query parameters for filtering the history (optional).
+        :return: ApiResponse whose ``data`` is a list of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> wallets = auth.wallet()
+        >>> result = await wallets.get_wallets_history_by_currency("USD")
+        """
+        try:
+            endpoint = f"/wallets/{currency_code}/history"
+            response = await self.request("GET", endpoint, params=params)
+
+            return response.typed(Transaction)
+
+        except (TransportError, APIConnectionError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    def iter_wallets_history(
+        self,
+        params: Optional[Dict[str, str]] = None,
+        currency_code: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ):
+        """
+        Iterate over the whole wallet history, walking the pages of ``get_wallets_history``
+        (or ``get_wallets_history_by_currency`` when ``currency_code`` is given).
+
+        :param params: extra filters; paging keys are managed here.
+        :param currency_code: restrict the history to one currency.
+        :param page_size: entries fetched per request.
+        :param prefetch: request the next page while the current one is consumed.
+        :param concurrency: once the first page reports the total, fetch up to this many
+            pages in parallel. Entries are still yielded in order.
+        :return: async generator of Transaction.
+
+        Usage:
+        >>> from maplerad_python.aio import AsyncAuthenticate
+        >>> auth = AsyncAuthenticate(secret_key,"DEVELOPMENT")
+        >>> wallets = auth.wallet()
+        >>> async for entry in wallets.iter_wallets_history(currency_code="NGN", concurrency=8):
+        ...     print(entry.amount)
+        """
+        def fetch(page):
+            query = dict(params or {}, page=page, page_size=page_size)
+            if currency_code:
+                return self.get_wallets_history_by_currency(currency_code, query)
+            return self.get_wallets_history(query)
+
+        return aiter_items(fetch, page_size, prefetch=prefetch, concurrency=concurrency)
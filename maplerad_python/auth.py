@@ -36,41 +36,154 @@
 
 
 
+import logging
 import os
-import requests
-from requests.adapters import HTTPAdapter
-from .customer import Customer
-from .issuing import Issuing
-from .bill import Bills
-from .collections import Collections
-from .counterparty import Counterparty
-from .fx import Fx
-from .identity import Identity
-from .institution import Institution
-from .issuing import Issuing
-from .transactions import Transactions
-from .misc import Misc
-from .transfer import Transfers
-from .wallets import Wallets
+import threading
+import time
+import weakref
+from .cache import DEFAULT_TTLS, NEGATIVE_STATUSES, NEGATIVE_TTLS, MemoryCache, cache_key, validators
+from .idempotency import MemoryIdempotencyStore, assign_reference
+from .models import ApiResponse
+from .retry import RetryPolicy, build_policies
+from .serializers import get_serializer
+from .singleflight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
 
 
 class Authenticate:
     
-    def __init__(self,secret_key,environment):
+    def __init__(
+        self,
+        secret_key,
+        environment,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        thread_local_sessions: bool = False,
+        retry_policy: RetryPolicy = None,
+        method_retry_policies: dict = None,
+        rate_limiter=None,
+        circuit_breakers=None,
+        serializer="auto",
+        idempotency_store=None,
+        cache=None,
+        cache_ttls: dict = None,
+        resolve_cache=None,
+        negative_ttls: dict = None,
+        coalesce_gets: bool = True,
+        conditional=None,
+        base_url: str = None,
+    ):
         """
             :param environment -> PRODUCTION || DEVELOPMENT  
+            :param pool_connections -> number of per-host connection pools to keep
+            :param pool_maxsize -> maximum connections kept open per host
+            :param pool_block -> wait for a free connection when a host pool is exhausted
+                instead of opening a throwaway one (avoids "connection pool is full" churn)
+            :param keep_alive -> reuse connections between requests
+            :param thread_local_sessions -> give every thread its own session and pool
+            :param retry_policy -> RetryPolicy for idempotent methods (GET, HEAD, OPTIONS),
+                defaults to ``RetryPolicy()``
+            :param method_retry_policies -> {method: RetryPolicy} overrides, e.g. to retry PATCH
+            :param rate_limiter -> optional ``ratelimit.RateLimiter`` consulted before every attempt
+            :param circuit_breakers -> optional ``circuit.CircuitBreakers``; requests to an endpoint
+                whose circuit is open fail fast with ``CircuitOpenError``
+            :param serializer -> JSON backend for payloads and responses: "auto" (fastest
+                installed), "json", "orjson", "msgspec" or a custom object, see ``serializers``
+            :param idempotency_store -> where idempotency keys and their references are kept,
+                ``idempotency.MemoryIdempotencyStore()`` by default; use
+                ``idempotency.SQLiteIdempotencyStore`` to survive restarts
+            :param cache -> cache for reference data (currencies, countries, institutions,
+                billers): a ``cache.MemoryCache()`` by default, a ``cache.TieredCache`` of
+                memory and ``cache.DiskCache`` to survive restarts, or False to disable
+            :param cache_ttls -> {family: seconds} overrides of ``cache.DEFAULT_TTLS``
+            :param resolve_cache -> opt-in cache for ``Institution.resolve_institution``, e.g.
+                ``cache.MemoryCache(max_entries=5000)``; kept apart from ``cache`` so account
+                lookups never evict reference data. Resolved accounts live ``cache_ttls["resolve"]``
+            :param negative_ttls -> {family: seconds} overrides of ``cache.NEGATIVE_TTLS``, how long
+                "not found" answers (400, 404, 422) are cached
+            :param coalesce_gets -> identical GETs issued while one is in flight wait for it
+                and get a copy of its response instead of making their own call
+            :param conditional -> optional ``cache.ConditionalCache``; polled list endpoints
+                (wallets, cards, counterparties) are then revalidated with ETag /
+                If-Modified-Since and a 304 is served from its store
+            :param base_url -> API root used instead of the one of ``environment``, e.g. the
+                url of a local ``fake.FakeMaplerad`` server for load tests
+
+        Retries: 429 and 5xx responses and network errors are retried with exponential
+        backoff, jitter and ``Retry-After`` support, for idempotent methods only.
+        Other methods are retried only when the connection could not be opened,
+        since the request never reached Maplerad.
+
+        Money-moving calls (transfers, card funding and withdrawal, exchange, airtime)
+        always carry a ``reference``, so they are retried too: after a timeout or a 5xx
+        the operation is first looked up by reference and only resent when Maplerad
+        does not know it. Pass the same ``idempotency_key`` when repeating a logical
+        operation and it is sent with the reference it was first given.
+
+        Thread safety: by default one ``requests.Session`` is shared by every thread.
+        Its urllib3 pool is lock protected, so this is safe for API calls; combine it
+        with ``pool_block=True`` to cap the total connections at ``pool_maxsize``.
+        Set ``thread_local_sessions=True`` for fully isolated sessions per thread,
+        in which case each thread gets its own pool of ``pool_maxsize`` connections.
         """
         self.secret_key = secret_key
-        self.session = self.__request_adapter__()
         self.environment = environment
+        if base_url is None:
+            base_url = (
+                "https://api.maplerad.com/v1" if environment == "PRODUCTION"
+                else "https://sandbox.api.maplerad.com/v1"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.thread_local_sessions = thread_local_sessions
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_policies = build_policies(self.retry_policy, method_retry_policies)
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
+        self.serializer = get_serializer(serializer)
+        self.idempotency_store = (
+            idempotency_store if idempotency_store is not None else MemoryIdempotencyStore()
+        )
+        self.cache = MemoryCache() if cache is None else (None if cache is False else cache)
+        self.cache_ttls = dict(DEFAULT_TTLS, **(cache_ttls or {}))
+        self.negative_ttls = dict(NEGATIVE_TTLS, **(negative_ttls or {}))
+        self.caches = {"resolve": resolve_cache}
+        self.conditional = conditional
+        self.single_flight = SingleFlight(share=ApiResponse.copy) if coalesce_gets else None
+        self._sessions = weakref.WeakSet()
+        self._local = threading.local()
+        self._session = None if thread_local_sessions else self.__request_adapter__()
 
+    @property
+    def session(self):
+        """the session used by the calling thread"""
+        if not self.thread_local_sessions:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.__request_adapter__()
+        return session
 
     def __request_adapter__(self):
         """
         default requests adapter
         """
+        import requests
+        from requests.adapters import HTTPAdapter
+
         session = requests.Session()
-        adapter = HTTPAdapter(max_retries=3)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
         for scheme in ["https://","http://"]:
             session.mount(scheme,adapter)
         session.headers.update({
@@ -78,74 +191,241 @@ class Authenticate:
             "content-type": "application/json",
             "Authorization": f"Bearer {self.secret_key}"
         })
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        self._sessions.add(session)
         return session
+
+    def pool_stats(self):
+        """
+        Snapshot of the connection pools, useful for sizing ``pool_maxsize``.
+
+        :return: dict with the number of live sessions and one entry per host pool.
+
+        Usage::
+            >>> auth.pool_stats()
+            {'sessions': 1, 'pools': [{'scheme': 'https', 'host': 'sandbox.api.maplerad.com',
+              'port': 443, 'maxsize': 10, 'idle': 2, 'connections_opened': 2, 'requests': 40}]}
+        """
+        pools = []
+        sessions = list(self._sessions)
+        for session in sessions:
+            adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+            for adapter in adapters.values():
+                manager = getattr(adapter, "poolmanager", None)
+                if manager is None:
+                    continue
+                for key in list(manager.pools.keys()):
+                    pool = manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    pools.append({
+                        "scheme": pool.scheme,
+                        "host": pool.host,
+                        "port": pool.port,
+                        "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+                        "idle": pool.pool.qsize() if pool.pool is not None else 0,
+                        "connections_opened": pool.num_connections,
+                        "requests": pool.num_requests,
+                    })
+        return {"sessions": len(sessions), "pools": pools}
+
+    def close(self):
+        """close every session and its pooled connections"""
+        for session in list(self._sessions):
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
     
-    def __request__(self, method, path, **kwargs):
-        if self.environment == "PRODUCTION":
-            url = "https://api.maplerad.com/v1" + path
+    def __cached__(self, cache, family, key, method, path, refresh=False, **kwargs):
+        """serve a request from ``cache`` for ``cache_ttls[family]`` (``negative_ttls`` when not found)"""
+        if not refresh:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[0]
+        response = self.__request__(method, path, **kwargs)
+        if response.ok:
+            ttl = self.cache_ttls[family]
+        elif response.status_code in NEGATIVE_STATUSES and family in self.negative_ttls:
+            ttl = self.negative_ttls[family]
         else:
-            url = "https://sandbox.api.maplerad.com/v1" + path
+            return response
+        cache.set(key, response, time.time() + ttl)
+        return response
+
+    def __request__(self, method, path, **kwargs):
+        url = self.base_url + path
 
-        response = self.session.request(method, url=url, **kwargs)
-        print("Request URL:", response.url)  # Print the complete URL
+        family = kwargs.pop("cache", None)
+        cache = self.caches.get(family, self.cache) if family is not None else None
+        if cache is not None:
+            key = cache_key(url, kwargs.get("params"), kwargs.get("json"))
+            return self.__cached__(cache, family, key, method, path, **kwargs)
+        kwargs.pop("refresh", None)
 
-        return response
+        send = self.__send__
+        if kwargs.pop("conditional", False) and self.conditional is not None:
+            send = self.__conditional__
+        # a GET carrying a body (credit_test_wallet) changes state, never share it
+        if self.single_flight is not None and method.upper() == "GET" and kwargs.get("json") is None:
+            key = cache_key(url, kwargs.get("params"))
+            return self.single_flight.do(key, lambda: send(method, path, url, **kwargs))
+        return send(method, path, url, **kwargs)
+
+    def __conditional__(self, method, path, url, **kwargs):
+        """send with the validators of the last response for ``url`` and reuse it on 304"""
+        key = cache_key(url, kwargs.get("params"))
+        cached = self.conditional.get(key)
+        if cached is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **validators(cached))
+        response = self.__send__(method, path, url, **kwargs)
+        return self.conditional.update(key, cached, response)
+
+    def __send__(self, method, path, url, **kwargs):
+        from requests.exceptions import ConnectionError, Timeout
+
+        policy = self.retry_policies.get(method.upper())
+        lookup = kwargs.pop("lookup", None)
+        reference, in_doubt = None, False
+        if lookup is not None:
+            reference, in_doubt = assign_reference(self.idempotency_store, kwargs)
+            policy = policy or self.retry_policy
+
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.serializer.dumps(kwargs.pop("json"))
+
+        breaker = self.circuit_breakers.for_path(path) if self.circuit_breakers else None
+        start = time.monotonic()
+        attempt = 0
+        last = None
+        while True:
+            attempt += 1
+            if in_doubt:
+                landed = self.__request__("GET", lookup + reference)
+                if landed.ok:
+                    return landed
+                if landed.status_code != 404:
+                    if isinstance(last, Exception):
+                        raise last
+                    return last if last is not None else landed
+                in_doubt = False
+            probe = breaker.before_call() if breaker is not None else False
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(path)
+                response = self.session.request(method, url=url, **kwargs)
+            except (ConnectionError, Timeout) as error:
+                if breaker is not None:
+                    breaker.record_failure()
+                active = policy
+                if active is None and _never_sent(error):
+                    active = self.retry_policy
+                delay = active.next_delay(attempt, time.monotonic() - start) if active else None
+                if delay is None:
+                    raise
+                in_doubt = reference is not None and not _never_sent(error)
+                last = error
+                logger.debug("%s %s failed (%s), retrying in %.2fs", method, url, error, delay)
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if probe:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                if self.circuit_breakers.is_failure(response.status_code):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+            if policy is not None and policy.retries_status(response.status_code):
+                delay = policy.next_delay(attempt, time.monotonic() - start, response.headers)
+                if delay is not None:
+                    logger.debug(
+                        "%s %s returned %s, retrying in %.2fs",
+                        method, response.url, response.status_code, delay,
+                    )
+                    if reference is not None and response.status_code >= 500:
+                        in_doubt = True
+                        last = ApiResponse.from_response(response, loads=self.serializer.loads)
+                    response.close()
+                    time.sleep(delay)
+                    continue
+
+            logger.debug("Request URL: %s", response.url)
+            return ApiResponse.from_response(response, loads=self.serializer.loads)
 
     
     def customer(self):
         """
         customer related
         """
+        from .customer import Customer
         return Customer(self.__request__)
     
     def issuing(self):
         """issuing related"""
+        from .issuing import Issuing
         return Issuing(self.__request__)
     
-    
-    
     def bills(self):
         """for bills"""
+        from .bill import Bills
         return Bills(self.__request__)
-        
 
     def collections(self):
         """for collections"""
+        from .collections import Collections
         return Collections(self.__request__)
     
     def counterparty(self):
         """country party"""
+        from .counterparty import Counterparty
         return Counterparty(self.__request__)
     
     def fx(self):
         """foreign exchange"""
+        from .fx import Fx
         return Fx(self.__request__)
 
-
     def identity(self):
         """Identity"""
+        from .identity import Identity
         return Identity(self.__request__)
     
     def institution(self):
         "institutions"
+        from .institution import Institution
         return Institution(self.__request__)
     
-    def issuing(self):
-        return Issuing(self.__request__)
-    
     def misc(self):
+        from .misc import Misc
         return Misc(self.__request__)
     
     def transactions(self):
+        from .transactions import Transactions
         return Transactions(self.__request__)
     
     def transfer(self):
+        from .transfer import Transfers
         return Transfers(self.__request__)
     
     def wallet(self):
+        from .wallets import Wallets
         return Wallets(self.__request__)
 
 
+def _never_sent(error):
+    """True when the connection failed before the request reached the server"""
+    from requests.exceptions import ConnectTimeout
+    from urllib3.exceptions import NewConnectionError
 
-
-
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
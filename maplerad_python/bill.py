@@ -34,18 +34,23 @@
 """
 
 
-from typing import Dict
+from typing import Dict, Optional
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import Transaction
 
 class Bills:
     def __init__(self, request):
         self.request = request
 
-    def buy_airtime(self, payload: Dict[str, str]):
+    def buy_airtime(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
         """
         Buy airtime.
 
         :param payload: Request payload as described in the documentation.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -61,22 +66,23 @@ class Bills:
         """
         try:
             endpoint = "/bills/airtime"
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response.json()
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def get_airtime_billers(self, country: str):
+    def get_airtime_billers(self, country: str, refresh: bool = False):
         """
         Get airtime billers.
 
         :param country: Country for which to get the billers.
-        :return: Response object from the API.
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -86,21 +92,18 @@ class Bills:
         """
         try:
             endpoint = f"/bills/airtime/billers/{country}"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, cache="billers", refresh=refresh)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_airtime_history(self):
         """
         Get airtime history.
 
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -112,10 +115,7 @@ class Bills:
             endpoint = "/bills/airtime"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
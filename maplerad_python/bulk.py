@@ -0,0 +1,169 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Iterable, Optional
+
+from requests.exceptions import RequestException
+
+from .exceptions import PostException
+from .retry import RetryPolicy
+
+
+SUCCESS = "success"
+API_ERROR = "api_error"
+TRANSPORT_ERROR = "transport_error"
+SKIPPED = "skipped"
+
+
+class BulkResult:
+    """
+    Outcome of one item of a bulk operation.
+
+    :ivar outcome: ``"success"``, ``"api_error"`` (the API answered with an error status),
+        ``"transport_error"`` (the request failed or its outcome is unknown) or
+        ``"skipped"`` (nothing was sent, e.g. already done in a previous run).
+    :ivar response: the ``ApiResponse``, when the API answered.
+    :ivar error: the exception, for transport errors.
+    """
+
+    __slots__ = ("index", "item", "outcome", "response", "error")
+
+    def __init__(self, index, item, outcome, response=None, error=None):
+        self.index = index
+        self.item = item
+        self.outcome = outcome
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.outcome == SUCCESS
+
+    def __repr__(self):
+        status = self.response.status_code if self.response is not None else self.error
+        return f"<BulkResult #{self.index} {self.outcome} {status}>"
+
+
+class BulkReport(list):
+    """Results of a bulk operation in input order, with per-outcome helpers."""
+
+    def succeeded(self):
+        return [result for result in self if result.outcome == SUCCESS]
+
+    def failed(self):
+        return [result for result in self if result.outcome in (API_ERROR, TRANSPORT_ERROR)]
+
+    def counts(self):
+        counts = {SUCCESS: 0, API_ERROR: 0, TRANSPORT_ERROR: 0}
+        for result in self:
+            counts[result.outcome] = counts.get(result.outcome, 0) + 1
+        return counts
+
+
+def run_bulk(
+    call: Callable,
+    items: Iterable,
+    max_workers: int = 8,
+    progress: Optional[Callable] = None,
+    throttle_policy: Optional[RetryPolicy] = None,
+) -> BulkReport:
+    """
+    Run ``call(item)`` for every item with at most ``max_workers`` calls in flight.
+
+    Failures never abort the run: each item gets a :class:`BulkResult`. Items
+    answered with ``429`` were rejected before being processed, so they are
+    retried after the server's ``Retry-After`` (or ``throttle_policy``'s backoff).
+
+    :param call: function returning an ``ApiResponse``, or a ready :class:`BulkResult`
+        when it decides the outcome itself.
+    :param items: any iterable, consumed lazily.
+    :param progress: ``progress(done, total, result)`` called after every item;
+        ``total`` is ``None`` when ``items`` has no length.
+    :param throttle_policy: backoff used for ``429`` answers, defaults to ``RetryPolicy()``.
+    """
+    throttle_policy = throttle_policy or RetryPolicy()
+    total = len(items) if hasattr(items, "__len__") else None
+    results = {}
+    done = 0
+    lock = threading.Lock()
+
+    def run(index, item):
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = call(item)
+            except (PostException, RequestException) as error:
+                return BulkResult(index, item, TRANSPORT_ERROR, error=error)
+            except Exception as error:
+                # a malformed item or an undecodable answer fails this item, not the batch
+                return BulkResult(index, item, API_ERROR, error=error)
+            if isinstance(response, BulkResult):
+                response.index = index
+                return response
+            if response.status_code == 429:
+                delay = throttle_policy.next_delay(attempt, time.monotonic() - start, response.headers)
+                if delay is not None:
+                    time.sleep(delay)
+                    continue
+            outcome = SUCCESS if response.ok else API_ERROR
+            return BulkResult(index, item, outcome, response=response)
+
+    def collect(future):
+        nonlocal done
+        result = future.result()
+        with lock:
+            results[result.index] = result
+            done += 1
+            finished = done
+        if progress is not None:
+            progress(finished, total, result)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="maplerad-bulk") as executor:
+        in_flight = set()
+        for index, item in enumerate(items):
+            in_flight.add(executor.submit(run, index, item))
+            if len(in_flight) >= max_workers * 2:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    collect(future)
+        for future in as_completed(in_flight):
+            collect(future)
+
+    return BulkReport(results[index] for index in sorted(results))
@@ -0,0 +1,296 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+
+from .models import ApiResponse
+
+
+#: seconds each family of reference data is cached for, see ``Authenticate(cache_ttls=...)``
+DEFAULT_TTLS = {
+    "currencies": 24 * 3600,
+    "countries": 24 * 3600,
+    "institutions": 6 * 3600,
+    "billers": 3600,
+    "resolve": 600,
+}
+
+#: seconds "not found" answers are cached for, per family
+NEGATIVE_TTLS = {
+    "resolve": 60,
+}
+
+#: statuses cached with the family's negative TTL
+NEGATIVE_STATUSES = (400, 404, 422)
+
+
+def cache_key(url: str, params=None, payload=None) -> str:
+    if params:
+        items = params.items() if hasattr(params, "items") else params
+        url += "?" + urlencode(sorted(items))
+    if payload is not None:
+        url += "#" + json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return url
+
+
+class MemoryCache:
+    """
+    LRU cache of responses held in process memory.
+
+    Hits return the cached ``ApiResponse`` itself, already decoded, so treat it as read-only.
+
+    :param max_entries: responses kept; the least recently used are evicted beyond it.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[ApiResponse, float]]:
+        """:return: ``(response, expires)`` or ``None`` when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, response: ApiResponse, expires: float):
+        with self._lock:
+            self._entries[key] = (response, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache:
+    """
+    Responses stored in a SQLite file, so they survive restarts and are shared by
+    every process using the same path. Put a :class:`MemoryCache` in front of it
+    with :class:`TieredCache` to serve hits from memory.
+
+    :param path: database file, created when missing.
+    :param max_entries: responses kept; the least recently used are evicted beyond it.
+    :param loads: JSON decoder for responses read back, ``json.loads`` by default.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, loads=None, timeout: float = 10.0):
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.loads = loads
+        import sqlite3
+
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "status INTEGER NOT NULL, content BLOB NOT NULL, headers TEXT, url TEXT, "
+                "expires REAL NOT NULL, used REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[ApiResponse, float]]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, content, headers, url, expires FROM responses "
+                "WHERE key = ? AND expires > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+        status, content, headers, url, expires = row
+        headers = json.loads(headers) if headers else {}
+        return ApiResponse(status, bytes(content), headers, url, loads=self.loads), expires
+
+    def set(self, key: str, response: ApiResponse, expires: float):
+        with self._lock:
+            db = self._connection
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, status, content, headers, url, expires, used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key, response.status_code, response.content,
+                        json.dumps({name.lower(): value for name, value in response.headers.items()}),
+                        response.url, expires, time.time(),
+                    ),
+                )
+                db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY expires > ? DESC, used DESC LIMIT -1 OFFSET ?)",
+                    (time.time(), self.max_entries),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+
+class TieredCache:
+    """
+    A fast cache in front of a persistent one: reads try ``front`` first and
+    promote hits from ``back``, writes go to both.
+
+    Usage:
+    >>> from maplerad_python.cache import DiskCache, MemoryCache, TieredCache
+    >>> cache = TieredCache(MemoryCache(), DiskCache("maplerad-cache.db"))
+    >>> auth = Authenticate(secret_key,"PRODUCTION", cache=cache)
+    """
+
+    def __init__(self, front, back):
+        self.front = front
+        self.back = back
+
+    def get(self, key: str):
+        entry = self.front.get(key)
+        if entry is None:
+            entry = self.back.get(key)
+            if entry is not None:
+                self.front.set(key, *entry)
+        return entry
+
+    def set(self, key: str, response: ApiResponse, expires: float):
+        self.front.set(key, response, expires)
+        self.back.set(key, response, expires)
+
+    def delete(self, key: str):
+        self.front.delete(key)
+        self.back.delete(key)
+
+    def clear(self):
+        self.front.clear()
+        self.back.clear()
+
+    def __len__(self):
+        return len(self.back)
+
+
+def validators(response) -> dict:
+    """conditional request headers revalidating ``response``"""
+    headers = {}
+    etag = response.headers.get("ETag") or response.headers.get("etag")
+    if etag:
+        headers["If-None-Match"] = etag
+    modified = response.headers.get("Last-Modified") or response.headers.get("last-modified")
+    if modified:
+        headers["If-Modified-Since"] = modified
+    return headers
+
+
+class ConditionalCache:
+    """
+    Revalidates polled list endpoints instead of downloading them again.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` are kept in ``store``; the next
+    request for the same URL sends ``If-None-Match`` / ``If-Modified-Since`` and a
+    ``304 Not Modified`` is answered with the stored, already parsed response.
+
+    :param store: any cache of this module (``MemoryCache``, ``DiskCache``, ``TieredCache``).
+    :ivar hits: requests answered with ``304`` and served from the store.
+    :ivar misses: requests that downloaded a body.
+
+    Usage:
+    >>> from maplerad_python.cache import ConditionalCache
+    >>> auth = Authenticate(secret_key,"PRODUCTION", conditional=ConditionalCache())
+    >>> auth.wallet().get_wallets()
+    >>> auth.conditional.stats()
+    {'hits': 0, 'misses': 1, 'entries': 1}
+    """
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else MemoryCache(max_entries=256)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ApiResponse]:
+        entry = self.store.get(key)
+        return entry[0] if entry is not None else None
+
+    def update(self, key: str, cached: Optional[ApiResponse], response: ApiResponse) -> ApiResponse:
+        """:return: the response to hand back for ``response``, the cached one on ``304``"""
+        if response.status_code == 304 and cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached
+        with self._lock:
+            self.misses += 1
+        if response.ok and validators(response):
+            self.store.set(key, response, float("inf"))
+        return response
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.store)}
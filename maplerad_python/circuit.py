@@ -0,0 +1,201 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import threading
+import time
+from typing import Iterable
+
+from .exceptions import CircuitOpenError
+
+
+# Path segments used by the API that are not identifiers. Anything else after the
+# first segment (card ids, customer ids, currency codes...) collapses into ``{id}``.
+STATIC_SEGMENTS = frozenset([
+    "active", "airtime", "billers", "blacklist", "business", "card-enroll", "cards",
+    "credit", "enroll", "freeze", "fund", "history", "quote", "resolve", "set-pin",
+    "tier1", "tier2", "transactions", "unfreeze", "update", "upgrade", "verify",
+    "virtual-account", "wallet", "withdraw",
+])
+
+
+def path_template(path: str, static_segments: Iterable[str] = STATIC_SEGMENTS) -> str:
+    """
+    Collapse identifiers out of a request path.
+
+    Usage::
+        >>> path_template("/issuing/6f1c4a0e/fund?x=1")
+        '/issuing/{id}/fund'
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    template = segments[:1] + [
+        segment if segment in static_segments else "{id}" for segment in segments[1:]
+    ]
+    return "/" + "/".join(template)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint.
+
+    ``closed``: calls go through and consecutive failures are counted.
+    ``open``: calls fail fast with ``CircuitOpenError`` until ``recovery_timeout`` has passed.
+    ``half_open``: up to ``half_open_max_calls`` probe calls are let through; a success
+    closes the circuit, a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """
+        Raise ``CircuitOpenError`` unless the call may go through.
+
+        :return: whether the call is a half open probe, to be given back with
+            :meth:`release` if it ends without an outcome.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"circuit for {self.name} is open, retry in {remaining:.1f}s"
+                    )
+                self.state = self.HALF_OPEN
+                self._probes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(f"circuit for {self.name} is half open, probe in flight")
+                self._probes += 1
+                return True
+            return False
+
+    def release(self):
+        """free a probe slot taken by a call that was cancelled or failed before getting an answer"""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probes = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._probes = 0
+
+
+class CircuitBreakers:
+    """
+    Registry of circuit breakers keyed by path template, so a sick ``/issuing/{id}/fund``
+    fails fast without affecting ``/customers``.
+
+    :param failure_threshold: consecutive failures that open a circuit.
+    :param recovery_timeout: seconds a circuit stays open before a probe is allowed.
+    :param half_open_max_calls: concurrent probes allowed while half open.
+    :param failure_statuses: response statuses counted as failures, on top of network errors.
+
+    Usage::
+        >>> from maplerad_python.auth import Authenticate
+        >>> from maplerad_python.circuit import CircuitBreakers
+        >>> auth = Authenticate(
+                secret_key,
+                "DEVELOPMENT",
+                circuit_breakers=CircuitBreakers(failure_threshold=5, recovery_timeout=30),
+            )
+        >>> auth.circuit_breakers.states()
+        {'/issuing/{id}/fund': 'open', '/customers': 'closed'}
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_statuses: Iterable[int] = (500, 502, 503, 504),
+        static_segments: Iterable[str] = STATIC_SEGMENTS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self.static_segments = frozenset(static_segments)
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def for_path(self, path: str) -> CircuitBreaker:
+        key = path_template(path, self.static_segments)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    key,
+                    CircuitBreaker(
+                        key,
+                        self.failure_threshold,
+                        self.recovery_timeout,
+                        self.half_open_max_calls,
+                    ),
+                )
+        return breaker
+
+    def is_failure(self, status_code: int) -> bool:
+        return status_code in self.failure_statuses
+
+    def states(self):
+        return {key: breaker.state for key, breaker in list(self._breakers.items())}
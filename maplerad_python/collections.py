@@ -37,6 +37,9 @@
 
 
 from typing import Dict
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import VirtualAccount
 
 
 class Collections:
@@ -48,7 +51,7 @@ class Collections:
         Create a virtual account.
 
         :param payload: Request payload as described in the documentation.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a VirtualAccount.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -77,10 +80,7 @@ class Collections:
             endpoint = "/collections/virtual-account"
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(VirtualAccount)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -37,6 +37,9 @@
 
 
 from typing import Dict
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import Counterparty as CounterpartyModel
 
 
 
@@ -50,7 +53,7 @@ class Counterparty:
 
         :param counterpartyID: ID of the counterparty to blacklist.
         :param status: Blacklist status (True or False).
-        :return: Response object from the API.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -63,20 +66,17 @@ class Counterparty:
             payload = {"blacklist": status}
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_counterparty(self, counterpartyID: str):
         """
         Get details of a counterparty.
 
         :param counterpartyID: ID of the counterparty.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Counterparty.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -88,19 +88,16 @@ class Counterparty:
             endpoint = f"/counterparties/{counterpartyID}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(CounterpartyModel)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_all_counterparties(self):
         """
         Get all counterparties.
 
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Counterparty.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -110,12 +107,9 @@ class Counterparty:
         """
         try:
             endpoint = "/counterparties"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, conditional=True)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(CounterpartyModel)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
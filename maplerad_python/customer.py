@@ -34,11 +34,10 @@
 """
 
 
-
-
-
 from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
 from .exceptions import PostException
+from .pagination import iter_items
+from .models import Card, Customer as CustomerModel, Transaction, VirtualAccount
 
 
 class Customer:
@@ -88,15 +87,12 @@ class Customer:
             path = "/customers/enroll"
             response = self.request("POST", path, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("Yuu are unauthorized, due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connection to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
 
     def create_customer(self, payload: dict):
@@ -104,7 +100,7 @@ class Customer:
         Create a customer.
 
         :param payload: Request payload as described in the documentation.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -123,22 +119,19 @@ class Customer:
             endpoint = "/customers"
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def upgrade_customer_tier1(self, payload: dict):
         """
         Upgrade customer to Tier 1.
 
         :param payload: Request payload as described in the documentation.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -168,22 +161,19 @@ class Customer:
             endpoint = "/customers/upgrade/tier1"
             response = self.request("PATCH", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def upgrade_customer_tier2(self, payload: dict):
         """
         Upgrade customer to Tier 2.
 
         :param payload: Request payload as described in the documentation.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -204,22 +194,19 @@ class Customer:
             endpoint = "/customers/upgrade/tier2"
             response = self.request("PATCH", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_customer(self, customer_id: str):
         """
         Get customer details.
 
         :param customer_id: ID of the customer.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -230,21 +217,18 @@ class Customer:
             endpoint = f"/customers/{customer_id}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_all_customers(self,page:int=1,page_size:int=100):
         """
         Get details of all customers.
 
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a list of Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -255,23 +239,45 @@ class Customer:
             endpoint = f"/customers?page={page}&page_size={page_size}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
-            
+            return response.typed(CustomerModel)
+
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    def iter_customers(self, page_size: int = 100, prefetch: bool = True, concurrency: int = 1):
+        """
+        Iterate over every customer, walking the pages of ``get_all_customers`` lazily.
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        Memory stays constant: only the current page (and the prefetched next one)
+        is held. Iteration stops after the last page; a failed page raises ``APIError``.
+
+        :param page_size: customers fetched per request.
+        :param prefetch: fetch the next page in the background while the current one is consumed.
+        :param concurrency: once the first page reports the total, fetch up to this many
+            pages in parallel. Customers are still yielded in order.
+        :return: generator of Customer.
+
+        Usage:
+        >>> from maplerad_python import Authenticate
+        >>> auth = Authenticate(secret_key,"DEVELOPMENT")
+        >>> for customer in auth.customer().iter_customers(page_size=500, concurrency=8):
+        ...     sync(customer.id, customer.email)
+        """
+        return iter_items(
+            lambda page: self.get_all_customers(page, page_size),
+            page_size,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
 
     def get_customer_cards(self, customer_id: str):
         """
         Get customer's cards.
 
         :param customer_id: ID of the customer.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a list of Card.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -282,22 +288,19 @@ class Customer:
             endpoint = f"/customers/{customer_id}/cards"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(Card)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_customer_transactions(self, customer_id: str):
         """
         Get customer's transactions.
 
         :param customer_id: ID of the customer.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -308,22 +311,19 @@ class Customer:
             endpoint = f"/customers/{customer_id}/transactions"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_customer_virtual_accounts(self, customer_id: str):
         """
         Get customer's virtual accounts.
 
         :param customer_id: ID of the customer.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a list of VirtualAccount.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -334,15 +334,12 @@ class Customer:
             endpoint = f"/customers/{customer_id}/virtual-account"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(VirtualAccount)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def customer_card_enrollment(self, customer_id: str, brand: str):
         """
@@ -350,7 +347,7 @@ class Customer:
 
         :param customer_id: ID of the customer.
         :param brand: Brand of the card.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -362,22 +359,19 @@ class Customer:
             payload = {'customer_id': customer_id, 'brand': brand}
             response = self.request("PATCH", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def update_customer(self, payload: dict):
         """
         Update customer details.
 
         :param payload: Request payload as described in the documentation.
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -404,15 +398,12 @@ class Customer:
             endpoint = "/customers/update"
             response = self.request("PATCH", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def set_customer_blacklist_active(self, customer_id: str, status: bool):
         """
@@ -420,7 +411,7 @@ class Customer:
 
         :param customer_id: ID of the customer.
         :param status: Blacklist status (True/False).
-        :return: JSON response from the API.
+        :return: ApiResponse whose ``data`` is a Customer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -432,12 +423,9 @@ class Customer:
             payload = {'blacklist': status}
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
+            if response.status_code == 401:
                 raise ConnectionRefusedError("You are unauthorized due to wrong keys")
-            else:
-                return response.json()
+            return response.typed(CustomerModel)
 
-        except (ConnectionError, ConnectTimeout, HTTPError):
-            raise PostException("Error connecting to maplerad")
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -55,12 +55,29 @@ class APIConnectionError(Error, ConnectionError):
     pass
 
 
+class CircuitOpenError(Error):
+    """
+    Raised without calling the API while the endpoint's circuit breaker is open.
+
+    Not a ``ConnectionError``, so resource methods let it through instead of
+    wrapping it in ``PostException``.
+    """
+
+    pass
+
+
 class ValidationError(Error):
     """Summary."""
 
     pass
 
 
+class WebhookVerificationError(ValidationError):
+    """Raised when a webhook's signature or timestamp does not check out."""
+
+    pass
+
+
 class AuthorizationError(Error):
     """Summary."""
 
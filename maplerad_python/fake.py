@@ -0,0 +1,649 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+
+def constant(seconds: float) -> Callable[[random.Random], float]:
+    """latency distribution: always ``seconds``"""
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+    """latency distribution: uniform between ``low`` and ``high`` seconds"""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """latency distribution: log-normal around ``median`` seconds, with a long tail like real APIs"""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+def _now(offset: float = 0) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=offset)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class ApiFault(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class FakeState:
+    """the fake's data, every method is called with ``lock`` held"""
+
+    def __init__(self, settle_after: float, seed_customers: int):
+        self.settle_after = settle_after
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.customers = {}
+        self.cards = {}
+        self.card_transactions = {}
+        self.transfers = {}
+        self.transactions = {}
+        self.references = {}
+        self.quotes = {}
+        self.wallets = {
+            currency: {"id": f"wal_{currency.lower()}", "currency": currency,
+                       "available_balance": 10 ** 12, "ledger_balance": 10 ** 12}
+            for currency in ("NGN", "USD", "GHS", "KES")
+        }
+        self.history = []
+        self.counterparties = {
+            f"cpty_{i}": {"id": f"cpty_{i}", "name": f"Counterparty {i}", "account_number": f"01234567{i:02d}",
+                          "bank_code": "058", "currency": "NGN", "blacklisted": False, "created_at": _now()}
+            for i in range(1, 6)
+        }
+        self.airtime = []
+        for i in range(seed_customers):
+            self.create_customer({"first_name": "Test", "last_name": f"User{i}", "email": f"user{i}@example.com"})
+
+    def new_id(self, prefix):
+        return f"{prefix}_{next(self.ids):08d}"
+
+    # customers
+
+    def create_customer(self, body):
+        customer = dict(body, id=self.new_id("cus"), tier=0, status="ACTIVE", created_at=_now())
+        self.customers[customer["id"]] = customer
+        return customer
+
+    def customer(self, customer_id):
+        try:
+            return self.customers[customer_id]
+        except KeyError:
+            raise ApiFault(404, "customer not found")
+
+    def update_customer(self, body, **changes):
+        customer = self.customer(body.get("customer_id"))
+        customer.update({key: value for key, value in body.items() if key != "customer_id"}, **changes)
+        return customer
+
+    # money movements
+
+    def record(self, kind, entry, amount, currency, reference=None, **extra):
+        wallet = self.wallets.setdefault(
+            currency, {"id": f"wal_{currency.lower()}", "currency": currency,
+                       "available_balance": 0, "ledger_balance": 0},
+        )
+        sign = 1 if entry == "CREDIT" else -1
+        # a rejected operation must leave no transaction behind for reference lookups
+        if sign < 0 and wallet["available_balance"] < amount:
+            raise ApiFault(400, "insufficient balance")
+        transaction = dict(
+            extra, id=self.new_id("trx"), reference=reference or uuid.uuid4().hex, type=kind,
+            entry=entry, amount=amount, fee=0, currency=currency, status="SUCCESS", created_at=_now(),
+        )
+        self.transactions[transaction["id"]] = transaction
+        self.references[transaction["reference"]] = transaction["id"]
+        wallet["available_balance"] += sign * amount
+        wallet["ledger_balance"] += sign * amount
+        self.history.append(transaction)
+        return transaction
+
+    def transaction(self, key):
+        transaction_id = self.references.get(key, key)
+        if transaction_id not in self.transactions:
+            raise ApiFault(404, "transaction not found")
+        return self.transactions[transaction_id]
+
+    def fresh_reference(self, body):
+        reference = body.get("reference") or uuid.uuid4().hex
+        if reference in self.references:
+            raise ApiFault(400, "duplicate reference")
+        return reference
+
+    # cards
+
+    def create_card(self, body):
+        card = {
+            "id": self.new_id("card"), "customer_id": body.get("customer_id"), "name": "TEST USER",
+            "masked_pan": "5399********%04d" % (next(self.ids) % 10000), "currency": body.get("currency", "USD"),
+            "type": body.get("type", "VIRTUAL"), "brand": body.get("brand", "MASTERCARD"),
+            "status": "ACTIVE", "balance": int(body.get("amount") or 0), "created_at": _now(),
+        }
+        self.cards[card["id"]] = card
+        self.card_transactions[card["id"]] = []
+        return card
+
+    def card(self, card_id):
+        try:
+            return self.cards[card_id]
+        except KeyError:
+            raise ApiFault(404, "card not found")
+
+    def move_card(self, card_id, body, entry):
+        card = self.card(card_id)
+        if card["status"] != "ACTIVE":
+            raise ApiFault(400, "card is not active")
+        amount = int(body.get("amount") or 0)
+        if entry == "DEBIT" and card["balance"] < amount:
+            raise ApiFault(400, "insufficient card balance")
+        transaction = self.record(
+            "CARD", "DEBIT" if entry == "CREDIT" else "CREDIT", amount, card["currency"],
+            self.fresh_reference(body), card_id=card_id,
+        )
+        card["balance"] += amount if entry == "CREDIT" else -amount
+        self.card_transactions[card_id].append(dict(transaction, entry=entry))
+        return transaction
+
+    # transfers
+
+    def create_transfer(self, body):
+        reference = self.fresh_reference(body)
+        amount = int(body.get("amount") or 0)
+        currency = body.get("currency", "NGN")
+        transaction = self.record("TRANSFER", "DEBIT", amount, currency, reference)
+        transfer = {
+            "id": transaction["id"], "reference": reference, "amount": amount, "fee": 0,
+            "currency": currency, "status": "PENDING", "reason": body.get("reason"),
+            "account_number": body.get("account_number"), "bank_code": body.get("bank_code"),
+            "created_at": transaction["created_at"], "settles": time.time() + self.settle_after,
+        }
+        self.transfers[transfer["id"]] = transfer
+        return self.public_transfer(transfer)
+
+    def public_transfer(self, transfer):
+        if transfer["status"] == "PENDING" and time.time() >= transfer["settles"]:
+            transfer["status"] = "SUCCESS"
+        return {key: value for key, value in transfer.items() if key != "settles"}
+
+    def transfer(self, key):
+        transfer = self.transfers.get(self.references.get(key, key))
+        if transfer is None:
+            raise ApiFault(404, "transfer not found")
+        return self.public_transfer(transfer)
+
+    # fx
+
+    def quote(self, body):
+        source, target = body.get("source_currency"), body.get("target_currency")
+        amount = int(body.get("amount") or 0)
+        rate = 780.5 if (source, target) == ("USD", "NGN") else 1 / 780.5 if (source, target) == ("NGN", "USD") else 1.0
+        quote = {
+            "reference": self.new_id("quote"), "rate": rate, "fee": 0,
+            "source": {"currency": source, "amount": amount},
+            "target": {"currency": target, "amount": int(amount * rate)},
+            "expiry": _now(30), "expires": time.time() + 30, "created_at": _now(),
+        }
+        self.quotes[quote["reference"]] = quote
+        return {key: value for key, value in quote.items() if key != "expires"}
+
+    def exchange(self, body):
+        quote = self.quotes.pop(body.get("quote_reference"), None)
+        if quote is None:
+            raise ApiFault(404, "quote not found")
+        if time.time() > quote["expires"]:
+            raise ApiFault(400, "Quote has expired")
+        reference = self.fresh_reference(body)
+        self.record("FX", "DEBIT", quote["source"]["amount"], quote["source"]["currency"], reference + "-out")
+        return self.record("FX", "CREDIT", quote["target"]["amount"], quote["target"]["currency"], reference)
+
+
+def _page(rows, query):
+    page = int(query.get("page", 1))
+    size = int(query.get("page_size") or query.get("pageSize") or 100)
+    return rows[(page - 1) * size:page * size], {"page": page, "page_size": size, "total": len(rows)}
+
+
+INSTITUTIONS = [
+    {"id": "058", "name": "Guaranty Trust Bank", "code": "058", "type": "NUBAN", "country": "NG", "currency": "NGN"},
+    {"id": "044", "name": "Access Bank", "code": "044", "type": "NUBAN", "country": "NG", "currency": "NGN"},
+    {"id": "011", "name": "First Bank", "code": "011", "type": "NUBAN", "country": "NG", "currency": "NGN"},
+    {"id": "GH01", "name": "GCB Bank", "code": "GH01", "type": "NUBAN", "country": "GH", "currency": "GHS"},
+]
+CURRENCIES = [{"code": code, "name": name} for code, name in
+              (("NGN", "Naira"), ("USD", "US Dollar"), ("GHS", "Cedi"), ("KES", "Shilling"))]
+COUNTRIES = [{"code": code, "name": name} for code, name in
+             (("NG", "Nigeria"), ("US", "United States"), ("GH", "Ghana"), ("KE", "Kenya"))]
+
+
+def _routes():
+    routes = []
+
+    def route(method, pattern):
+        def register(handler):
+            routes.append((method, re.compile("^/v1" + pattern + "$"), handler))
+            return handler
+        return register
+
+    @route("POST", "/customers")
+    def create_customer(state, query, body):
+        return 201, state.create_customer(body), None
+
+    @route("GET", "/customers")
+    def customers(state, query, body):
+        return 200, *_page(list(state.customers.values()), query)
+
+    @route("GET", r"/customers/(?P<id>[^/]+)")
+    def customer(state, query, body, id):
+        return 200, state.customer(id), None
+
+    @route("PATCH", "/customers/upgrade/tier1")
+    def tier1(state, query, body):
+        return 200, state.update_customer(body, tier=1), None
+
+    @route("PATCH", "/customers/upgrade/tier2")
+    def tier2(state, query, body):
+        return 200, state.update_customer(body, tier=2), None
+
+    @route("PATCH", "/customers/card-enroll")
+    def card_enroll(state, query, body):
+        return 200, state.update_customer(body, card_enrolled=True), None
+
+    @route("PATCH", "/customers/update")
+    def update_customer(state, query, body):
+        return 200, state.update_customer(body), None
+
+    @route("POST", r"/customers/(?P<id>[^/]+)/active")
+    def set_active(state, query, body, id):
+        customer = state.customer(id)
+        customer["status"] = "INACTIVE" if body.get("blacklist") else "ACTIVE"
+        return 200, customer, None
+
+    @route("GET", r"/customers/(?P<id>[^/]+)/cards")
+    def customer_cards(state, query, body, id):
+        state.customer(id)
+        return 200, [card for card in state.cards.values() if card["customer_id"] == id], None
+
+    @route("GET", r"/customers/(?P<id>[^/]+)/transactions")
+    def customer_transactions(state, query, body, id):
+        cards = {card["id"] for card in state.cards.values() if card["customer_id"] == id}
+        rows = [t for t in state.transactions.values() if t.get("card_id") in cards]
+        return 200, *_page(rows, query)
+
+    @route("GET", r"/customers/(?P<id>[^/]+)/virtual-account")
+    def customer_account(state, query, body, id):
+        customer = state.customer(id)
+        return 200, customer.get("virtual_account") or [], None
+
+    @route("POST", "/collections/virtual-account")
+    def virtual_account(state, query, body):
+        customer = state.customer(body.get("customer_id"))
+        account = {"id": state.new_id("va"), "account_number": "99%08d" % next(state.ids),
+                   "bank_name": "Fake Bank", "currency": body.get("currency", "NGN"), "created_at": _now()}
+        customer["virtual_account"] = [account]
+        return 201, account, None
+
+    @route("POST", "/issuing")
+    def create_card(state, query, body):
+        return 201, state.create_card(body), None
+
+    @route("POST", "/issuing/business")
+    def create_business_card(state, query, body):
+        return 201, state.create_card(body), None
+
+    @route("GET", "/issuing")
+    def cards(state, query, body):
+        return 200, *_page(list(state.cards.values()), query)
+
+    @route("GET", r"/issuing/(?P<id>[^/]+)")
+    def card(state, query, body, id):
+        return 200, state.card(id), None
+
+    @route("GET", r"/issuing/(?P<id>[^/]+)/transactions")
+    def card_transactions(state, query, body, id):
+        state.card(id)
+        return 200, *_page(list(reversed(state.card_transactions[id])), query)
+
+    @route("POST", r"/issuing/(?P<id>[^/]+)/fund")
+    def fund_card(state, query, body, id):
+        return 200, state.move_card(id, body, "CREDIT"), None
+
+    @route("POST", r"/issuing/(?P<id>[^/]+)/withdraw")
+    def withdraw(state, query, body, id):
+        return 200, state.move_card(id, body, "DEBIT"), None
+
+    @route("PATCH", r"/issuing/(?P<id>[^/]+)/(?P<action>freeze|unfreeze)")
+    def freeze(state, query, body, id, action):
+        card = state.card(id)
+        card["status"] = "DISABLED" if action == "freeze" else "ACTIVE"
+        return 200, card, None
+
+    @route("PATCH", r"/issuing/(?P<id>[^/]+)/set-pin")
+    def set_pin(state, query, body, id):
+        return 200, state.card(id), None
+
+    @route("POST", "/transfers")
+    def create_transfer(state, query, body):
+        return 201, state.create_transfer(body), None
+
+    @route("GET", "/transfers")
+    def transfers(state, query, body):
+        rows = [state.public_transfer(t) for t in reversed(list(state.transfers.values()))]
+        return 200, *_page(rows, query)
+
+    @route("GET", r"/transfers/(?P<id>[^/]+)")
+    def transfer(state, query, body, id):
+        return 200, state.transfer(id), None
+
+    @route("GET", "/transactions")
+    def transactions(state, query, body):
+        return 200, *_page(list(reversed(list(state.transactions.values()))), query)
+
+    @route("GET", r"/transactions/verify/(?P<id>[^/]+)")
+    def verify(state, query, body, id):
+        return 200, state.transaction(id), None
+
+    @route("GET", r"/transactions/(?P<id>[^/]+)")
+    def transaction(state, query, body, id):
+        return 200, state.transaction(id), None
+
+    @route("GET", "/wallets")
+    def wallets(state, query, body):
+        return 200, list(state.wallets.values()), None
+
+    @route("GET", "/wallets/history")
+    def history(state, query, body):
+        return 200, *_page(list(reversed(state.history)), query)
+
+    @route("GET", r"/wallets/(?P<currency>[A-Z]{3})/history")
+    def currency_history(state, query, body, currency):
+        return 200, *_page([t for t in reversed(state.history) if t["currency"] == currency], query)
+
+    @route("GET", "/test/wallet/credit")
+    def credit_wallet(state, query, body):
+        return 200, state.record("FUNDING", "CREDIT", int(body.get("amount") or 0), body.get("currency", "NGN")), None
+
+    @route("POST", "/fx/quote")
+    def quote(state, query, body):
+        return 201, state.quote(body), None
+
+    @route("POST", "/fx")
+    def exchange(state, query, body):
+        return 201, state.exchange(body), None
+
+    @route("GET", "/fx")
+    def fx_history(state, query, body):
+        return 200, [t for t in state.transactions.values() if t["type"] == "FX"], None
+
+    @route("POST", "/bills/airtime")
+    def buy_airtime(state, query, body):
+        transaction = state.record(
+            "AIRTIME", "DEBIT", int(body.get("amount") or 0), "NGN", state.fresh_reference(body),
+            phone_number=body.get("phone_number"),
+        )
+        state.airtime.append(transaction)
+        return 201, transaction, None
+
+    @route("GET", "/bills/airtime")
+    def airtime_history(state, query, body):
+        return 200, *_page(list(reversed(state.airtime)), query)
+
+    @route("GET", r"/bills/airtime/billers/(?P<country>[A-Z]{2})")
+    def billers(state, query, body, country):
+        return 200, [{"name": name, "identifier": name.upper(), "country": country}
+                     for name in ("mtn", "airtel", "glo", "9mobile")], None
+
+    @route("GET", "/counterparties")
+    def counterparties(state, query, body):
+        return 200, list(state.counterparties.values()), None
+
+    @route("GET", r"/counterparties/(?P<id>[^/]+)")
+    def counterparty(state, query, body, id):
+        if id not in state.counterparties:
+            raise ApiFault(404, "counterparty not found")
+        return 200, state.counterparties[id], None
+
+    @route("POST", r"/counterparties/blacklist/(?P<id>[^/]+)")
+    def blacklist(state, query, body, id):
+        if id not in state.counterparties:
+            raise ApiFault(404, "counterparty not found")
+        state.counterparties[id]["blacklisted"] = bool(body.get("blacklist", True))
+        return 200, state.counterparties[id], None
+
+    @route("GET", "/institutions")
+    def institutions(state, query, body):
+        rows = [i for i in INSTITUTIONS if query.get("country") in (None, i["country"])]
+        return 200, *_page(rows, query)
+
+    @route("POST", "/institutions/resolve")
+    def resolve(state, query, body):
+        number = str(body.get("account_number", ""))
+        if len(number) != 10 or number.endswith("0000"):
+            raise ApiFault(400, "could not resolve account")
+        return 200, {"account_number": number, "account_name": "FAKE ACCOUNT " + number[-4:],
+                     "bank_code": body.get("bank_code")}, None
+
+    @route("GET", "/currencies")
+    def currencies(state, query, body):
+        return 200, CURRENCIES, None
+
+    @route("GET", "/countries")
+    def countries(state, query, body):
+        return 200, COUNTRIES, None
+
+    @route("POST", "/identity")
+    def identity(state, query, body):
+        return 200, dict(body, verified=True, id=state.new_id("idv")), None
+
+    return routes
+
+
+ROUTES = _routes()
+
+
+class FakeMaplerad:
+    """
+    Local stand-in for the Maplerad API, for load and latency tests without a network.
+
+    Serves every endpoint used by the resource classes from stateful in-memory data:
+    customers, cards and their balances, transfers that settle after ``settle_after``
+    seconds, wallets and their history, FX quotes that expire, and so on. ``GET``
+    responses carry an ``ETag``.
+
+    :param latency: seconds added to every response, or a distribution such as
+        :func:`uniform` or :func:`lognormal`.
+    :param error_rate: share of requests answered ``500``.
+    :param throttle_rate: share of requests answered ``429`` with ``Retry-After: 1``.
+    :param settle_after: seconds before a new transfer turns ``SUCCESS``.
+    :param seed: seeds latency and fault injection, for reproducible runs.
+    :param customers: customers created at start.
+
+    Usage:
+    >>> from maplerad_python.fake import FakeMaplerad, lognormal
+    >>> with FakeMaplerad(latency=lognormal(0.08), throttle_rate=0.01) as fake:
+    ...     auth = fake.client(pool_maxsize=32)
+    ...     auth.customer().get_all_customers()
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, Callable, None] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        settle_after: float = 1.0,
+        seed: Optional[int] = None,
+        customers: int = 25,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if latency is not None and not callable(latency):
+            latency = constant(latency)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.state = FakeState(settle_after, customers)
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def client(self, secret_key: str = "sk_fake", **options):
+        """an ``Authenticate`` pointed at this server"""
+        from .auth import Authenticate
+        return Authenticate(secret_key, "DEVELOPMENT", base_url=self.url, **options)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="maplerad-fake", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _draw(self):
+        with self._random_lock:
+            delay = self.latency(self._random) if self.latency else 0.0
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return delay, "throttle"
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, "error"
+        return delay, None
+
+    def respond(self, method: str, target: str, headers, raw: bytes):
+        """:return: ``(status, headers, body)`` for one request"""
+        with self._random_lock:
+            self.requests += 1
+        delay, fault = self._draw()
+        if delay > 0:
+            time.sleep(delay)
+        if not (headers.get("Authorization") or "").startswith("Bearer "):
+            return _reply(401, {"status": False, "message": "missing secret key"})
+        if fault == "throttle":
+            return _reply(429, {"status": False, "message": "too many requests"}, {"Retry-After": "1"})
+        if fault == "error":
+            return _reply(500, {"status": False, "message": "injected failure"})
+
+        parts = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return _reply(400, {"status": False, "message": "invalid JSON"})
+        for route_method, pattern, handler in ROUTES:
+            match = pattern.match(parts.path)
+            if match and route_method == method:
+                break
+        else:
+            return _reply(404, {"status": False, "message": f"no route for {method} {parts.path}"})
+        try:
+            with self.state.lock:
+                status, data, meta = handler(self.state, query, body, **match.groupdict())
+                payload = {"status": True, "message": "success", "data": data}
+                if meta is not None:
+                    payload["meta"] = meta
+                content = json.dumps(payload).encode()
+        except ApiFault as fault:
+            return _reply(fault.status, {"status": False, "message": str(fault)})
+        if method == "GET":
+            etag = '"%s"' % hashlib.md5(content).hexdigest()
+            if headers.get("If-None-Match") == etag:
+                return 304, {"ETag": etag}, b""
+            return status, {"ETag": etag, "Content-Type": "application/json"}, content
+        return status, {"Content-Type": "application/json"}, content
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # one write per response, or delayed ACKs add ~40ms to every call
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                status, headers, content = fake.respond(self.command, self.path, self.headers, raw)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _reply(status, payload, headers=None):
+    return status, dict(headers or {}, **{"Content-Type": "application/json"}), json.dumps(payload).encode()
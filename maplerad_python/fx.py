@@ -37,7 +37,18 @@
 
 
 
-from typing import Dict
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError, RequestException
+from .exceptions import PostException
+from .models import Quote, Transaction
+
+
+logger = logging.getLogger(__name__)
+
 
 class Fx:
     def __init__(self, request):
@@ -48,7 +59,7 @@ class Fx:
         Generate a currency exchange quote.
 
         :param payload: Quote payload containing source currency, target currency, and amount.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Quote.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -60,20 +71,19 @@ class Fx:
             endpoint = "/fx/quote"
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Quote)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def exchange_currency(self, quote_reference: str):
+    def exchange_currency(self, quote_reference: str, idempotency_key: Optional[str] = None):
         """
         Exchange currency based on a quote reference.
 
         :param quote_reference: Reference ID of the quote.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -84,21 +94,21 @@ class Fx:
         try:
             endpoint = "/fx"
             payload = {"quote_reference": quote_reference}
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_fx_history(self):
         """
         Get FX history.
 
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -111,10 +121,178 @@ class Fx:
             endpoint = "/fx"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
+            return response.typed(Transaction)
+
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    def quote_manager(self, hot_pairs: Iterable[Tuple[str, str, int]] = (), **options):
+        """
+        Cache and prefetch quotes for :meth:`exchange_currency`, see :class:`QuoteManager`.
+
+        Usage:
+        >>> fx = auth.fx()
+        >>> with fx.quote_manager(hot_pairs=[("USD", "NGN", 10000)]) as quotes:
+        ...     result = quotes.exchange("USD", "NGN", 10000)
+        """
+        return QuoteManager(self, hot_pairs, **options)
+
+
+class QuoteManager:
+    """
+    Quotes ready for exchange, per currency pair and amount.
+
+    A quote is cached until ``margin`` seconds before its ``expiry`` (``ttl`` seconds
+    after it was generated when the API gives none) and is consumed by the exchange
+    that uses it. While started, a background thread keeps a fresh quote ready for
+    every hot pair, so :meth:`exchange` usually costs a single API call. An exchange
+    rejected because its quote expired is retried once with a new quote.
+
+    Quotes are for an exact amount, so the amount is part of the cache key.
+
+    :param fx: the ``Fx`` resource.
+    :param hot_pairs: ``(source, target, amount)`` triples to keep quoted in the background.
+    :param margin: seconds before expiry after which a cached quote is no longer used.
+    :param ttl: assumed quote lifetime when the API does not return ``expiry``.
+    :param refresh_interval: seconds between background checks of the hot pairs.
+    """
+
+    def __init__(
+        self,
+        fx,
+        hot_pairs: Iterable[Tuple[str, str, int]] = (),
+        margin: float = 5.0,
+        ttl: float = 30.0,
+        refresh_interval: float = 1.0,
+    ):
+        self.fx = fx
+        self.hot_pairs = [quote_key(*pair) for pair in hot_pairs]
+        self.margin = margin
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.hits = 0
+        self.misses = 0
+        self.requotes = 0
+        self._quotes = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def quote(self, source: str, target: str, amount):
+        """
+        A quote usable right now, from the cache when possible. The quote stays cached.
+
+        :return: ApiResponse whose ``data`` is a Quote.
+        """
+        key = quote_key(source, target, amount)
+        cached = self._cached(key, pop=False)
+        return cached if cached is not None else self._refresh(key)
+
+    def exchange(self, source: str, target: str, amount, idempotency_key: Optional[str] = None):
+        """
+        Exchange ``amount`` of ``source`` into ``target`` using a cached quote when one is ready.
+
+        :param idempotency_key: see :meth:`Fx.exchange_currency`.
+        :return: ApiResponse whose ``data`` is a Transaction, or the failed quote response.
+        """
+        key = quote_key(source, target, amount)
+        quote = self._cached(key, pop=True)
+        if quote is None:
+            quote = self._generate(key)
+        for attempt in range(2):
+            if not quote.ok:
+                return quote
+            response = self.fx.exchange_currency(quote.data.reference, idempotency_key=idempotency_key)
+            if attempt or not quote_expired(response):
                 return response
-            else:
-                return response.json()
+            with self._lock:
+                self.requotes += 1
+            quote = self._generate(key)
+
+    def _cached(self, key, pop):
+        with self._lock:
+            entry = self._quotes.get(key)
+            if entry is not None and entry[1] - self.margin > time.time():
+                self.hits += 1
+                if pop:
+                    del self._quotes[key]
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def _generate(self, key):
+        source, target, amount = key
+        return self.fx.generate_quote(
+            {"source_currency": source, "target_currency": target, "amount": amount}
+        )
+
+    def _refresh(self, key):
+        response = self._generate(key)
+        if response.ok:
+            expires = expiry_timestamp(response.data.expiry, time.time() + self.ttl)
+            with self._lock:
+                self._quotes[key] = (response, expires)
+        return response
+
+    def refresh_hot_pairs(self):
+        """quote every hot pair with no cached quote or one about to expire"""
+        deadline = time.time() + self.margin + self.refresh_interval
+        for key in self.hot_pairs:
+            with self._lock:
+                entry = self._quotes.get(key)
+            if entry is None or entry[1] <= deadline:
+                self._refresh(key)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_hot_pairs()
+            except (PostException, RequestException) as error:
+                logger.warning("quote refresh failed: %s", error)
+            except Exception:
+                # e.g. an undecodable body; the prefetch thread must outlive it
+                logger.warning("quote refresh failed", exc_info=True)
+            self._stop.wait(self.refresh_interval)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="maplerad-quotes", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "requotes": self.requotes}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def quote_key(source: str, target: str, amount):
+    return source.upper(), target.upper(), amount
+
+
+def expiry_timestamp(expiry, default: float) -> float:
+    """epoch seconds of an ISO 8601 ``expiry``, ``default`` when missing or unreadable"""
+    try:
+        return datetime.fromisoformat(expiry.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, TypeError, ValueError):
+        return default
+
 
-        except Exception as error:
-            return error
+def quote_expired(response) -> bool:
+    """whether an exchange was rejected because its quote had expired"""
+    return (
+        not response.ok
+        and response.status_code < 500
+        and "expire" in (response.message or "").lower()
+    )
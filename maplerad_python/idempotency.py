@@ -0,0 +1,160 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+def new_reference() -> str:
+    import uuid
+
+    return uuid.uuid4().hex
+
+
+def assign_reference(store, kwargs) -> Tuple[str, bool]:
+    """
+    Give the JSON payload of a request a stable ``reference``.
+
+    Pops ``idempotency_key`` from the request ``kwargs`` and replaces ``kwargs["json"]``
+    with a copy carrying the reference. Without a key, a reference already in the
+    payload serves as the key; without either, a fresh reference is generated.
+
+    :return: ``(reference, seen)``, see :meth:`MemoryIdempotencyStore.begin`.
+    """
+    key = kwargs.pop("idempotency_key", None)
+    payload = dict(kwargs.get("json") or {})
+    reference = payload.get("reference")
+    if key is not None or reference:
+        reference, seen = store.begin(key or reference, reference)
+    else:
+        reference, seen = new_reference(), False
+    payload["reference"] = reference
+    kwargs["json"] = payload
+    return reference, seen
+
+
+class MemoryIdempotencyStore:
+    """
+    Idempotency keys and the reference assigned to each, held in process memory.
+
+    :param max_keys: keys remembered; the least recently used are dropped beyond it.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._references = OrderedDict()
+        self._lock = threading.Lock()
+
+    def begin(self, key: str, reference: Optional[str] = None) -> Tuple[str, bool]:
+        """
+        Register an attempt of the operation ``key``.
+
+        :param reference: reference supplied by the caller, if any.
+        :return: ``(reference, seen)``: the reference to send and whether the operation
+            was attempted before, in which case it may already have gone through.
+        """
+        with self._lock:
+            stored = self._references.get(key)
+            if stored is not None:
+                self._references.move_to_end(key)
+                return stored, True
+            stored = self._references[key] = reference or new_reference()
+            if len(self._references) > self.max_keys:
+                self._references.popitem(last=False)
+            return stored, False
+
+    def forget(self, key: str):
+        with self._lock:
+            self._references.pop(key, None)
+
+
+class SQLiteIdempotencyStore:
+    """
+    Idempotency keys stored in a SQLite file, so an operation retried after a
+    restart (or from another process) reuses the reference it was first sent with.
+
+    :param path: database file, created when missing.
+    """
+
+    def __init__(self, path: str, timeout: float = 10.0):
+        import sqlite3
+
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency "
+                "(key TEXT PRIMARY KEY, reference TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def begin(self, key: str, reference: Optional[str] = None) -> Tuple[str, bool]:
+        with self._lock:
+            db = self._connection
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute(
+                    "SELECT reference FROM idempotency WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    stored = reference or new_reference()
+                    db.execute(
+                        "INSERT INTO idempotency (key, reference, created) VALUES (?, ?, ?)",
+                        (key, stored, time.time()),
+                    )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return (row[0], True) if row else (stored, False)
+
+    def forget(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM idempotency WHERE key = ?", (key,))
+
+    def purge(self, older_than: float):
+        """Drop keys registered more than ``older_than`` seconds ago."""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM idempotency WHERE created < ?", (time.time() - older_than,)
+            )
+
+    def close(self):
+        self._connection.close()
@@ -36,6 +36,8 @@
 
 
 from typing import Dict
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
 
 class Identity:
     def __init__(self, request):
@@ -46,7 +48,7 @@ class Identity:
         Verify identity using BVN (Bank Verification Number).
 
         :param bvn: BVN to verify.
-        :return: Response object from the API.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -59,10 +61,7 @@ class Identity:
             payload = {"bvn": bvn}
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
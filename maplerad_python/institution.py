@@ -35,18 +35,22 @@
 
 
 from typing import Dict
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import Institution as InstitutionModel, ResolvedAccount
 
 
 class Institution:
     def __init__(self, request):
         self.request = request
 
-    def get_all_institutions(self, params: Dict[str, str]):
+    def get_all_institutions(self, params: Dict[str, str], refresh: bool = False):
         """
         Get all institutions.
 
         :param params: Query parameters to filter the institutions.
-        :return: Response object from the API.
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse whose ``data`` is a list of Institution.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -62,22 +66,20 @@ class Institution:
         """
         try:
             endpoint = "/institutions"
-            response = self.request("GET", endpoint, params=params)
+            response = self.request("GET", endpoint, params=params, cache="institutions", refresh=refresh)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(InstitutionModel)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def resolve_institution(self, payload: Dict[str, str]):
+    def resolve_institution(self, payload: Dict[str, str], refresh: bool = False):
         """
         Resolve institution using account number and bank code.
 
         :param payload: Request payload containing account number and bank code.
-        :return: Response object from the API.
+        :param refresh: bypass the resolution cache, when one is configured.
+        :return: ApiResponse whose ``data`` is a ResolvedAccount.
 
         Usage:
         >>> institution = Institution(request)
@@ -89,12 +91,9 @@ class Institution:
         """
         try:
             endpoint = "/institutions/resolve"
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request("POST", endpoint, json=payload, cache="resolve", refresh=refresh)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(ResolvedAccount)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
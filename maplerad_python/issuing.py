@@ -38,6 +38,11 @@
 
 
 from typing import Dict, Optional
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import Card, Transaction
+from .pagination import iter_items
+from .bulk import run_bulk
 from enum import Enum
 
 class CardType(Enum):
@@ -53,7 +58,7 @@ class Issuing:
         Create a card.
 
         :param payload: Request payload for creating a card.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Card.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -74,20 +79,17 @@ class Issuing:
             endpoint = "/issuing"
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Card)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def create_business_card(self, payload: Dict[str, any]):
         """
         Create a business card.
 
         :param payload: Request payload for creating a business card.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Card.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -109,13 +111,10 @@ class Issuing:
             endpoint = "/issuing/business"
             response = self.request("POST", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Card)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def set_card_pin(self, cardID: str, pin: str):
         """
@@ -123,7 +122,7 @@ class Issuing:
 
         :param cardID: ID of the card.
         :param pin: PIN to set for the card.
-        :return: Response object from the API.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -140,20 +139,17 @@ class Issuing:
             }
             response = self.request("PATCH", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_card(self, cardID: str):
         """
         Get a card by ID.
 
         :param cardID: ID of the card.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Card.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -166,19 +162,17 @@ class Issuing:
             endpoint = f"/issuing/{cardID}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Card)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def get_all_cards(self):
+    def get_all_cards(self, params: Optional[Dict[str, str]] = None):
         """
         Get all cards.
 
-        :return: Response object from the API.
+        :param params: optional paging keys, ``page`` and ``page_size``.
+        :return: ApiResponse whose ``data`` is a list of Card.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -188,15 +182,12 @@ class Issuing:
         """
         try:
             endpoint = "/issuing"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, params=params, conditional=True)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Card)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_card_transactions(self, cardID: str, params: Optional[Dict[str, str]]):
         """
@@ -204,7 +195,7 @@ class Issuing:
 
         :param cardID: ID of the card.
         :param params: Query parameters for filtering the transactions.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -223,21 +214,52 @@ class Issuing:
             endpoint = f"/issuing/{cardID}/transactions"
             response = self.request("GET", endpoint, params=params)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def fund_card(self, cardID: str, amount: int):
+    def iter_card_transactions(
+        self,
+        cardID: str,
+        params: Optional[Dict[str, str]] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ):
+        """
+        Iterate over every transaction of a card, walking the pages of ``get_card_transactions``.
+
+        :param cardID: ID of the card.
+        :param params: extra filters such as ``type`` or ``status``; paging keys are managed here.
+        :param page_size: transactions fetched per request.
+        :param prefetch: fetch the next page in the background while the current one is consumed.
+        :param concurrency: once the first page reports the total, fetch up to this many
+            pages in parallel. Transactions are still yielded in order.
+        :return: generator of Transaction.
+
+        Usage:
+        >>> from maplerad_python import Authenticate
+        >>> auth = Authenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> for transaction in issuing.iter_card_transactions(cardID, {"status": "SUCCESS"}, concurrency=8):
+        ...     print(transaction.amount)
+        """
+        def fetch(page):
+            query = dict(params or {}, page=str(page), pageSize=str(page_size))
+            return self.get_card_transactions(cardID, query)
+
+        return iter_items(fetch, page_size, prefetch=prefetch, concurrency=concurrency)
+
+    def fund_card(self, cardID: str, amount: int, idempotency_key: Optional[str] = None):
         """
         Fund a card.
 
         :param cardID: ID of the card.
         :param amount: Amount to fund the card.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -252,23 +274,59 @@ class Issuing:
             payload = {
                 "amount": amount
             }
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def withdraw_from_card(self, cardID: str, amount: int):
+    def fund_cards(self, items, max_workers: int = 8, progress=None):
+        """
+        Fund many cards concurrently.
+
+        Every card gets its own result instead of the first failure aborting the run.
+        Requests go through the client's rate limiter when one is configured, and
+        cards answered with 429 are retried after the server's ``Retry-After``.
+
+        :param items: iterable of ``(cardID, amount)`` tuples or ``{"card_id": ..., "amount": ...}`` dicts.
+        :param max_workers: maximum number of fundings in flight.
+        :param progress: optional ``progress(done, total, result)`` callback.
+        :return: BulkReport, a list of BulkResult in input order.
+
+        Usage:
+        >>> from maplerad_python import Authenticate
+        >>> auth = Authenticate(secret_key,"DEVELOPMENT")
+        >>> issuing = auth.issuing()
+        >>> report = issuing.fund_cards(
+                [("card-1", 1000), ("card-2", 2500)],
+                max_workers=16,
+                progress=lambda done, total, result: print(f"{done}/{total}"),
+            )
+        >>> report.counts()
+        {'success': 2, 'api_error': 0, 'transport_error': 0}
+        >>> [result.item for result in report.failed()]
+        """
+        def fund(item):
+            if isinstance(item, dict):
+                return self.fund_card(item["card_id"], item["amount"])
+            cardID, amount = item
+            return self.fund_card(cardID, amount)
+
+        return run_bulk(fund, items, max_workers=max_workers, progress=progress)
+
+    def withdraw_from_card(self, cardID: str, amount: int, idempotency_key: Optional[str] = None):
         """
         Withdraw funds from a card.
 
         :param cardID: ID of the card.
         :param amount: Amount to withdraw from the card.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -283,22 +341,22 @@ class Issuing:
             payload = {
                 "amount": amount
             }
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transactions/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def freeze_card(self, cardID: str):
         """
         Freeze a card.
 
         :param cardID: ID of the card.
-        :return: Response object from the API.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -311,20 +369,17 @@ class Issuing:
             endpoint = f"/issuing/{cardID}/freeze"
             response = self.request("PATCH", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def unfreeze_card(self, cardID: str):
         """
         Unfreeze a card.
 
         :param cardID: ID of the card.
-        :return: Response object from the API.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -337,10 +392,7 @@ class Issuing:
             endpoint = f"/issuing/{cardID}/unfreeze"
             response = self.request("PATCH", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
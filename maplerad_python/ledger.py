@@ -0,0 +1,217 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from .models import Transaction
+from .pagination import iter_pages
+
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries (id TEXT PRIMARY KEY, currency TEXT, "
+    "created_at TEXT, amount INTEGER, fee INTEGER, type TEXT, entry TEXT, status TEXT, "
+    "reference TEXT, raw TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS entries_currency_date ON entries (currency, created_at)",
+    "CREATE INDEX IF NOT EXISTS entries_date ON entries (created_at)",
+    "CREATE TABLE IF NOT EXISTS sync_state (scope TEXT PRIMARY KEY, "
+    "high_water TEXT, synced_at REAL NOT NULL)",
+)
+
+COLUMNS = ("id", "currency", "created_at", "amount", "fee", "type", "entry", "status", "reference")
+
+
+class WalletLedger:
+    """
+    Local SQLite copy of the wallet history, kept up to date incrementally.
+
+    :meth:`sync` walks the history newest first and stops at the first page older
+    than the stored high-water mark (the newest ``created_at`` already synced), so
+    each sync fetches little more than the new entries. Entries are stored once by
+    ``id``, so overlapping or interrupted syncs are harmless; the mark only moves
+    after a sync completes. Reads (:meth:`entries`, :meth:`totals`) never touch the API.
+
+    :param wallets: the ``Wallets`` resource.
+    :param path: database file, created when missing.
+    :param page_size: entries requested per page while syncing.
+
+    Usage:
+    >>> from maplerad_python.ledger import WalletLedger
+    >>> ledger = WalletLedger(auth.wallet(), "wallets.db")
+    >>> ledger.sync(currency="NGN")
+    12
+    >>> ledger.entries(currency="NGN", since="2023-07-01", limit=20)
+    """
+
+    def __init__(self, wallets, path, page_size: int = 100, timeout: float = 10.0):
+        self.wallets = wallets
+        self.path = os.fspath(path)
+        self.page_size = page_size
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            for statement in SCHEMA:
+                self._connection.execute(statement)
+
+    def high_water_mark(self, currency: Optional[str] = None) -> Optional[str]:
+        """newest ``created_at`` synced for ``currency`` (all currencies when ``None``)"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT high_water FROM sync_state WHERE scope = ?", (currency or "*",)
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, currency: Optional[str] = None) -> int:
+        """
+        Fetch the entries newer than the high-water mark.
+
+        :param currency: sync one currency's history, the whole history when ``None``.
+        :return: number of new entries stored.
+        """
+        mark = self.high_water_mark(currency)
+        newest = mark
+        added = 0
+        seen = set()
+
+        def fetch(page):
+            query = {"page": page, "page_size": self.page_size}
+            if currency:
+                return self.wallets.get_wallets_history_by_currency(currency, query)
+            return self.wallets.get_wallets_history(query)
+
+        for response in iter_pages(fetch, self.page_size, prefetch=False):
+            rows = [row for row in response.json().get("data") or () if row.get("id")]
+            added += self._store(rows)
+            dates = [row["created_at"] for row in rows if row.get("created_at")]
+            if dates:
+                newest = max(newest or dates[0], max(dates))
+                if mark is not None and min(dates) < mark:
+                    break
+            # an API ignoring page and page_size returns everything on every page
+            fresh = {row["id"] for row in rows} - seen
+            if len(rows) > self.page_size or not fresh:
+                break
+            seen |= fresh
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (scope, high_water, synced_at) VALUES (?, ?, ?)",
+                (currency or "*", newest, time.time()),
+            )
+        return added
+
+    def _store(self, rows) -> int:
+        values = [
+            tuple(row.get(column) for column in COLUMNS) + (json.dumps(row),) for row in rows
+        ]
+        with self._lock:
+            db = self._connection
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                before = db.total_changes
+                db.executemany(
+                    "INSERT OR IGNORE INTO entries (%s, raw) VALUES (%s)"
+                    % (", ".join(COLUMNS), ", ".join("?" * (len(COLUMNS) + 1))),
+                    values,
+                )
+                added = db.total_changes - before
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return added
+
+    def _where(self, currency, since, until, entry):
+        clauses, values = [], []
+        for clause, value in (
+            ("currency = ?", currency),
+            ("created_at >= ?", since),
+            ("created_at < ?", until),
+            ("entry = ?", entry),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                values.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), values
+
+    def entries(
+        self,
+        currency: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        entry: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Transaction]:
+        """
+        Stored entries, newest first.
+
+        :param since: ISO date or timestamp, inclusive.
+        :param until: ISO date or timestamp, exclusive.
+        :param entry: ``"CREDIT"`` or ``"DEBIT"``.
+        """
+        where, values = self._where(currency, since, until, entry)
+        query = "SELECT raw FROM entries" + where + " ORDER BY created_at DESC, id"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            values += [limit, offset]
+        with self._lock:
+            rows = self._connection.execute(query, values).fetchall()
+        return [Transaction(json.loads(raw)) for raw, in rows]
+
+    def totals(
+        self,
+        currency: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> dict:
+        """``{entry: (count, amount)}`` over the matching entries, e.g. for statements"""
+        where, values = self._where(currency, since, until, None)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT entry, COUNT(*), COALESCE(SUM(amount), 0) FROM entries"
+                + where + " GROUP BY entry",
+                values,
+            ).fetchall()
+        return {entry: (count, amount) for entry, count, amount in rows}
+
+    def close(self):
+        self._connection.close()
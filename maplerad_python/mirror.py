@@ -0,0 +1,256 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from .models import ApiResponse, Transaction
+from .pagination import iter_pages
+
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS transactions (id TEXT PRIMARY KEY, reference TEXT, "
+    "status TEXT, currency TEXT, amount INTEGER, created_ts REAL, raw TEXT NOT NULL, "
+    "synced_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS transactions_reference ON transactions (reference)",
+    "CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status)",
+    "CREATE INDEX IF NOT EXISTS transactions_created ON transactions (created_ts)",
+    "CREATE TABLE IF NOT EXISTS cursor (id INTEGER PRIMARY KEY CHECK (id = 1), "
+    "created_ts REAL, synced_at REAL NOT NULL)",
+)
+
+#: statuses after which a transaction no longer changes
+FINAL_STATUSES = frozenset({"SUCCESS", "SUCCESSFUL", "FAILED", "REVERSED", "CANCELLED", "DECLINED"})
+
+
+def timestamp(value) -> Optional[float]:
+    """epoch seconds of an ISO 8601 date or timestamp, UTC unless it says otherwise"""
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class TransactionMirror:
+    """
+    Local, indexed SQLite mirror of ``Transactions.get_all_transactions``.
+
+    :meth:`sync` pages through the transactions newest first and stops once a page is
+    older than the cursor (the newest ``created_at`` mirrored) minus ``lookback``.
+    Transactions are stored once by ``id``; ones seen again with a different body
+    (usually a status change) are updated. ``lookback`` is how far back status
+    changes are picked up by a sync; :meth:`get_transaction` refreshes older,
+    still pending ones on demand.
+
+    :param transactions: the ``Transactions`` resource.
+    :param path: database file, created when missing.
+    :param page_size: transactions requested per page.
+    :param lookback: seconds before the cursor that every sync fetches again.
+
+    Usage:
+    >>> from maplerad_python.mirror import TransactionMirror
+    >>> mirror = TransactionMirror(auth.transactions(), "transactions.db")
+    >>> mirror.sync()
+    {'added': 42, 'updated': 3}
+    >>> mirror.get("trx_ref_123")
+    """
+
+    def __init__(
+        self, transactions, path, page_size: int = 100, lookback: float = 24 * 3600,
+        timeout: float = 10.0,
+    ):
+        self.transactions = transactions
+        self.path = os.fspath(path)
+        self.page_size = page_size
+        self.lookback = lookback
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            for statement in SCHEMA:
+                self._connection.execute(statement)
+
+    def cursor(self) -> Optional[float]:
+        """epoch seconds of the newest mirrored transaction"""
+        with self._lock:
+            row = self._connection.execute("SELECT created_ts FROM cursor").fetchone()
+        return row[0] if row else None
+
+    def sync(self) -> dict:
+        """
+        Fetch what changed since the last sync.
+
+        :return: ``{"added": n, "updated": n}``.
+        """
+        cursor = self.cursor()
+        stop = cursor - self.lookback if cursor is not None else None
+        newest = cursor
+        counts = {"added": 0, "updated": 0}
+        seen = set()
+
+        def fetch(page):
+            return self.transactions.get_all_transactions({"page": page, "page_size": self.page_size})
+
+        for response in iter_pages(fetch, self.page_size, prefetch=False):
+            rows = [row for row in response.json().get("data") or () if row.get("id")]
+            added, updated = self.store(rows)
+            counts["added"] += added
+            counts["updated"] += updated
+            stamps = [ts for ts in (timestamp(row.get("created_at")) for row in rows) if ts is not None]
+            if stamps:
+                newest = max(newest or stamps[0], max(stamps))
+                if stop is not None and min(stamps) < stop:
+                    break
+            # an API ignoring page and page_size returns everything on every page
+            fresh = {row["id"] for row in rows} - seen
+            if len(rows) > self.page_size or not fresh:
+                break
+            seen |= fresh
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cursor (id, created_ts, synced_at) VALUES (1, ?, ?)",
+                (newest, time.time()),
+            )
+        return counts
+
+    def store(self, rows) -> tuple:
+        """insert new transactions and update changed ones, :return: ``(added, updated)``"""
+        if not rows:
+            return 0, 0
+        now = time.time()
+        with self._lock:
+            db = self._connection
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                ids = [row["id"] for row in rows]
+                known = dict(db.execute(
+                    "SELECT id, raw FROM transactions WHERE id IN (%s)" % ", ".join("?" * len(ids)),
+                    ids,
+                ).fetchall())
+                added = updated = 0
+                values = []
+                for row in rows:
+                    raw = json.dumps(row, sort_keys=True)
+                    if row["id"] not in known:
+                        added += 1
+                    elif known[row["id"]] != raw:
+                        updated += 1
+                    else:
+                        continue
+                    known[row["id"]] = raw
+                    values.append((
+                        row["id"], row.get("reference"), row.get("status"), row.get("currency"),
+                        row.get("amount"), timestamp(row.get("created_at")), raw, now,
+                    ))
+                db.executemany(
+                    "INSERT OR REPLACE INTO transactions (id, reference, status, currency, "
+                    "amount, created_ts, raw, synced_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return added, updated
+
+    def get(self, id_or_reference: str) -> Optional[Transaction]:
+        """the mirrored transaction with this ID or reference, without calling the API"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT raw FROM transactions WHERE id = ? UNION ALL "
+                "SELECT raw FROM transactions WHERE reference = ? LIMIT 1",
+                (id_or_reference, id_or_reference),
+            ).fetchone()
+        return Transaction(json.loads(row[0])) if row else None
+
+    def get_transaction(self, id_or_reference: str):
+        """
+        Drop-in for ``Transactions.get_transaction``: served from the mirror when the
+        transaction is there in a final status, otherwise fetched and mirrored.
+
+        :return: ApiResponse whose ``data`` is a Transaction.
+        """
+        local = self.get(id_or_reference)
+        if local is not None and local.status in FINAL_STATUSES:
+            body = {"status": True, "message": "served from local mirror", "data": local.to_dict()}
+            return ApiResponse(200, json.dumps(body).encode()).typed(Transaction)
+        response = self.transactions.get_transaction(id_or_reference)
+        data = response.json().get("data") if response.ok else None
+        if isinstance(data, dict) and data.get("id"):
+            self.store([data])
+        return response
+
+    def find(
+        self,
+        status: Optional[str] = None,
+        currency: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Transaction]:
+        """mirrored transactions, newest first; ``since``/``until`` are ISO dates or timestamps"""
+        clauses, values = [], []
+        for clause, value in (
+            ("status = ?", status),
+            ("currency = ?", currency),
+            ("created_ts >= ?", timestamp(since)),
+            ("created_ts < ?", timestamp(until)),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                values.append(value)
+        query = "SELECT raw FROM transactions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_ts DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            values.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, values).fetchall()
+        return [Transaction(json.loads(raw)) for raw, in rows]
+
+    def close(self):
+        self._connection.close()
@@ -35,18 +35,21 @@
 """
 
 
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
 
 
 class Misc:
     def __init__(self, request) -> None:
-        self.session = request
+        self.request = request
 
 
-    def get_currencies(self):
+    def get_currencies(self, refresh: bool = False):
         """
         Get all currencies.
 
-        :return: Response object from the API.
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -56,21 +59,19 @@ class Misc:
         """
         try:
             endpoint = "/currencies"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, cache="currencies", refresh=refresh)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def get_countries(self):
+    def get_countries(self, refresh: bool = False):
         """
         Get all countries.
 
-        :return: Response object from the API.
+        :param refresh: bypass the cache and fetch fresh data.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -80,22 +81,19 @@ class Misc:
         """
         try:
             endpoint = "/countries"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, cache="countries", refresh=refresh)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def credit_test_wallet(self, payload: dict):
         """
         Credit the test wallet.
 
         :param payload: Payload for crediting the test wallet.
-        :return: Response object from the API.
+        :return: ApiResponse from the API.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -111,10 +109,7 @@ class Misc:
             endpoint = "/test/wallet/credit"
             response = self.request("GET", endpoint, json=payload)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
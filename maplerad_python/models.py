@@ -0,0 +1,369 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import json
+from collections.abc import Sequence
+
+
+_UNDECODED = object()
+
+
+class Field:
+    """
+    Attribute of a :class:`Model`, read from the raw API object on access.
+
+    :param key: key in the API object, defaults to the attribute name.
+    """
+
+    __slots__ = ("name", "key")
+
+    def __init__(self, key=None):
+        self.key = key
+        self.name = key
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        if self.key is None:
+            self.key = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._raw.get(self.key)
+
+
+class Model:
+    """
+    Slotted, typed view over one API object.
+
+    Fields are looked up in the decoded dict only when accessed, so wrapping an
+    object costs one small allocation. Item access (``card["id"]``) keeps working
+    for code written against plain dicts.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw):
+        self._raw = raw if raw is not None else {}
+
+    def __getitem__(self, key):
+        return self._raw[key]
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def get(self, key, default=None):
+        return self._raw.get(key, default)
+
+    def to_dict(self):
+        return self._raw
+
+    def __eq__(self, other):
+        if isinstance(other, Model):
+            return type(self) is type(other) and self._raw == other._raw
+        return NotImplemented
+
+    def __repr__(self):
+        ident = self._raw.get("id") or self._raw.get("reference")
+        return f"<{type(self).__name__} {ident}>" if ident else f"<{type(self).__name__}>"
+
+
+class ModelList(Sequence):
+    """
+    List of API objects that wraps items into models only when they are read,
+    so a large page does not allocate one model per row up front.
+    """
+
+    __slots__ = ("_items", "_model")
+
+    def __init__(self, items, model):
+        self._items = items
+        self._model = model
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ModelList(self._items[index], self._model)
+        return self._model(self._items[index])
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        model = self._model
+        for item in self._items:
+            yield model(item)
+
+    def to_list(self):
+        return self._items
+
+    def __repr__(self):
+        return f"<ModelList of {len(self._items)} {self._model.__name__}>"
+
+
+class ApiResponse:
+    """
+    Response returned by every resource method.
+
+    The body is kept as bytes and decoded once, the first time ``json()``,
+    ``data``, ``status``, ``message``, ``meta`` or item access needs it. Checking
+    ``status_code`` or ``ok`` never decodes anything.
+
+    ``data`` is wrapped in the response's model (:class:`Card`, :class:`Transfer`...),
+    or a :class:`ModelList` of them for list endpoints.
+
+    Usage:
+    >>> result = auth.issuing().get_card(card_id)
+    >>> if result.ok:
+    ...     print(result.data.masked_pan, result.data.status)
+    >>> result["data"]["id"]   # dict style access still works
+    """
+
+    __slots__ = ("status_code", "headers", "url", "content", "model", "_loads", "_body")
+
+    def __init__(self, status_code, content=b"", headers=None, url=None, model=None, loads=None):
+        self.status_code = status_code
+        self.content = content or b""
+        self.headers = headers if headers is not None else {}
+        self.url = url
+        self.model = model
+        self._loads = loads or json.loads
+        self._body = _UNDECODED
+
+    @classmethod
+    def from_response(cls, response, model=None, loads=None):
+        """build from a ``requests`` or ``httpx`` response"""
+        return cls(
+            response.status_code,
+            response.content,
+            response.headers,
+            str(response.url),
+            model,
+            loads,
+        )
+
+    def copy(self):
+        """an independent copy, decoded again on first access"""
+        return type(self)(
+            self.status_code, self.content, self.headers, self.url, self.model, self._loads
+        )
+
+    def typed(self, model):
+        """return this response with ``data`` wrapped in ``model``"""
+        self.model = model
+        return self
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        """the decoded body, decoded on first call and cached"""
+        body = self._body
+        if body is _UNDECODED:
+            body = self._body = self._loads(self.content) if self.content else None
+        return body
+
+    def _field(self, key):
+        body = self.json()
+        return body.get(key) if isinstance(body, dict) else None
+
+    @property
+    def status(self):
+        return self._field("status")
+
+    @property
+    def message(self):
+        return self._field("message")
+
+    @property
+    def meta(self):
+        return self._field("meta")
+
+    @property
+    def data(self):
+        data = self._field("data")
+        if self.model is None or data is None:
+            return data
+        if isinstance(data, list):
+            return ModelList(data, self.model)
+        if isinstance(data, dict):
+            return self.model(data)
+        return data
+
+    def __getitem__(self, key):
+        return self.json()[key]
+
+    def __contains__(self, key):
+        body = self.json()
+        return isinstance(body, dict) and key in body
+
+    def get(self, key, default=None):
+        body = self.json()
+        return body.get(key, default) if isinstance(body, dict) else default
+
+    def __repr__(self):
+        return f"<ApiResponse [{self.status_code}]>"
+
+
+class Customer(Model):
+    __slots__ = ()
+    id: str = Field()
+    first_name: str = Field()
+    last_name: str = Field()
+    middle_name: str = Field()
+    email: str = Field()
+    country: str = Field()
+    status: str = Field()
+    tier: int = Field()
+    phone: dict = Field()
+    address: dict = Field()
+    identity: dict = Field()
+    created_at: str = Field()
+    updated_at: str = Field()
+
+
+class Card(Model):
+    __slots__ = ()
+    id: str = Field()
+    name: str = Field()
+    masked_pan: str = Field()
+    expiry: str = Field()
+    type: str = Field()
+    issuer: str = Field()
+    currency: str = Field()
+    status: str = Field()
+    balance: int = Field()
+    balance_updated_at: str = Field()
+    auto_approve: bool = Field()
+    address: dict = Field()
+    created_at: str = Field()
+    updated_at: str = Field()
+
+
+class Transaction(Model):
+    __slots__ = ()
+    id: str = Field()
+    reference: str = Field()
+    type: str = Field()
+    entry: str = Field()
+    status: str = Field()
+    amount: int = Field()
+    fee: int = Field()
+    currency: str = Field()
+    description: str = Field()
+    summary: dict = Field()
+    created_at: str = Field()
+    updated_at: str = Field()
+
+
+class Transfer(Model):
+    __slots__ = ()
+    id: str = Field()
+    reference: str = Field()
+    status: str = Field()
+    amount: int = Field()
+    fee: int = Field()
+    currency: str = Field()
+    reason: str = Field()
+    account_number: str = Field()
+    account_name: str = Field()
+    bank_code: str = Field()
+    meta: dict = Field()
+    created_at: str = Field()
+    updated_at: str = Field()
+
+
+class Wallet(Model):
+    __slots__ = ()
+    id: str = Field()
+    currency: str = Field()
+    available_balance: int = Field()
+    ledger_balance: int = Field()
+    disabled: bool = Field()
+    created_at: str = Field()
+    updated_at: str = Field()
+
+
+class Quote(Model):
+    __slots__ = ()
+    reference: str = Field()
+    rate: float = Field()
+    fee: int = Field()
+    source: dict = Field()
+    target: dict = Field()
+    expiry: str = Field()
+    created_at: str = Field()
+
+
+class Counterparty(Model):
+    __slots__ = ()
+    id: str = Field()
+    name: str = Field()
+    account_number: str = Field()
+    bank_code: str = Field()
+    currency: str = Field()
+    blacklisted: bool = Field()
+    created_at: str = Field()
+
+
+class VirtualAccount(Model):
+    __slots__ = ()
+    id: str = Field()
+    account_number: str = Field()
+    account_name: str = Field()
+    bank_name: str = Field()
+    currency: str = Field()
+    customer_id: str = Field()
+    created_at: str = Field()
+
+
+class Institution(Model):
+    __slots__ = ()
+    code: str = Field()
+    name: str = Field()
+    type: str = Field()
+    country: str = Field()
+    currency: str = Field()
+
+
+class ResolvedAccount(Model):
+    __slots__ = ()
+    account_number: str = Field()
+    account_name: str = Field()
+    bank_code: str = Field()
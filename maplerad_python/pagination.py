@@ -0,0 +1,253 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .exceptions import APIError
+
+
+def page_count(response, page_size):
+    """
+    Number of pages reported by a list response, or ``None`` when the API did not say.
+    """
+    meta = response.meta or {}
+    for key in ("page_count", "total_pages", "last_page"):
+        if meta.get(key) is not None:
+            return int(meta[key])
+    total = total_count(response)
+    if total is not None:
+        return max(1, -(-total // page_size))
+    return None
+
+
+def total_count(response):
+    """number of rows reported by a list response, or ``None``"""
+    meta = response.meta or {}
+    for key in ("total", "total_count", "count"):
+        if meta.get(key) is not None:
+            return int(meta[key])
+    return None
+
+
+def is_last_page(response, page, page_size, seen=None):
+    """
+    Whether ``page`` is the last one.
+
+    What ``meta`` reports wins over a short page, since a server may cap the page
+    size below the one asked for; the row count is only used when it says nothing.
+
+    :param seen: rows received so far, this page included, checked against a reported total.
+    """
+    rows = response.data or ()
+    if not rows:
+        return True
+    meta = response.meta or {}
+    for key in ("page_count", "total_pages", "last_page"):
+        if meta.get(key) is not None:
+            return page >= int(meta[key])
+    total = total_count(response)
+    if total is not None and seen is not None:
+        return seen >= total
+    return len(rows) < page_size
+
+
+def checked(response, page):
+    if not response.ok:
+        raise APIError(f"page {page} failed with {response.status_code}: {response.message}")
+    return response
+
+
+def iter_pages(fetch, page_size, start_page=1, prefetch=True):
+    """
+    Walk a paginated endpoint lazily, one ``ApiResponse`` per page.
+
+    :param fetch: callable taking a page number and returning that page's ``ApiResponse``.
+    :param page_size: rows requested per page, used to detect the last page.
+    :param prefetch: request the next page in a background thread while the
+        current one is being consumed. At most two pages are held in memory.
+    """
+    page = start_page
+    seen = (start_page - 1) * page_size
+    if not prefetch:
+        while True:
+            response = checked(fetch(page), page)
+            seen += len(response.data or ())
+            yield response
+            if is_last_page(response, page, page_size, seen):
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maplerad-prefetch")
+    try:
+        pending = executor.submit(fetch, page)
+        while True:
+            response = checked(pending.result(), page)
+            seen += len(response.data or ())
+            last = is_last_page(response, page, page_size, seen)
+            if not last:
+                pending = executor.submit(fetch, page + 1)
+            yield response
+            if last:
+                return
+            page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_pages_concurrent(fetch, page_size, concurrency=4, start_page=1):
+    """
+    Fetch the first page, then the remaining ones concurrently, yielding pages in order.
+
+    The page count comes from the first page's ``meta``; when the API does not
+    report one this falls back to :func:`iter_pages` with prefetching. At most
+    ``concurrency`` requests are in flight and at most ``concurrency`` finished
+    pages wait to be consumed.
+
+    :param fetch: callable taking a page number and returning that page's ``ApiResponse``.
+    :param concurrency: maximum number of pages requested at the same time.
+    """
+    first = checked(fetch(start_page), start_page)
+    yield first
+    served = len(first.data or ())
+    if is_last_page(first, start_page, page_size, (start_page - 1) * page_size + served):
+        return
+    # the first page is full, at the size the server actually serves
+    pages = page_count(first, served)
+    if pages is None:
+        yield from iter_pages(fetch, page_size, start_page + 1, prefetch=True)
+        return
+
+    remaining = iter(range(start_page + 1, pages + 1))
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="maplerad-page")
+    try:
+        window = deque()
+        for page in remaining:
+            window.append((page, executor.submit(fetch, page)))
+            if len(window) >= concurrency:
+                break
+        while window:
+            page, future = window.popleft()
+            next_page = next(remaining, None)
+            if next_page is not None:
+                window.append((next_page, executor.submit(fetch, next_page)))
+            yield checked(future.result(), page)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(fetch, page_size, start_page=1, prefetch=True, concurrency=1):
+    """
+    Like :func:`iter_pages`, yielding the rows of every page.
+
+    With ``concurrency`` above 1 the pages after the first are fetched in
+    parallel through :func:`iter_pages_concurrent`.
+    """
+    if concurrency > 1:
+        pages = iter_pages_concurrent(fetch, page_size, concurrency, start_page)
+    else:
+        pages = iter_pages(fetch, page_size, start_page, prefetch)
+    for response in pages:
+        yield from response.data or ()
+
+
+async def aiter_pages(fetch, page_size, start_page=1, prefetch=True):
+    """asyncio flavour of :func:`iter_pages`, ``fetch`` returns a coroutine"""
+    import asyncio
+
+    page = start_page
+    seen = (start_page - 1) * page_size
+    pending = asyncio.ensure_future(fetch(page))
+    try:
+        while True:
+            response = checked(await pending, page)
+            seen += len(response.data or ())
+            last = is_last_page(response, page, page_size, seen)
+            if not last:
+                pending = asyncio.ensure_future(fetch(page + 1)) if prefetch else None
+            yield response
+            if last:
+                return
+            page += 1
+            if pending is None:
+                pending = asyncio.ensure_future(fetch(page))
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+async def aiter_pages_concurrent(fetch, page_size, concurrency=4, start_page=1):
+    """asyncio flavour of :func:`iter_pages_concurrent`"""
+    import asyncio
+
+    first = checked(await fetch(start_page), start_page)
+    yield first
+    served = len(first.data or ())
+    if is_last_page(first, start_page, page_size, (start_page - 1) * page_size + served):
+        return
+    # the first page is full, at the size the server actually serves
+    pages = page_count(first, served)
+    if pages is None:
+        async for response in aiter_pages(fetch, page_size, start_page + 1, prefetch=True):
+            yield response
+        return
+
+    remaining = iter(range(start_page + 1, pages + 1))
+    window = deque()
+    try:
+        for page in remaining:
+            window.append((page, asyncio.ensure_future(fetch(page))))
+            if len(window) >= concurrency:
+                break
+        while window:
+            page, task = window.popleft()
+            next_page = next(remaining, None)
+            if next_page is not None:
+                window.append((next_page, asyncio.ensure_future(fetch(next_page))))
+            yield checked(await task, page)
+    finally:
+        for _, task in window:
+            task.cancel()
+
+
+async def aiter_items(fetch, page_size, start_page=1, prefetch=True, concurrency=1):
+    """asyncio flavour of :func:`iter_items`"""
+    if concurrency > 1:
+        pages = aiter_pages_concurrent(fetch, page_size, concurrency, start_page)
+    else:
+        pages = aiter_pages(fetch, page_size, start_page, prefetch)
+    async for response in pages:
+        for row in response.data or ():
+            yield row
@@ -0,0 +1,221 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import json
+import os
+import threading
+import time
+from typing import Iterable, Union
+
+from requests.exceptions import RequestException
+
+from .bulk import API_ERROR, SKIPPED, TRANSPORT_ERROR, BulkResult, run_bulk
+from .exceptions import PostException
+
+
+SUBMITTING = "submitting"
+DONE = "done"
+FAILED = "failed"
+THROTTLED = "throttled"
+
+
+class PayoutJournal:
+    """
+    Append-only NDJSON journal of payout states, keyed by transfer reference.
+
+    Each line is ``{"reference", "state", "at", ...}``; the last line for a reference wins.
+    ``submitting`` is written before a transfer is sent, so after a crash every
+    reference still in that state is known to be in doubt.
+
+    :param path: journal file, created when missing.
+    :param fsync: force every record to disk, surviving power loss as well as crashes.
+    """
+
+    def __init__(self, path, fsync: bool = True):
+        self.path = os.fspath(path)
+        self.fsync = fsync
+        self.states = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a crash
+                    self.states[entry["reference"]] = entry
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def get(self, reference):
+        return self.states.get(reference)
+
+    def record(self, reference, state, **fields):
+        entry = dict(fields, reference=reference, state=state, at=time.time())
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.states[reference] = entry
+
+    def close(self):
+        self._file.close()
+
+
+def read_ndjson(path):
+    with open(path, encoding="utf-8") as source:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+
+class PayoutEngine:
+    """
+    Resumable, concurrent batch payouts through ``Transfers``.
+
+    Every payout needs a unique ``reference``. Its progress is journaled on disk,
+    so running the same batch again after a crash:
+
+    - skips payouts already accepted by the API (and, unless ``retry_failed``, rejected ones);
+    - looks up payouts that were in flight with ``get_transfer(reference)`` and only
+      resubmits them when the API does not know the reference;
+    - submits everything else.
+
+    Payouts whose outcome stays unknown (network error, 5xx) are left in doubt in
+    the journal and reported as ``transport_error``; the next run re-checks them
+    before anything is resent, so a payout is never sent twice.
+
+    :param transfers: a ``Transfers`` resource.
+    :param journal: journal path or a :class:`PayoutJournal`.
+    :param max_workers: transfers in flight at the same time.
+    :param retry_failed: resubmit payouts the API rejected in a previous run.
+    :param progress: optional ``progress(done, total, result)`` callback.
+
+    Usage:
+    >>> from maplerad_python import Authenticate
+    >>> from maplerad_python.payouts import PayoutEngine
+    >>> auth = Authenticate(secret_key,"DEVELOPMENT")
+    >>> engine = PayoutEngine(auth.transfer(), "payouts-2023-07.journal", max_workers=16)
+    >>> report = engine.run("payouts-2023-07.ndjson")
+    >>> report.counts()
+    {'success': 9985, 'api_error': 12, 'transport_error': 3, 'skipped': 0}
+    """
+
+    def __init__(self, transfers, journal, max_workers: int = 8, retry_failed: bool = False, progress=None):
+        self.transfers = transfers
+        self.journal = journal if isinstance(journal, PayoutJournal) else PayoutJournal(journal)
+        self.max_workers = max_workers
+        self.retry_failed = retry_failed
+        self.progress = progress
+        self._claimed = set()
+        self._lock = threading.Lock()
+
+    def run(self, payouts: Union[str, os.PathLike, Iterable[dict]]):
+        """
+        Submit a batch.
+
+        :param payouts: iterable of transfer payloads, or the path of an NDJSON file of them.
+        :return: BulkReport in input order.
+        """
+        if isinstance(payouts, (str, os.PathLike)):
+            payouts = read_ndjson(payouts)
+        return run_bulk(self.pay, payouts, max_workers=self.max_workers, progress=self.progress)
+
+    def send(self, payload):
+        scheme = (payload.get("meta") or {}).get("scheme")
+        if scheme == "DOM":
+            return self.transfers.dom_transfer(payload)
+        if scheme == "CASHPICKUP":
+            return self.transfers.cash_pickup_transfer(payload)
+        return self.transfers.naira_transfer(payload)
+
+    def pay(self, payload):
+        reference = payload.get("reference")
+        if not reference:
+            error = ValueError("every payout needs a unique 'reference'")
+            return BulkResult(None, payload, API_ERROR, error=error)
+        with self._lock:
+            if reference in self._claimed:
+                return BulkResult(None, payload, SKIPPED)
+            self._claimed.add(reference)
+        try:
+            result = self._pay(reference, payload)
+        except BaseException:
+            with self._lock:
+                self._claimed.discard(reference)
+            raise
+        if not isinstance(result, BulkResult) and result.status_code == 429:
+            # nothing landed; let run_bulk's retry of this payout through
+            with self._lock:
+                self._claimed.discard(reference)
+        return result
+
+    def _pay(self, reference, payload):
+        entry = self.journal.get(reference) or {}
+        state = entry.get("state")
+        if state == DONE or (state == FAILED and not self.retry_failed):
+            return BulkResult(None, payload, SKIPPED)
+
+        if state == SUBMITTING:
+            try:
+                found = self.transfers.get_transfer(reference)
+            except (PostException, RequestException) as error:
+                return BulkResult(None, payload, TRANSPORT_ERROR, error=error)
+            if found.ok:
+                self.journal.record(reference, DONE, transfer_id=_transfer_id(found), recovered=True)
+                return BulkResult(None, payload, SKIPPED, response=found)
+            if found.status_code != 404:
+                return BulkResult(None, payload, TRANSPORT_ERROR, response=found)
+
+        self.journal.record(reference, SUBMITTING)
+        response = self.send(payload)
+        if response.ok:
+            self.journal.record(reference, DONE, transfer_id=_transfer_id(response))
+        elif response.status_code == 429:
+            self.journal.record(reference, THROTTLED)
+        elif response.status_code < 500:
+            self.journal.record(reference, FAILED, status_code=response.status_code, message=response.message)
+        else:
+            return BulkResult(None, payload, TRANSPORT_ERROR, response=response)
+        return response
+
+    def close(self):
+        self.journal.close()
+
+
+def _transfer_id(response):
+    data = response.get("data")
+    return data.get("id") if isinstance(data, dict) else None
@@ -0,0 +1,192 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class MemoryBackend:
+    """
+    Token buckets held in process memory, shared by every thread of the process.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        """
+        Take ``tokens`` from the bucket ``key``.
+
+        :return: 0 when the tokens were taken, otherwise the seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            level, updated = self._buckets.get(key, (capacity, now))
+            level = min(capacity, level + (now - updated) * rate)
+            if level >= tokens:
+                self._buckets[key] = (level - tokens, now)
+                return 0.0
+            self._buckets[key] = (level, now)
+            return (tokens - level) / rate
+
+
+class SQLiteBackend:
+    """
+    Token buckets stored in a SQLite file, so several processes on one host
+    (gunicorn workers, celery children...) draw from one shared budget.
+
+    :param path: database file, created when missing. Every process must use the same path.
+    """
+
+    def __init__(self, path: str, timeout: float = 10.0):
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, level REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def take(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        with self._lock:
+            db = self._connection
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = db.execute(
+                    "SELECT level, updated FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                level, updated = row if row else (capacity, now)
+                level = min(capacity, level + max(0.0, now - updated) * rate)
+                wait = 0.0
+                if level >= tokens:
+                    level -= tokens
+                else:
+                    wait = (tokens - level) / rate
+                db.execute(
+                    "INSERT OR REPLACE INTO buckets (key, level, updated) VALUES (?, ?, ?)",
+                    (key, level, now),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return wait
+
+    def close(self):
+        self._connection.close()
+
+
+class RateLimiter:
+    """
+    Client side token-bucket rate limiter, keyed per endpoint family.
+
+    The family of a request is the first segment of its path, so ``/issuing/{id}/fund``
+    belongs to ``issuing`` and ``/transfers`` to ``transfers``.
+
+    :param limits: {family: (requests_per_second, burst)}.
+    :param default: (requests_per_second, burst) for families missing from ``limits``,
+        ``None`` leaves them unlimited.
+    :param backend: ``MemoryBackend()`` (per process, the default) or ``SQLiteBackend(path)``
+        (shared by every process using the same file).
+
+    Usage::
+        >>> from maplerad_python.auth import Authenticate
+        >>> from maplerad_python.ratelimit import RateLimiter, SQLiteBackend
+        >>> limiter = RateLimiter(
+                {"issuing": (5, 10), "transfers": (2, 5)},
+                default=(20, 40),
+                backend=SQLiteBackend("/tmp/maplerad-ratelimit.db"),
+            )
+        >>> auth = Authenticate(secret_key, "DEVELOPMENT", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        default: Optional[Tuple[float, float]] = None,
+        backend=None,
+    ):
+        self.limits = dict(limits or {})
+        self.default = default
+        self.backend = backend if backend is not None else MemoryBackend()
+
+    @staticmethod
+    def family(path: str) -> str:
+        return path.split("?", 1)[0].strip("/").split("/", 1)[0]
+
+    def limit_for(self, path: str):
+        family = self.family(path)
+        return family, self.limits.get(family, self.default)
+
+    def acquire(self, path: str, tokens: float = 1) -> float:
+        """
+        Block until the family of ``path`` has budget for the request.
+
+        :return: total seconds spent waiting.
+        """
+        family, limit = self.limit_for(path)
+        if limit is None:
+            return 0.0
+        rate, burst = limit
+        waited = 0.0
+        while True:
+            wait = self.backend.take(family, rate, burst, tokens)
+            if not wait:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, path: str, tokens: float = 1) -> float:
+        """asyncio flavour of :meth:`acquire`, sleeps without blocking the loop"""
+        family, limit = self.limit_for(path)
+        if limit is None:
+            return 0.0
+        rate, burst = limit
+        waited = 0.0
+        while True:
+            wait = self.backend.take(family, rate, burst, tokens)
+            if not wait:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
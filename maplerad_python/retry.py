@@ -0,0 +1,157 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import random
+from typing import Iterable, Mapping, Optional
+
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, a total time budget and ``Retry-After`` support.
+
+    :param max_attempts: total number of tries, including the first one.
+    :param backoff_factor: delay in seconds before the first retry, doubled on every retry.
+    :param max_backoff: upper bound on a single computed delay.
+    :param max_elapsed: stop retrying once this many seconds have passed since the first try.
+    :param jitter: ``"full"`` (random delay between 0 and the backoff), ``"equal"``
+        (half fixed, half random) or ``None`` for no jitter.
+    :param retry_statuses: HTTP statuses that are worth another try.
+    :param respect_retry_after: wait as long as the server asks on responses with ``Retry-After``.
+
+    Usage::
+        >>> from maplerad_python.auth import Authenticate
+        >>> from maplerad_python.retry import RetryPolicy
+        >>> auth = Authenticate(
+                secret_key,
+                "DEVELOPMENT",
+                retry_policy=RetryPolicy(max_attempts=5, max_elapsed=20),
+                method_retry_policies={"PATCH": RetryPolicy(max_attempts=2)},
+            )
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_elapsed: float = 60.0,
+        jitter: Optional[str] = "full",
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ):
+        if jitter not in ("full", "equal", None):
+            raise ValueError("jitter must be 'full', 'equal' or None")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """delay before retrying after the given (1-based) attempt"""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        if self.jitter == "equal":
+            return delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+    def retries_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def next_delay(
+        self, attempt: int, elapsed: float, headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[float]:
+        """
+        Seconds to sleep before the next try, or ``None`` when the policy is exhausted.
+
+        :param attempt: number of tries made so far.
+        :param elapsed: seconds spent since the first try.
+        :param headers: headers of the failed response, used for ``Retry-After``.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = None
+        if self.respect_retry_after and headers:
+            delay = parse_retry_after(headers.get("Retry-After"))
+        if delay is None:
+            delay = self.backoff(attempt)
+        if elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given either in seconds or as an HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def build_policies(retry_policy, method_retry_policies):
+    """
+    Map each HTTP method to its policy.
+
+    ``retry_policy`` covers the idempotent methods, ``method_retry_policies``
+    overrides or adds policies per method. Methods without a policy are not
+    retried, except when the connection could not be opened at all.
+    """
+    policies = {}
+    if retry_policy is not None:
+        policies.update({method: retry_policy for method in IDEMPOTENT_METHODS})
+    for method, policy in (method_retry_policies or {}).items():
+        policies[method.upper()] = policy
+    return policies
@@ -0,0 +1,121 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import json
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class JSONSerializer:
+    """Standard library ``json``, always available."""
+
+    name = "json"
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """``orjson``, usually the fastest at both encoding and decoding."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS
+        self.loads = orjson.loads
+
+    def dumps(self, obj) -> bytes:
+        return self._dumps(obj, option=self._option)
+
+
+class MsgspecSerializer:
+    """``msgspec.json``, with one reusable encoder and decoder."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder().encode
+        self.loads = msgspec.json.Decoder().decode
+
+
+SERIALIZERS = {
+    "json": JSONSerializer,
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+}
+
+# fastest first, for serializer="auto"
+PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def get_serializer(serializer="auto"):
+    """
+    Resolve a serializer name into an instance.
+
+    :param serializer: ``"auto"`` (fastest installed backend), ``"json"``, ``"orjson"``,
+        ``"msgspec"``, or any object with ``dumps(obj) -> bytes`` and ``loads(data)``.
+        A named backend whose package is missing falls back to ``"auto"``.
+
+    Usage:
+    >>> from maplerad_python.auth import Authenticate
+    >>> auth = Authenticate(secret_key, "DEVELOPMENT", serializer="orjson")
+    >>> auth.serializer.name
+    'orjson'
+    """
+    if not isinstance(serializer, str):
+        return serializer
+    if serializer != "auto":
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"unknown serializer {serializer!r}, pick one of {sorted(SERIALIZERS)}")
+        try:
+            return SERIALIZERS[serializer]()
+        except ImportError:
+            logger.warning("%s is not installed, falling back to the fastest available serializer", serializer)
+    for name in PREFERENCE:
+        try:
+            return SERIALIZERS[name]()
+        except ImportError:
+            continue
+    return JSONSerializer()
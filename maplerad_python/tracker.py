@@ -0,0 +1,253 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from requests.exceptions import RequestException
+
+from .exceptions import PostException
+from .ratelimit import MemoryBackend
+
+
+logger = logging.getLogger(__name__)
+
+#: transfer statuses after which polling stops
+TERMINAL_STATUSES = frozenset({"SUCCESS", "SUCCESSFUL", "FAILED", "REVERSED", "CANCELLED"})
+
+_IDLE = object()
+
+
+class TransferTracker:
+    """
+    Polls many pending transfers from one scheduler until they settle.
+
+    Each transfer is polled again after ``age * age_factor`` seconds, bounded by
+    ``min_interval`` and ``max_interval``: fresh transfers are checked often, old
+    ones rarely. All polls share one budget of ``budget`` requests per second
+    (bursts of ``burst``) and run on ``max_workers`` threads. Failed polls are
+    simply rescheduled.
+
+    Settled transfers are delivered to the ``on_terminal`` callbacks, and to every
+    ``async for`` running over the tracker, which ends once nothing is left to track.
+
+    :param transfers: the ``Transfers`` resource.
+    :param on_terminal: ``on_terminal(transfer)`` called with the settled ``Transfer``.
+
+    Usage:
+    >>> from maplerad_python.tracker import TransferTracker
+    >>> with TransferTracker(auth.transfer(), budget=5, on_terminal=settle) as tracker:
+    ...     for transfer_id in pending_ids:
+    ...         tracker.track(transfer_id)
+    ...     tracker.join()
+
+    >>> async for transfer in tracker:   # from asyncio code
+    ...     print(transfer.id, transfer.status)
+    """
+
+    def __init__(
+        self,
+        transfers,
+        budget: float = 5.0,
+        burst: float = 10.0,
+        min_interval: float = 2.0,
+        max_interval: float = 300.0,
+        age_factor: float = 0.1,
+        max_workers: int = 4,
+        on_terminal: Optional[Callable] = None,
+    ):
+        self.transfers = transfers
+        self.budget = budget
+        self.burst = burst
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.age_factor = age_factor
+        self.max_workers = max_workers
+        self.on_terminal = on_terminal
+        self.polls = 0
+        self._bucket = MemoryBackend()
+        self._tracked = {}
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._subscribers = []
+        self._executor = None
+        self._thread = None
+
+    def interval(self, age: float) -> float:
+        """seconds until the next poll of a transfer ``age`` seconds old"""
+        return min(self.max_interval, max(self.min_interval, age * self.age_factor))
+
+    def track(self, transfer_id: str, on_terminal: Optional[Callable] = None,
+              created: Optional[float] = None):
+        """
+        Start polling ``transfer_id``; tracking an already tracked transfer does nothing.
+
+        :param on_terminal: callback for this transfer only, in addition to the tracker's.
+        :param created: epoch seconds the transfer was created, now by default; drives the backoff.
+        """
+        with self._cond:
+            if transfer_id in self._tracked:
+                return
+            self._tracked[transfer_id] = (created or time.time(), on_terminal)
+            heapq.heappush(self._heap, (time.monotonic(), next(self._sequence), transfer_id))
+            self._cond.notify_all()
+        self.start()
+
+    def untrack(self, transfer_id: str):
+        with self._cond:
+            removed = self._tracked.pop(transfer_id, None) is not None
+            idle = removed and not self._tracked
+            self._cond.notify_all()
+        if idle:
+            for loop, results in list(self._subscribers):
+                loop.call_soon_threadsafe(results.put_nowait, _IDLE)
+
+    def pending(self) -> int:
+        return len(self._tracked)
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._stop.clear()
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="maplerad-tracker")
+                self._thread = threading.Thread(target=self._run, name="maplerad-tracker", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+            self._executor.shutdown(wait=True)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """wait until every tracked transfer settled, :return: False on timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._tracked, timeout)
+
+    def _next_due(self):
+        with self._cond:
+            while not self._stop.is_set():
+                if self._heap:
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        transfer_id = heapq.heappop(self._heap)[2]
+                        if transfer_id in self._tracked:
+                            return transfer_id
+                        continue
+                else:
+                    delay = None
+                self._cond.wait(delay)
+        return None
+
+    def _run(self):
+        while True:
+            transfer_id = self._next_due()
+            if transfer_id is None:
+                return
+            wait = self._bucket.take("polls", self.budget, self.burst)
+            while wait > 0:
+                if self._stop.wait(wait):
+                    return
+                wait = self._bucket.take("polls", self.budget, self.burst)
+            self._executor.submit(self._poll, transfer_id)
+
+    def _poll(self, transfer_id):
+        with self._cond:
+            self.polls += 1
+        try:
+            response = self.transfers.get_transfer(transfer_id)
+            if response.ok and (response.data.status or "").upper() in TERMINAL_STATUSES:
+                self._settle(transfer_id, response.data)
+                return
+        except (PostException, RequestException) as error:
+            logger.debug("polling transfer %s failed: %s", transfer_id, error)
+        except Exception:
+            # e.g. a 200 with an HTML body; the transfer must not silently drop out
+            logger.warning("polling transfer %s failed", transfer_id, exc_info=True)
+        with self._cond:
+            entry = self._tracked.get(transfer_id)
+            if entry is None:
+                return
+            due = time.monotonic() + self.interval(time.time() - entry[0])
+            heapq.heappush(self._heap, (due, next(self._sequence), transfer_id))
+            self._cond.notify_all()
+
+    def _settle(self, transfer_id, transfer):
+        with self._cond:
+            entry = self._tracked.pop(transfer_id, None)
+            idle = not self._tracked
+            self._cond.notify_all()
+        if entry is None:
+            return
+        for callback in (self.on_terminal, entry[1]):
+            if callback is not None:
+                try:
+                    callback(transfer)
+                except Exception:
+                    logger.exception("transfer callback %r failed", callback)
+        for loop, results in list(self._subscribers):
+            loop.call_soon_threadsafe(results.put_nowait, transfer)
+            if idle:
+                loop.call_soon_threadsafe(results.put_nowait, _IDLE)
+
+    async def __aiter__(self):
+        results = asyncio.Queue()
+        subscriber = (asyncio.get_running_loop(), results)
+        self._subscribers.append(subscriber)
+        try:
+            while self._tracked or not results.empty():
+                transfer = await results.get()
+                if transfer is not _IDLE:
+                    yield transfer
+        finally:
+            self._subscribers.remove(subscriber)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
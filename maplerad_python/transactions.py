@@ -3,19 +3,23 @@
 
 
 
-from typing import Optional
+from typing import Dict, Optional
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import Transaction
 
 
 class Transactions:
     def __init__(self, request):
-        self.session = request
+        self.request = request
 
 
-    def get_all_transactions(self):
+    def get_all_transactions(self, params: Optional[Dict[str, str]] = None):
         """
         Get all transactions.
 
-        :return: Response object from the API.
+        :param params: Query parameters such as ``page`` and ``page_size`` (optional).
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -25,22 +29,19 @@ class Transactions:
         """
         try:
             endpoint = "/transactions"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, params=params)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_transaction(self, transaction_id: str):
         """
         Get a specific transaction.
 
         :param transaction_id: The ID or reference of the transaction.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -52,20 +53,17 @@ class Transactions:
             endpoint = f"/transactions/{transaction_id}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def verify_collection_transaction(self, transaction_id: str):
         """
         Verify a collection transaction.
 
         :param transaction_id: The ID or reference of the transaction.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -77,10 +75,7 @@ class Transactions:
             endpoint = f"/transactions/verify/{transaction_id}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
@@ -36,6 +36,9 @@
 
 
 from typing import Optional, Dict
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException, ValidationError
+from .models import Transfer
 
 
 
@@ -43,12 +46,14 @@ class Transfers:
     def __init__(self, request) -> None:
         self.request = request
 
-    def naira_transfer(self, payload: Dict[str, str]):
+    def naira_transfer(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
         """
         Initiate a Naira transfer.
 
         :param payload: Transfer payload.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transfer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -58,22 +63,24 @@ class Transfers:
         """
         try:
             endpoint = "/transfers"
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transfers/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transfer)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def dom_transfer(self, payload: Dict[str, str]):
+    def dom_transfer(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
         """
         Initiate a DOM transfer.
 
         :param payload: Transfer payload.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transfer.
 
         Usage:
         >>> >>> from maplerad_python import Authenticate
@@ -82,26 +89,28 @@ class Transfers:
         >>> result = transfers.dom_transfer(payload)
         """
         if payload["meta"]["scheme"] != "DOM":
-            return "Invalid Scheme type for this method"
+            raise ValidationError("Invalid Scheme type for this method")
 
         try:
             endpoint = "/transfers"
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transfers/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transfer)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
-    def cash_pickup_transfer(self, payload: Dict[str, str]):
+    def cash_pickup_transfer(self, payload: Dict[str, str], idempotency_key: Optional[str] = None):
         """
         Initiate a Cash Pickup transfer.
 
         :param payload: Transfer payload.
-        :return: Response object from the API.
+        :param idempotency_key: stable key of this operation; repeating a call with the
+            same key never moves money twice, see ``Authenticate``.
+        :return: ApiResponse whose ``data`` is a Transfer.
 
         Usage:
         >>> >>> from maplerad_python import Authenticate
@@ -110,26 +119,26 @@ class Transfers:
         >>> result = transfers.cash_pickup_transfer(payload)
         """
         if payload["meta"]["scheme"] != "CASHPICKUP":
-            return "Invalid Scheme type for this method"
+            raise ValidationError("Invalid Scheme type for this method")
 
         try:
             endpoint = "/transfers"
-            response = self.request("POST", endpoint, json=payload)
+            response = self.request(
+                "POST", endpoint, json=payload,
+                lookup="/transfers/", idempotency_key=idempotency_key,
+            )
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transfer)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_transfer(self, transfer_id: str):
         """
         Get details of a specific transfer.
 
         :param transfer_id: The ID of the transfer.
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a Transfer.
 
         Usage:
         >>> >>> from maplerad_python import Authenticate
@@ -141,19 +150,16 @@ class Transfers:
             endpoint = f"/transfers/{transfer_id}"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transfer)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_all_transfers(self):
         """
         Get details of all transfers.
 
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Transfer.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -165,10 +171,7 @@ class Transfers:
             endpoint = "/transfers"
             response = self.request("GET", endpoint)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transfer)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
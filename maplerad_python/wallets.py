@@ -5,18 +5,22 @@
 
 
 from typing import Optional, Dict
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+from .exceptions import PostException
+from .models import Transaction, Wallet
+from .pagination import iter_items
 
 
 class Wallets:
     def __init__(self, request) -> None:
-        self.session = request
+        self.request = request
 
 
     def get_wallets(self):
         """
         Get all wallets.
 
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Wallet.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -26,22 +30,19 @@ class Wallets:
         """
         try:
             endpoint = "/wallets"
-            response = self.request("GET", endpoint)
+            response = self.request("GET", endpoint, conditional=True)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Wallet)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_wallets_history(self, params: Optional[Dict[str, str]] = None):
         """
         Get the history of all wallets.
 
         :param params: Query parameters for filtering the history (optional).
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -53,13 +54,10 @@ class Wallets:
             endpoint = "/wallets/history"
             response = self.request("GET", endpoint, params=params)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
 
     def get_wallets_history_by_currency(
         self, currency_code: str, params: Optional[Dict[str, str]] = None
@@ -69,7 +67,7 @@ class Wallets:
 
         :param currency_code: The currency code.
         :param params: Query parameters for filtering the history (optional).
-        :return: Response object from the API.
+        :return: ApiResponse whose ``data`` is a list of Transaction.
 
         Usage:
         >>> from maplerad_python import Authenticate
@@ -81,10 +79,42 @@ class Wallets:
             endpoint = f"/wallets/{currency_code}/history"
             response = self.request("GET", endpoint, params=params)
 
-            if response.status_code in (200, 201):
-                return response
-            else:
-                return response.json()
+            return response.typed(Transaction)
 
-        except Exception as error:
-            return error
+        except (ConnectionError, ConnectTimeout, HTTPError) as error:
+            raise PostException("Error connecting to maplerad") from error
+
+    def iter_wallets_history(
+        self,
+        params: Optional[Dict[str, str]] = None,
+        currency_code: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        concurrency: int = 1,
+    ):
+        """
+        Iterate over the whole wallet history, walking the pages of ``get_wallets_history``
+        (or ``get_wallets_history_by_currency`` when ``currency_code`` is given).
+
+        :param params: extra filters; paging keys are managed here.
+        :param currency_code: restrict the history to one currency.
+        :param page_size: entries fetched per request.
+        :param prefetch: fetch the next page in the background while the current one is consumed.
+        :param concurrency: once the first page reports the total, fetch up to this many
+            pages in parallel. Entries are still yielded in order.
+        :return: generator of Transaction.
+
+        Usage:
+        >>> from maplerad_python import Authenticate
+        >>> auth = Authenticate(secret_key,"DEVELOPMENT")
+        >>> wallets = auth.wallet()
+        >>> for entry in wallets.iter_wallets_history(currency_code="NGN", concurrency=8):
+        ...     print(entry.amount)
+        """
+        def fetch(page):
+            query = dict(params or {}, page=page, page_size=page_size)
+            if currency_code:
+                return self.get_wallets_history_by_currency(currency_code, query)
+            return self.get_wallets_history(query)
+
+        return iter_items(fetch, page_size, prefetch=prefetch, concurrency=concurrency)
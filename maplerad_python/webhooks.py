@@ -0,0 +1,341 @@
+"""
+    Maplerad API wrapper.
+
+    @author Edwin Ayabie.
+
+    Copyright (c) 2023, Edwin Ayabie. All rights reserved.
+
+    Redistribution and use in source and binary forms, with or without
+    modification, are permitted provided that the following conditions are met:
+
+    1. Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+    2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+    3. Neither the name of the copyright holder nor the names of its contributors
+    may be used to endorse or promote products derived from this software
+    without specific prior written permission.
+
+    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+    AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+    IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+    DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+    FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+    DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+    SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+    CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+    OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+    OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+
+
+import base64
+import fnmatch
+import hashlib
+import hmac
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Mapping, Optional, Tuple
+
+from .exceptions import WebhookVerificationError
+from .models import Card, Field, Model, Transaction, Transfer
+
+
+logger = logging.getLogger(__name__)
+
+#: model of an event's ``data``, by event type prefix
+EVENT_MODELS = (
+    ("transfer", Transfer),
+    ("issuing.created", Card),
+    ("issuing.terminated", Card),
+    ("issuing", Transaction),
+    ("collection", Transaction),
+)
+
+
+class Event(Model):
+    """
+    A webhook event. ``data`` is the event's object wrapped in its model
+    (:class:`Transfer`, :class:`Card`, :class:`Transaction`), chosen from ``event``.
+    """
+
+    __slots__ = ()
+    id: str = Field()
+    event: str = Field()
+    reference: str = Field()
+    status: str = Field()
+    created_at: str = Field()
+
+    @property
+    def type(self) -> str:
+        return self._raw.get("event") or self._raw.get("type") or ""
+
+    @property
+    def data(self):
+        payload = self._raw.get("data", self._raw)
+        for prefix, model in EVENT_MODELS:
+            if self.type.startswith(prefix):
+                return model(payload)
+        return Model(payload)
+
+
+def _secret_bytes(secret: str) -> bytes:
+    if secret.startswith("whsec_"):
+        return base64.b64decode(secret[len("whsec_"):])
+    return secret.encode()
+
+
+def sign(secret: str, message_id: str, timestamp: int, body: bytes) -> str:
+    """the ``svix-signature`` header value for a payload"""
+    signed = b"%s.%d.%s" % (message_id.encode(), timestamp, body)
+    digest = hmac.new(_secret_bytes(secret), signed, hashlib.sha256).digest()
+    return "v1," + base64.b64encode(digest).decode()
+
+
+def verify(secret: str, headers: Mapping[str, str], body: bytes, tolerance: int = 300) -> str:
+    """
+    Check a webhook's Svix signature (the scheme Maplerad delivers webhooks with).
+
+    :param headers: request headers, any case.
+    :param tolerance: maximum age in seconds of the ``svix-timestamp``, against replays.
+    :return: the message id.
+    :raises WebhookVerificationError: missing headers, stale timestamp or bad signature.
+    """
+    headers = {name.lower(): value for name, value in headers.items()}
+    message_id = headers.get("svix-id") or headers.get("webhook-id")
+    stamp = headers.get("svix-timestamp") or headers.get("webhook-timestamp")
+    signatures = headers.get("svix-signature") or headers.get("webhook-signature")
+    if not (message_id and stamp and signatures):
+        raise WebhookVerificationError("missing webhook signature headers")
+    try:
+        timestamp = int(stamp)
+    except ValueError:
+        raise WebhookVerificationError("invalid webhook timestamp")
+    if abs(time.time() - timestamp) > tolerance:
+        raise WebhookVerificationError("webhook timestamp outside the tolerance")
+    expected = sign(secret, message_id, timestamp, body)
+    for signature in signatures.split():
+        if hmac.compare_digest(signature, expected):
+            return message_id
+    raise WebhookVerificationError("webhook signature mismatch")
+
+
+class Dispatcher:
+    """
+    In-process queue handing events to registered handlers.
+
+    A background thread drains the queue in batches of up to ``batch_size`` (waiting
+    at most ``batch_interval`` seconds to fill one) and runs the handlers on a pool of
+    ``max_workers`` threads. A failing handler is logged and does not affect the others.
+
+    Usage:
+    >>> dispatcher = Dispatcher()
+    >>> @dispatcher.on("transfer.*")
+    ... def transfer_changed(event):
+    ...     update_status(event.data.reference, event.data.status)
+    >>> @dispatcher.on("issuing.transaction", batch=True)
+    ... def card_spend(events):
+    ...     bulk_insert(event.data for event in events)
+    """
+
+    def __init__(self, max_workers: int = 4, batch_size: int = 50, batch_interval: float = 0.05,
+                 max_queue: int = 10000):
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.handlers = []
+        self.queue = queue.Queue(maxsize=max_queue)
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="maplerad-webhooks")
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._thread = None
+
+    def on(self, pattern: str = "*", batch: bool = False):
+        """
+        Register a handler for event types matching ``pattern`` (``fnmatch`` style).
+
+        :param batch: call the handler once per batch with a list of events.
+        """
+        def register(handler):
+            self.handlers.append((pattern, batch, handler))
+            return handler
+        return register
+
+    def put(self, event: Event):
+        with self._idle:
+            self._pending += 1
+        self.start()
+        self.queue.put(event)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="maplerad-dispatch", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, events):
+        calls = []
+        for pattern, batch, handler in self.handlers:
+            matched = [event for event in events if fnmatch.fnmatchcase(event.type, pattern)]
+            if not matched:
+                continue
+            if batch:
+                calls.append((handler, matched))
+            else:
+                calls.extend((handler, event) for event in matched)
+        futures = [self._executor.submit(self._call, handler, arg) for handler, arg in calls]
+        for future in futures:
+            future.result()
+        with self._idle:
+            self._pending -= len(events)
+            self._idle.notify_all()
+
+    @staticmethod
+    def _call(handler, arg):
+        try:
+            handler(arg)
+        except Exception:
+            logger.exception("webhook handler %r failed", handler)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """wait until every queued event was handled, :return: False on timeout"""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+
+class WebhookHandler:
+    """
+    Framework agnostic webhook endpoint: verifies, parses, de-duplicates and queues events.
+
+    Mount :meth:`wsgi_app` or :meth:`asgi_app` directly, or call :meth:`handle` from
+    any framework's view and return its status.
+
+    :param secret: the endpoint's signing secret (``whsec_...``).
+    :param dispatcher: where events are queued, a new :class:`Dispatcher` by default.
+    :param tolerance: accepted age of a delivery in seconds.
+    :param remember: delivery ids remembered to drop redelivered events.
+
+    Usage:
+    >>> from maplerad_python.webhooks import WebhookHandler
+    >>> webhooks = WebhookHandler(os.environ["MAPLERAD_WEBHOOK_SECRET"])
+    >>> @webhooks.dispatcher.on("transfer.*")
+    ... def on_transfer(event):
+    ...     print(event.type, event.data.status)
+    >>> app = webhooks.wsgi_app   # e.g. gunicorn module:app
+    """
+
+    def __init__(self, secret: str, dispatcher: Dispatcher = None, tolerance: int = 300,
+                 remember: int = 10000):
+        self.secret = secret
+        self.dispatcher = dispatcher if dispatcher is not None else Dispatcher()
+        self.tolerance = tolerance
+        self.remember = remember
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> Tuple[int, str]:
+        """:return: ``(status, message)`` to answer the delivery with."""
+        try:
+            message_id = verify(self.secret, headers, body, self.tolerance)
+        except WebhookVerificationError as error:
+            return 401, str(error)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, "invalid JSON"
+        if not isinstance(payload, dict):
+            return 400, "invalid event"
+        with self._lock:
+            if message_id in self._seen:
+                return 200, "duplicate"
+            self._seen[message_id] = True
+            if len(self._seen) > self.remember:
+                self._seen.popitem(last=False)
+        self.dispatcher.put(Event(payload))
+        return 202, "accepted"
+
+    def wsgi_app(self, environ, start_response):
+        if environ.get("REQUEST_METHOD") != "POST":
+            status, message = 405, "method not allowed"
+        else:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            body = environ["wsgi.input"].read(length)
+            headers = {
+                key[5:].replace("_", "-"): value
+                for key, value in environ.items() if key.startswith("HTTP_")
+            }
+            status, message = self.handle(body, headers)
+        start_response(f"{status} {_REASONS[status]}", [("Content-Type", "text/plain")])
+        return [message.encode()]
+
+    async def asgi_app(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        if scope["method"] != "POST":
+            status, text = 405, "method not allowed"
+        else:
+            headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+            status, text = self.handle(b"".join(chunks), headers)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain")],
+        })
+        await send({"type": "http.response.body", "body": text.encode()})
+
+    def replay(self, payloads, wait: bool = True) -> list:
+        """
+        Feed recorded events through the endpoint, signed with its secret, for local testing.
+
+        :param payloads: event dicts, or the path of an NDJSON file of them.
+        :param wait: return once the dispatcher handled them.
+        :return: the ``(status, message)`` of every delivery.
+        """
+        if isinstance(payloads, (str, os.PathLike)):
+            with open(payloads, encoding="utf-8") as file:
+                payloads = [json.loads(line) for line in file if line.strip()]
+        results = []
+        for index, payload in enumerate(payloads):
+            body = json.dumps(payload).encode()
+            message_id = "replay_%s_%d" % (payload.get("id", ""), index)
+            timestamp = int(time.time())
+            headers = {
+                "svix-id": message_id,
+                "svix-timestamp": str(timestamp),
+                "svix-signature": sign(self.secret, message_id, timestamp, body),
+            }
+            results.append(self.handle(body, headers))
+        if wait:
+            self.dispatcher.join()
+        return results
+
+
+_REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 401: "Unauthorized", 405: "Method Not Allowed",
+}
@@ -0,0 +1,70 @@
+import json
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from maplerad_python.auth import Authenticate
+
+
+def make_response(request, status=200, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = json.dumps(body if body is not None else {}).encode()
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class StubAdapter(BaseAdapter):
+    """
+    Transport adapter replaying canned results instead of touching the network.
+
+    Each result is a ``(status, body)`` or ``(status, body, headers)`` tuple, an
+    exception to raise, or a callable taking the prepared request. The last
+    result is reused once the others are consumed.
+    """
+
+    def __init__(self, *results):
+        super().__init__()
+        self.results = list(results)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if callable(result) and not isinstance(result, type):
+            result = result(request)
+        if isinstance(result, BaseException):
+            raise result
+        return make_response(request, *result)
+
+    def close(self):
+        pass
+
+
+def query(request):
+    """the request's query parameters, decoded; the last value of a repeated key wins"""
+    return {key: values[-1] for key, values in parse_qs(urlsplit(request.url).query).items()}
+
+
+def paged(request, rows, size_key="page_size"):
+    """answer with the page of ``rows`` the request asks for, reporting the total in ``meta``"""
+    params = query(request)
+    page, size = int(params["page"]), int(params[size_key])
+    return 200, {
+        "status": True,
+        "data": rows[(page - 1) * size:page * size],
+        "meta": {"page": page, "total": len(rows)},
+    }
+
+
+def stub_auth(*results, **options):
+    auth = Authenticate("sk_test", "DEVELOPMENT", **options)
+    adapter = StubAdapter(*results)
+    auth.session.mount("https://", adapter)
+    return auth, adapter
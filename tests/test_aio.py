@@ -0,0 +1,41 @@
+import asyncio
+
+import httpx
+
+from maplerad_python.aio import AsyncAuthenticate
+
+
+def make_auth(handler):
+    auth = AsyncAuthenticate("sk_test", "DEVELOPMENT")
+    auth.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return auth
+
+
+def test_async_resources_share_one_client():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"status": True, "data": {"id": request.url.path}})
+
+    async def run():
+        async with make_auth(handler) as auth:
+            customer = auth.customer()
+            return await asyncio.gather(
+                *(customer.get_customer(str(i)) for i in range(5))
+            )
+
+    results = asyncio.run(run())
+    assert sorted(seen) == sorted(f"/v1/customers/{i}" for i in range(5))
+    assert results[0]["data"]["id"] == "/v1/customers/0"
+
+
+def test_async_issuing_returns_error_body():
+    def handler(request):
+        return httpx.Response(400, json={"status": False, "message": "bad card"})
+
+    async def run():
+        async with make_auth(handler) as auth:
+            return await auth.issuing().get_card("missing")
+
+    assert asyncio.run(run())["message"] == "bad card"
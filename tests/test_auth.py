@@ -0,0 +1,51 @@
+import threading
+
+from maplerad_python.auth import Authenticate
+
+
+def test_pool_settings_reach_the_adapter():
+    auth = Authenticate("sk_test", "DEVELOPMENT", pool_maxsize=32, pool_block=True)
+    adapter = auth.session.get_adapter("https://sandbox.api.maplerad.com")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+    adapter.poolmanager.connection_from_url("https://sandbox.api.maplerad.com")
+    stats = auth.pool_stats()
+    assert stats["sessions"] == 1
+    assert stats["pools"][0]["host"] == "sandbox.api.maplerad.com"
+    assert stats["pools"][0]["maxsize"] == 32
+
+
+def test_thread_local_sessions():
+    auth = Authenticate("sk_test", "DEVELOPMENT", thread_local_sessions=True)
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(auth.session)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert auth.session is auth.session
+    assert len({id(session) for session in sessions + [auth.session]}) == 4
+
+
+def test_keep_alive_can_be_disabled():
+    auth = Authenticate("sk_test", "DEVELOPMENT", keep_alive=False)
+    assert auth.session.headers["Connection"] == "close"
+
+
+def test_resources_and_requests_are_imported_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from maplerad_python import Authenticate\n"
+        "assert 'requests' not in sys.modules\n"
+        "assert 'maplerad_python.customer' not in sys.modules\n"
+        "Authenticate('sk_test', 'DEVELOPMENT').issuing()\n"
+        "assert 'maplerad_python.issuing' in sys.modules\n"
+        "assert 'maplerad_python.customer' not in sys.modules\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "assert 'sqlite3' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,48 @@
+import json
+import threading
+
+from requests.exceptions import ConnectionError
+
+from maplerad_python.retry import RetryPolicy
+
+from .stub import stub_auth
+
+
+def test_fund_cards_reports_every_card():
+    throttled = set()
+    lock = threading.Lock()
+
+    def handler(request):
+        card = request.url.split("/issuing/")[1].split("/")[0]
+        if card == "broken":
+            raise ConnectionError("reset")
+        if card == "empty":
+            return 400, {"status": False, "message": "insufficient balance"}
+        with lock:
+            if card == "busy" and card not in throttled:
+                throttled.add(card)
+                return 429, {}, {"Retry-After": "0"}
+        return 200, {"status": True, "data": {"amount": json.loads(request.body)["amount"]}}
+
+    auth, adapter = stub_auth(handler, retry_policy=RetryPolicy(max_attempts=1))
+    seen = []
+    items = [("c1", 100), {"card_id": "broken", "amount": 5}, ("empty", 7), ("busy", 9), ("c2", 200)]
+    report = auth.issuing().fund_cards(
+        items, max_workers=2, progress=lambda done, total, result: seen.append((done, total))
+    )
+
+    assert [result.item for result in report] == items
+    assert [result.outcome for result in report] == [
+        "success", "transport_error", "api_error", "success", "success"
+    ]
+    assert report[3].response.data["amount"] == 9
+    assert report.counts() == {"success": 3, "api_error": 1, "transport_error": 1}
+    assert sorted(seen) == [(n, 5) for n in range(1, 6)]
+
+
+def test_malformed_items_fail_alone():
+    auth, adapter = stub_auth((200, {"status": True, "data": {}}))
+    report = auth.issuing().fund_cards([("c1", 100), {"card_id": "c2"}, ("c3", 100)])
+    assert [result.outcome for result in report] == ["success", "api_error", "success"]
+    assert isinstance(report[1].error, KeyError)
+    assert len(adapter.requests) == 2
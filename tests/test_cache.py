@@ -0,0 +1,130 @@
+import time
+
+from maplerad_python.cache import ConditionalCache, DiskCache, MemoryCache, TieredCache
+from maplerad_python.models import ApiResponse
+
+from .stub import stub_auth
+
+CURRENCIES = (200, {"status": True, "data": [{"code": "NGN"}, {"code": "USD"}]})
+
+
+def test_reference_data_is_served_from_cache_until_refreshed():
+    auth, adapter = stub_auth(CURRENCIES)
+    misc = auth.misc()
+    first = misc.get_currencies()
+    assert misc.get_currencies() is first
+    assert len(adapter.requests) == 1
+
+    misc.get_currencies(refresh=True)
+    assert len(adapter.requests) == 2
+
+
+def test_cache_key_includes_params_and_skips_errors():
+    auth, adapter = stub_auth((200, {"status": True, "data": []}))
+    institution = auth.institution()
+    institution.get_all_institutions({"country": "NG"})
+    institution.get_all_institutions({"country": "NG"})
+    institution.get_all_institutions({"country": "US"})
+    assert len(adapter.requests) == 2
+
+    auth, adapter = stub_auth((404, {"status": False}))
+    auth.bills().get_airtime_billers("XX")
+    auth.bills().get_airtime_billers("XX")
+    assert len(adapter.requests) == 2
+
+
+def test_ttl_and_disabled_cache():
+    auth, adapter = stub_auth(CURRENCIES, cache_ttls={"countries": 0})
+    auth.misc().get_countries()
+    auth.misc().get_countries()
+    assert len(adapter.requests) == 2
+
+    auth, adapter = stub_auth(CURRENCIES, cache=False)
+    auth.misc().get_currencies()
+    auth.misc().get_currencies()
+    assert len(adapter.requests) == 2
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    expires = time.time() + 60
+    for key in "abc":
+        cache.set(key, ApiResponse(200, b"{}"), expires)
+        if key == "b":
+            cache.get("a")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    path = tmp_path / "cache.db"
+    auth, adapter = stub_auth(CURRENCIES, cache=TieredCache(MemoryCache(), DiskCache(path)))
+    auth.misc().get_currencies()
+
+    auth, adapter = stub_auth(CURRENCIES, cache=TieredCache(MemoryCache(), DiskCache(path)))
+    result = auth.misc().get_currencies()
+    assert adapter.requests == []
+    assert result["data"][1]["code"] == "USD"
+
+    disk = DiskCache(path, max_entries=1)
+    disk.set("other", ApiResponse(200, b"{}"), time.time() + 60)
+    assert disk.get("other") is not None
+    assert len(disk._connection.execute("SELECT key FROM responses").fetchall()) == 1
+
+
+def test_resolve_cache_is_opt_in_with_negative_ttl():
+    found = (200, {"status": True, "data": {"account_name": "ADA LOVELACE"}})
+    auth, adapter = stub_auth(found)
+    auth.institution().resolve_institution({"account_number": "0123456789", "bank_code": "058"})
+    auth.institution().resolve_institution({"account_number": "0123456789", "bank_code": "058"})
+    assert len(adapter.requests) == 2
+
+    auth, adapter = stub_auth(
+        found, (400, {"status": False, "message": "account not found"}),
+        resolve_cache=MemoryCache(max_entries=100), negative_ttls={"resolve": 0},
+    )
+    institution = auth.institution()
+    payload = {"account_number": "0123456789", "bank_code": "058"}
+    result = institution.resolve_institution(payload)
+    assert institution.resolve_institution(dict(reversed(payload.items()))) is result
+    assert len(adapter.requests) == 1
+
+    missing = {"account_number": "9999999999", "bank_code": "058"}
+    institution.resolve_institution(missing)
+    institution.resolve_institution(missing)  # negative answer expired at once
+    assert len(adapter.requests) == 3
+    assert len(auth.cache) == 0
+
+    auth, adapter = stub_auth((404, {"status": False}), resolve_cache=MemoryCache())
+    auth.institution().resolve_institution(missing)
+    auth.institution().resolve_institution(missing)
+    assert len(adapter.requests) == 1
+
+
+def test_conditional_requests_serve_parsed_body_on_304(tmp_path):
+    version = {"etag": '"v1"'}
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == version["etag"]:
+            return 304, {}, {"ETag": version["etag"]}
+        body = {"status": True, "data": [{"id": "w1", "currency": "NGN", "etag": version["etag"]}]}
+        return 200, body, {"ETag": version["etag"]}
+
+    conditional = ConditionalCache(DiskCache(tmp_path / "etags.db"))
+    auth, _ = stub_auth(handler, conditional=conditional)
+    wallets = auth.wallet()
+    first = wallets.get_wallets()
+    first.data  # parsed once
+    second = wallets.get_wallets()
+    assert second.status_code == 200 and second.data[0].id == "w1"
+
+    version["etag"] = '"v2"'
+    third = wallets.get_wallets()
+    assert third["data"][0]["etag"] == '"v2"'
+    assert seen == [None, '"v1"', '"v1"']
+    assert conditional.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+    auth.issuing().get_card("c1")  # not a conditional endpoint
+    assert seen[-1] is None and conditional.stats()["misses"] == 2
@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from maplerad_python.aio import AsyncAuthenticate
+from maplerad_python.circuit import CircuitBreaker, CircuitBreakers, path_template
+from maplerad_python.exceptions import CircuitOpenError
+from maplerad_python.retry import RetryPolicy
+
+from .stub import stub_auth
+
+
+def test_path_template():
+    assert path_template("/issuing/6f1c4a0e/fund") == "/issuing/{id}/fund"
+    assert path_template("/customers?page=1&page_size=10") == "/customers"
+    assert path_template("/customers/upgrade/tier1") == "/customers/upgrade/tier1"
+    assert path_template("/wallets/USD/history") == "/wallets/{id}/history"
+
+
+def test_breaker_opens_probes_and_closes():
+    breaker = CircuitBreaker("/issuing/{id}/fund", failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_endpoint_fails_fast_without_affecting_others():
+    breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+    auth, adapter = stub_auth(
+        (503, {}), retry_policy=RetryPolicy(max_attempts=1), circuit_breakers=breakers
+    )
+    for card in ("a", "b"):
+        assert auth.__request__("POST", f"/issuing/{card}/fund").status_code == 503
+    with pytest.raises(CircuitOpenError):
+        auth.__request__("POST", "/issuing/c/fund")
+    assert len(adapter.requests) == 2
+
+    with pytest.raises(CircuitOpenError):
+        auth.issuing().fund_card("d", 100)
+    assert len(adapter.requests) == 2
+
+    assert auth.__request__("GET", "/customers").status_code == 503
+    assert breakers.states() == {"/issuing/{id}/fund": "open", "/customers": "closed"}
+
+
+def test_cancelled_probe_frees_the_half_open_slot():
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=0.01)
+    slow = True
+
+    async def handler(request):
+        if slow:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"status": True, "data": []})
+
+    async def run():
+        nonlocal slow
+        auth = AsyncAuthenticate("sk_test", "DEVELOPMENT", circuit_breakers=breakers, coalesce_gets=False)
+        auth.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        breakers.for_path("/customers").record_failure()
+        await asyncio.sleep(0.02)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(auth.customer().get_all_customers(), 0.05)
+        slow = False
+        response = await auth.customer().get_all_customers()
+        await auth.client.aclose()
+        return response
+
+    assert asyncio.run(run()).status_code == 200
+    assert breakers.states() == {"/customers": "closed"}
@@ -0,0 +1,106 @@
+import csv
+import json
+import threading
+
+import pytest
+
+from maplerad_python.exceptions import APIError
+from maplerad_python.export import export_card_transactions
+from maplerad_python.retry import RetryPolicy
+
+from .stub import paged, stub_auth
+
+
+def cards_api(cards, per_card, fail_card=None):
+    def handler(request):
+        if request.url.split("?")[0].endswith("/issuing"):
+            return paged(request, [{"id": card} for card in cards])
+        card = request.url.split("/issuing/")[1].split("/")[0]
+        if card == fail_card:
+            return 500, {"status": False, "message": "boom"}
+        rows = [
+            {"id": f"{card}-{i}", "amount": i, "currency": "USD", "summary": {"merchant": "m"}}
+            for i in range(per_card[card])
+        ]
+        return paged(request, rows, size_key="pageSize")
+    return handler
+
+
+def read_ndjson(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+def test_ndjson_export_keeps_cards_contiguous(tmp_path):
+    per_card = {"c1": 25, "c2": 0, "c3": 7}
+    auth, _ = stub_auth(cards_api(list(per_card), per_card))
+    out = tmp_path / "out.ndjson"
+    summary = export_card_transactions(auth.issuing(), out, max_workers=3, page_size=10)
+
+    rows = read_ndjson(out)
+    assert summary == {"cards": 3, "rows": 32}
+    assert [row["card_id"] for row in rows] == ["c1"] * 25 + ["c3"] * 7
+    assert rows[24]["id"] == "c1-24" and rows[0]["summary"] == {"merchant": "m"}
+    assert not (tmp_path / "out.ndjson.checkpoint").exists()
+
+
+def test_resume_skips_done_cards_and_drops_partial_output(tmp_path):
+    per_card = {"c1": 5, "c2": 5, "c3": 5}
+    out = tmp_path / "out.csv"
+    auth, _ = stub_auth(
+        cards_api(list(per_card), per_card, fail_card="c2"), retry_policy=RetryPolicy(max_attempts=1)
+    )
+    with pytest.raises(APIError):
+        export_card_transactions(auth.issuing(), out, format="csv", max_workers=1, page_size=2)
+    assert json.loads((tmp_path / "out.csv.checkpoint").read_text())["done"] == ["c1"]
+    with open(out, "a") as file:
+        file.write("c2,c2-partial\n")  # rows of the card in flight when the run died
+
+    auth, adapter = stub_auth(cards_api(list(per_card), per_card))
+    summary = export_card_transactions(auth.issuing(), out, format="csv", page_size=2)
+    assert summary == {"cards": 3, "rows": 15}
+    assert not any("/issuing/c1/" in request.url for request in adapter.requests)
+
+    with open(out, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["id"] for row in rows] == [f"{card}-{i}" for card in per_card for i in range(5)]
+    assert rows[0]["currency"] == "USD" and "summary" not in rows[0]
+
+
+def test_parquet_export_writes_one_file_per_card(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    per_card = {"c1": 12, "c2": 3}
+    auth, _ = stub_auth(cards_api(list(per_card), per_card))
+    export_card_transactions(auth.issuing(), tmp_path / "out", format="parquet", page_size=5)
+
+    table = pq.read_table(tmp_path / "out" / "card=c1.parquet")
+    assert table.num_rows == 12
+    assert table.column("amount").to_pylist()[-1] == 11
+    assert pq.read_table(tmp_path / "out" / "card=c2.parquet").column("card_id").to_pylist() == ["c2"] * 3
+
+
+def test_every_page_of_cards_is_exported(tmp_path):
+    per_card = {f"c{i}": 1 for i in range(25)}
+    auth, _ = stub_auth(cards_api(list(per_card), per_card))
+    summary = export_card_transactions(auth.issuing(), tmp_path / "out.ndjson", page_size=10)
+    assert summary == {"cards": 25, "rows": 25}
+
+
+def test_failing_card_does_not_hang_on_busy_producers(tmp_path):
+    per_card = {"c1": 1, "c2": 200}
+    auth, _ = stub_auth(
+        cards_api(list(per_card), per_card, fail_card="c1"), retry_policy=RetryPolicy(max_attempts=1)
+    )
+    errors = []
+
+    def export():
+        try:
+            export_card_transactions(auth.issuing(), tmp_path / "out.ndjson", page_size=2, buffered_pages=1)
+        except APIError as error:
+            errors.append(error)
+
+    worker = threading.Thread(target=export, daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert len(errors) == 1
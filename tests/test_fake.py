@@ -0,0 +1,75 @@
+import time
+
+import pytest
+import requests
+
+from maplerad_python.fake import FakeMaplerad, constant
+from maplerad_python.retry import RetryPolicy
+
+
+@pytest.fixture
+def fake():
+    with FakeMaplerad(customers=3, settle_after=0.05, seed=1) as server:
+        yield server
+
+
+def test_base_url_points_the_client_at_the_fake(fake):
+    auth = fake.client()
+    assert auth.base_url == fake.url
+
+    customers = auth.customer().get_all_customers(page_size=2)
+    assert customers.status_code == 200
+    assert len(customers.data) == 2
+    assert requests.get(fake.url + "/customers").status_code == 401
+
+
+def test_cards_transfers_and_quotes_keep_state(fake):
+    auth = fake.client(coalesce_gets=False)
+    customer = auth.customer().create_customer({"first_name": "Ada", "email": "ada@example.com"}).data
+    card = auth.issuing().create_card({"customer_id": customer.id, "currency": "USD", "amount": 500}).json()["data"]
+    auth.issuing().fund_card(card["id"], 1000)
+    assert auth.issuing().withdraw_from_card(card["id"], 5000).status_code == 400
+    assert auth.issuing().get_card(card["id"]).json()["data"]["balance"] == 1500
+    assert len(auth.issuing().get_card_transactions(card["id"], None).json()["data"]) == 1
+
+    sent = auth.transfer().naira_transfer({"amount": 100, "reference": "ref-1", "account_number": "0123456789"})
+    assert sent.json()["data"]["status"] == "PENDING"
+    duplicate = requests.post(fake.url + "/transfers", json={"reference": "ref-1"}, headers={"Authorization": "Bearer sk"})
+    assert duplicate.status_code == 400
+    time.sleep(0.06)
+    assert auth.transfer().get_transfer("ref-1").json()["data"]["status"] == "SUCCESS"
+
+    quote = auth.fx().generate_quote({"source_currency": "USD", "target_currency": "NGN", "amount": 10}).json()["data"]
+    assert auth.fx().exchange_currency(quote["reference"]).status_code in (200, 201)
+    assert auth.fx().exchange_currency(quote["reference"]).status_code == 404
+
+
+def test_injected_faults_and_latency():
+    with FakeMaplerad(throttle_rate=1.0, seed=1) as fake:
+        response = fake.client(retry_policy=RetryPolicy(max_attempts=1)).misc().get_currencies()
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+    with FakeMaplerad(error_rate=1.0, latency=constant(0.05)) as fake:
+        started = time.monotonic()
+        response = requests.get(fake.url + "/currencies", headers={"Authorization": "Bearer sk"})
+        assert response.status_code == 500
+        assert time.monotonic() - started >= 0.05
+        assert fake.requests == 1
+
+
+def test_gets_carry_etags(fake):
+    headers = {"Authorization": "Bearer sk"}
+    first = requests.get(fake.url + "/wallets", headers=headers)
+    again = requests.get(fake.url + "/wallets", headers=dict(headers, **{"If-None-Match": first.headers["ETag"]}))
+    assert again.status_code == 304
+
+
+def test_rejected_debits_leave_no_transaction(fake):
+    headers = {"Authorization": "Bearer sk"}
+    rejected = requests.post(
+        fake.url + "/transfers", json={"amount": 10 ** 15, "reference": "too-big"}, headers=headers
+    )
+    assert rejected.status_code == 400
+    assert requests.get(fake.url + "/transactions/too-big", headers=headers).status_code == 404
+    assert requests.get(fake.url + "/transfers/too-big", headers=headers).status_code == 404
@@ -0,0 +1,85 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+from .stub import stub_auth
+
+
+def fx_api(lifetime=60, expired=()):
+    calls = {"quotes": 0, "exchanges": []}
+
+    def handler(request):
+        body = json.loads(request.body)
+        if request.url.endswith("/fx/quote"):
+            calls["quotes"] += 1
+            expiry = datetime.now(timezone.utc) + timedelta(seconds=lifetime)
+            return 200, {"status": True, "data": {
+                "reference": f"q-{calls['quotes']}",
+                "rate": 780.5,
+                "expiry": expiry.isoformat().replace("+00:00", "Z"),
+            }}
+        calls["exchanges"].append(body["quote_reference"])
+        if body["quote_reference"] in expired:
+            return 400, {"status": False, "message": "Quote has expired"}
+        return 200, {"status": True, "data": {"id": "tx-" + body["quote_reference"]}}
+
+    return handler, calls
+
+
+def test_exchange_uses_prefetched_quote_once():
+    handler, calls = fx_api()
+    auth, _ = stub_auth(handler)
+    quotes = auth.fx().quote_manager(hot_pairs=[("usd", "ngn", 1000)])
+    quotes.refresh_hot_pairs()
+
+    assert quotes.exchange("USD", "NGN", 1000).data["id"] == "tx-q-1"
+    assert calls["quotes"] == 1
+    assert quotes.exchange("USD", "NGN", 1000).data["id"] == "tx-q-2"  # q-1 was consumed
+    assert quotes.stats() == {"hits": 1, "misses": 1, "requotes": 0}
+
+
+def test_expiring_quotes_are_not_reused_and_expired_ones_requoted():
+    handler, calls = fx_api(lifetime=2)
+    auth, _ = stub_auth(handler)
+    quotes = auth.fx().quote_manager(margin=5)
+    quotes.quote("USD", "NGN", 500)
+    quotes.quote("USD", "NGN", 500)  # within the margin of its expiry
+    assert calls["quotes"] == 2
+
+    handler, calls = fx_api(expired={"q-1"})
+    auth, _ = stub_auth(handler)
+    quotes = auth.fx().quote_manager()
+    result = quotes.exchange("USD", "NGN", 500)
+    assert result.data["id"] == "tx-q-2"
+    assert calls["exchanges"] == ["q-1", "q-2"]
+    assert quotes.stats()["requotes"] == 1
+
+
+def test_background_refresh_keeps_hot_pairs_quoted():
+    handler, calls = fx_api()
+    auth, _ = stub_auth(handler)
+    with auth.fx().quote_manager(hot_pairs=[("USD", "NGN", 1000)], refresh_interval=0.01) as quotes:
+        deadline = time.time() + 2
+        while calls["quotes"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+    assert calls["quotes"] == 1
+    assert quotes._thread is None
+
+
+def test_background_refresh_survives_an_undecodable_quote():
+    handler, calls = fx_api()
+    answers = []
+
+    def flaky(request):
+        answers.append(request)
+        if len(answers) == 1:
+            return 200, "<html>maintenance</html>"
+        return handler(request)
+
+    auth, _ = stub_auth(flaky)
+    with auth.fx().quote_manager(hot_pairs=[("USD", "NGN", 1000)], refresh_interval=0.01):
+        deadline = time.time() + 2
+        while calls["quotes"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+    assert calls["quotes"] == 1
@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import httpx
+from requests.exceptions import ConnectTimeout, ReadTimeout
+
+from maplerad_python.idempotency import SQLiteIdempotencyStore
+from maplerad_python.retry import RetryPolicy
+
+from .stub import stub_auth
+from .test_aio import make_auth
+
+FAST = RetryPolicy(backoff_factor=0, jitter=None)
+
+
+def transfers_api(landed, fail_first):
+    """POSTs fail with ``fail_first`` once; ``landed`` says whether that attempt went through."""
+    state = {"posts": [], "stored": {}}
+
+    def handler(request):
+        if request.method == "GET":
+            ref = request.url.rsplit("/", 1)[1]
+            if ref in state["stored"]:
+                return 200, {"status": True, "data": state["stored"][ref]}
+            return 404, {"status": False, "message": "not found"}
+        body = json.loads(request.body)
+        state["posts"].append(body["reference"])
+        if len(state["posts"]) == 1:
+            if landed:
+                state["stored"][body["reference"]] = {"id": "t1", "reference": body["reference"]}
+            if isinstance(fail_first, BaseException):
+                raise fail_first
+            return fail_first
+        state["stored"][body["reference"]] = {"id": "t2", "reference": body["reference"]}
+        return 200, {"status": True, "data": state["stored"][body["reference"]]}
+
+    return handler, state
+
+
+def test_ambiguous_timeout_is_looked_up_not_resent():
+    handler, state = transfers_api(landed=True, fail_first=ReadTimeout("slow"))
+    auth, adapter = stub_auth(handler, retry_policy=FAST)
+    result = auth.transfer().naira_transfer({"amount": 100})
+
+    assert result.data.id == "t1"
+    assert len(state["posts"]) == 1
+    assert adapter.requests[1].method == "GET"
+
+
+def test_unknown_reference_is_resent_with_same_reference():
+    handler, state = transfers_api(landed=False, fail_first=(502, {}))
+    auth, _ = stub_auth(handler, retry_policy=FAST)
+    result = auth.transfer().naira_transfer({"amount": 100, "reference": "r-1"})
+
+    assert result.data.id == "t2"
+    assert state["posts"] == ["r-1", "r-1"]
+
+
+def test_connect_failure_is_resent_without_lookup():
+    handler, state = transfers_api(landed=False, fail_first=ConnectTimeout("down"))
+    auth, adapter = stub_auth(handler, retry_policy=FAST)
+    auth.issuing().fund_card("c1", 500)
+
+    assert [request.method for request in adapter.requests] == ["POST", "POST"]
+
+
+def test_idempotency_key_survives_restart(tmp_path):
+    handler, state = transfers_api(landed=True, fail_first=(200, {"status": True, "data": {"id": "t1"}}))
+    auth, _ = stub_auth(handler, idempotency_store=SQLiteIdempotencyStore(tmp_path / "keys.db"))
+    auth.fx().exchange_currency("q-1", idempotency_key="order-42")
+
+    auth, adapter = stub_auth(handler, idempotency_store=SQLiteIdempotencyStore(tmp_path / "keys.db"))
+    result = auth.fx().exchange_currency("q-1", idempotency_key="order-42")
+
+    assert len(state["posts"]) == 1
+    assert [request.method for request in adapter.requests] == ["GET"]
+    assert result.data["id"] == "t1"
+
+
+def test_async_5xx_is_looked_up_before_resending():
+    posts = []
+
+    def handler(request):
+        if request.method == "GET":
+            return httpx.Response(200, json={"status": True, "data": {"id": "t1"}})
+        posts.append(json.loads(request.content)["reference"])
+        return httpx.Response(503, json={})
+
+    async def run():
+        auth = make_auth(handler)
+        auth.retry_policy = FAST
+        async with auth:
+            return await auth.bills().buy_airtime({"amount": 100}, idempotency_key="topup-1")
+
+    result = asyncio.run(run())
+    assert len(posts) == 1
+    assert result.data.id == "t1"
@@ -0,0 +1,66 @@
+from maplerad_python.ledger import WalletLedger
+
+from .stub import paged, stub_auth
+
+
+def history_api(history):
+    """``history`` is a list of entries, oldest first; pages are served newest first."""
+    def handler(request):
+        currency = request.url.split("/wallets/")[1].split("/")[0]
+        if currency.startswith("history"):
+            currency = None
+        return paged(request, [row for row in reversed(history) if currency in (None, row["currency"])])
+    return handler
+
+
+def entry(i, currency="NGN"):
+    return {
+        "id": f"e{i}", "currency": currency, "amount": 100 + i,
+        "entry": "CREDIT" if i % 2 else "DEBIT",
+        "created_at": f"2023-07-{1 + i // 100:02d}T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+    }
+
+
+def test_incremental_sync_and_local_queries(tmp_path):
+    history = [entry(i) for i in range(250)]
+    auth, adapter = stub_auth(history_api(history))
+    ledger = WalletLedger(auth.wallet(), tmp_path / "ledger.db", page_size=100)
+
+    assert ledger.sync() == 250
+    assert len(adapter.requests) == 3
+    assert ledger.high_water_mark() == history[-1]["created_at"]
+
+    history.extend(entry(i) for i in range(250, 255))
+    adapter.requests.clear()
+    assert ledger.sync() == 5
+    assert len(adapter.requests) == 1
+    assert ledger.sync() == 0
+
+    newest = ledger.entries(limit=3)
+    assert [row.id for row in newest] == ["e254", "e253", "e252"]
+    assert newest[0].amount == 354
+    assert len(ledger.entries(since="2023-07-03")) == 55
+    assert ledger.totals(until="2023-07-02") == {
+        "CREDIT": (50, sum(100 + i for i in range(1, 100, 2))),
+        "DEBIT": (50, sum(100 + i for i in range(0, 100, 2))),
+    }
+
+
+def test_currency_scoped_sync(tmp_path):
+    history = [entry(i, "NGN") for i in range(3)] + [entry(i, "USD") for i in range(3, 5)]
+    auth, adapter = stub_auth(history_api(history))
+    ledger = WalletLedger(auth.wallet(), tmp_path / "ledger.db")
+    assert ledger.sync(currency="USD") == 2
+    assert "/wallets/USD/history" in adapter.requests[0].url
+    assert ledger.high_water_mark() is None
+    assert [row.id for row in ledger.entries(currency="USD")] == ["e4", "e3"]
+    assert ledger.entries(currency="NGN") == []
+
+
+def test_sync_stops_when_the_api_ignores_paging(tmp_path):
+    for count in (150, 100):
+        rows = [entry(i) for i in reversed(range(count))]
+        auth, adapter = stub_auth((200, {"status": True, "data": rows}))
+        ledger = WalletLedger(auth.wallet(), tmp_path / f"ledger-{count}.db", page_size=100)
+        assert ledger.sync() == count
+        assert len(adapter.requests) <= 2
@@ -0,0 +1,68 @@
+from maplerad_python.mirror import TransactionMirror
+
+from .stub import paged, stub_auth
+
+
+def transactions_api(store):
+    """``store`` maps id to transaction; pages are served newest first."""
+    def handler(request):
+        if "?" not in request.url:
+            found = [row for row in store.values() if request.url.endswith("/" + row["reference"])]
+            if found:
+                return 200, {"status": True, "data": found[0]}
+            return 404, {"status": False, "message": "not found"}
+        return paged(request, sorted(store.values(), key=lambda row: row["created_at"], reverse=True))
+    return handler
+
+
+def transaction(i, status="SUCCESS", day=1):
+    return {
+        "id": f"t{i}", "reference": f"ref-{i}", "status": status, "currency": "NGN",
+        "amount": i, "created_at": f"2023-07-{day:02d}T{i // 60:02d}:{i % 60:02d}:00Z",
+    }
+
+
+def test_incremental_sync_updates_statuses_and_serves_lookups(tmp_path):
+    store = {row["id"]: row for row in (transaction(i) for i in range(120))}
+    store["t119"]["status"] = "PENDING"
+    auth, adapter = stub_auth(transactions_api(store))
+    mirror = TransactionMirror(auth.transactions(), tmp_path / "mirror.db", page_size=50, lookback=600)
+
+    assert mirror.sync() == {"added": 120, "updated": 0}
+    assert len(adapter.requests) == 3
+
+    store["t119"]["status"] = "SUCCESS"
+    store.update({row["id"]: row for row in (transaction(i) for i in range(120, 125))})
+    adapter.requests.clear()
+    assert mirror.sync() == {"added": 5, "updated": 1}
+    assert len(adapter.requests) == 1
+
+    adapter.requests.clear()
+    assert mirror.get("ref-7").id == "t7"
+    result = mirror.get_transaction("ref-119")
+    assert result.data.status == "SUCCESS"
+    assert adapter.requests == []
+
+    assert [row.id for row in mirror.find(limit=2)] == ["t124", "t123"]
+    assert len(mirror.find(since="2023-07-01T01:00:00")) == 65
+
+
+def test_pending_transactions_are_refreshed_on_lookup(tmp_path):
+    store = {"t1": transaction(1, status="PENDING")}
+    auth, adapter = stub_auth(transactions_api(store))
+    mirror = TransactionMirror(auth.transactions(), tmp_path / "mirror.db")
+    mirror.sync()
+
+    store["t1"]["status"] = "FAILED"
+    assert mirror.get_transaction("ref-1").data.status == "FAILED"
+    assert mirror.get("t1").status == "FAILED"
+    assert mirror.get_transaction("missing").status_code == 404
+
+
+def test_sync_stops_when_the_api_ignores_paging(tmp_path):
+    for count in (30, 10):
+        rows = [transaction(i) for i in range(count)]
+        auth, adapter = stub_auth((200, {"status": True, "data": rows}))
+        mirror = TransactionMirror(auth.transactions(), tmp_path / f"mirror-{count}.db", page_size=10)
+        assert mirror.sync() == {"added": count, "updated": 0}
+        assert len(adapter.requests) <= 2
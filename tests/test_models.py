@@ -0,0 +1,70 @@
+import json
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from maplerad_python.exceptions import PostException
+from maplerad_python.models import ApiResponse, Card, ModelList
+from maplerad_python.retry import RetryPolicy
+
+from .stub import stub_auth
+
+
+def counting_loads():
+    calls = []
+
+    def loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    return loads, calls
+
+
+def test_body_is_decoded_once_and_only_when_needed():
+    loads, calls = counting_loads()
+    body = json.dumps({"status": True, "data": {"id": "c1", "masked_pan": "5319****1234"}})
+    response = ApiResponse(200, body.encode(), model=Card, loads=loads)
+    assert response.ok and calls == []
+    assert response.data.masked_pan == "5319****1234"
+    assert response["data"]["id"] == "c1"
+    assert response.json()["status"] is True
+    assert len(calls) == 1
+
+
+def test_list_items_are_wrapped_on_access():
+    body = {"data": [{"id": str(i)} for i in range(1000)]}
+    data = ApiResponse(200, json.dumps(body).encode(), model=Card).data
+    assert isinstance(data, ModelList) and len(data) == 1000
+    assert isinstance(data[10], Card) and data[10].id == "10"
+    assert [card.id for card in data[:2]] == ["0", "1"]
+
+
+def test_resource_methods_return_typed_responses():
+    auth, _ = stub_auth((200, {"status": True, "data": {"id": "card-1", "status": "ACTIVE"}}))
+    result = auth.issuing().get_card("card-1")
+    assert isinstance(result, ApiResponse)
+    assert result.data.status == "ACTIVE"
+
+    auth, _ = stub_auth((404, {"status": False, "message": "card not found"}))
+    result = auth.issuing().get_card("missing")
+    assert not result.ok and result.message == "card not found"
+
+
+def test_counterparty_and_institution_data_use_the_models():
+    party = {"id": "cp1", "name": "Ada Stores"}
+    auth, _ = stub_auth((200, {"status": True, "data": party}))
+    assert auth.counterparty().get_counterparty("cp1").data.name == "Ada Stores"
+
+    auth, _ = stub_auth((200, {"status": True, "data": [party]}))
+    assert auth.counterparty().get_all_counterparties().data[0].name == "Ada Stores"
+
+    auth, _ = stub_auth((200, {"status": True, "data": [{"code": "058", "name": "GTBank"}]}))
+    assert auth.institution().get_all_institutions({"country": "NG"}).data[0].code == "058"
+
+
+def test_transport_errors_raise_instead_of_being_returned():
+    auth, _ = stub_auth(ConnectionError("reset"), retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(PostException):
+        auth.transfer().get_transfer("t1")
+    with pytest.raises(PostException):
+        auth.misc().get_currencies()
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from maplerad_python.exceptions import APIError
+from maplerad_python.models import Customer
+from maplerad_python.retry import RetryPolicy
+
+from .stub import query, stub_auth
+from .test_aio import make_auth
+
+
+def customers_api(total, fail_page=None, cap=None):
+    def handler(request):
+        params = query(request)
+        page, size = int(params["page"]), int(params["page_size"])
+        size = min(size, cap) if cap else size
+        if page == fail_page:
+            return 500, {"status": False, "message": "boom"}
+        rows = [{"id": str(i)} for i in range((page - 1) * size, min(total, page * size))]
+        return 200, {"status": True, "data": rows, "meta": {"page": page, "total": total}}
+
+    return handler
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_customers_walks_every_page(prefetch):
+    auth, adapter = stub_auth(customers_api(25))
+    customers = list(auth.customer().iter_customers(page_size=10, prefetch=prefetch))
+    assert [c.id for c in customers] == [str(i) for i in range(25)]
+    assert all(isinstance(c, Customer) for c in customers)
+    assert len(adapter.requests) == 3
+
+
+def test_iter_customers_stops_on_exact_multiple_using_meta():
+    auth, adapter = stub_auth(customers_api(20))
+    assert len(list(auth.customer().iter_customers(page_size=10))) == 20
+    assert len(adapter.requests) == 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_server_capping_the_page_size_does_not_cut_iteration_short(concurrency):
+    auth, adapter = stub_auth(customers_api(250, cap=100))
+    customers = list(auth.customer().iter_customers(page_size=500, concurrency=concurrency))
+    assert [c.id for c in customers] == [str(i) for i in range(250)]
+    assert len(adapter.requests) == 3
+
+
+def test_next_page_is_prefetched_while_consuming():
+    auth, adapter = stub_auth(customers_api(30))
+    customers = auth.customer().iter_customers(page_size=10)
+    next(customers)
+    for _ in range(100):
+        if len(adapter.requests) == 2:
+            break
+        threading.Event().wait(0.01)
+    assert len(adapter.requests) == 2
+    customers.close()
+
+
+def test_failed_page_raises():
+    auth, _ = stub_auth(customers_api(30, fail_page=2), retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(APIError):
+        list(auth.customer().iter_customers(page_size=10))
+
+
+def test_async_iter_customers():
+    def handler(request):
+        page, size = int(request.url.params["page"]), int(request.url.params["page_size"])
+        rows = [{"id": str(i)} for i in range((page - 1) * size, min(25, page * size))]
+        return httpx.Response(200, json={"status": True, "data": rows})
+
+    async def run():
+        async with make_auth(handler) as auth:
+            return [c.id async for c in auth.customer().iter_customers(page_size=10)]
+
+    assert asyncio.run(run()) == [str(i) for i in range(25)]
+
+
+def test_concurrent_fan_out_keeps_order_and_overlaps_requests():
+    api = customers_api(60)
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow(request):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        threading.Event().wait(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return api(request)
+
+    auth, adapter = stub_auth(slow)
+    customers = list(auth.customer().iter_customers(page_size=10, concurrency=4))
+    assert [c.id for c in customers] == [str(i) for i in range(60)]
+    assert len(adapter.requests) == 6
+    assert peak[0] == 4
+
+
+def test_card_transactions_fan_out_uses_card_paging_params():
+    def handler(request):
+        params = query(request)
+        page = int(params["page"])
+        assert params["status"] == "SUCCESS" and params["pageSize"] == "2"
+        rows = [{"id": f"{page}-{i}"} for i in range(2)] if page <= 3 else []
+        return 200, {"status": True, "data": rows, "meta": {"page_count": 3}}
+
+    auth, adapter = stub_auth(handler)
+    ids = [t.id for t in auth.issuing().iter_card_transactions("c1", {"status": "SUCCESS"}, page_size=2, concurrency=3)]
+    assert ids == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert len(adapter.requests) == 3
@@ -0,0 +1,77 @@
+import json
+
+from requests.exceptions import ConnectionError
+
+from maplerad_python.payouts import PayoutEngine, PayoutJournal
+from maplerad_python.retry import RetryPolicy
+
+from .stub import stub_auth
+
+
+def payouts(*references):
+    return [{"reference": ref, "amount": 100, "account_number": "0123456789"} for ref in references]
+
+
+def test_resume_skips_done_and_rechecks_in_flight(tmp_path):
+    journal_path = tmp_path / "payouts.journal"
+    sent = []
+    down = {"p3"}
+
+    def handler(request):
+        if request.method == "GET":
+            ref = request.url.rsplit("/", 1)[1]
+            if ref == "p2":
+                return 200, {"status": True, "data": {"id": "t-p2"}}
+            return 404, {"status": False, "message": "not found"}
+        ref = json.loads(request.body)["reference"]
+        if ref in down:
+            raise ConnectionError("reset")
+        sent.append(ref)
+        if ref == "p4":
+            return 400, {"status": False, "message": "invalid account"}
+        return 200, {"status": True, "data": {"id": "t-" + ref}}
+
+    auth, _ = stub_auth(handler, retry_policy=RetryPolicy(max_attempts=1))
+    engine = PayoutEngine(auth.transfer(), PayoutJournal(journal_path, fsync=False), max_workers=2)
+    engine.journal.record("p2", "submitting")  # crashed after sending p2
+    report = engine.run(payouts("p1", "p2", "p3", "p4", "p1"))
+    engine.close()
+
+    assert [result.outcome for result in report] == [
+        "success", "skipped", "transport_error", "api_error", "skipped"
+    ]
+    assert sorted(sent) == ["p1", "p4"]
+
+    down.clear()
+    sent.clear()
+    source = tmp_path / "batch.ndjson"
+    source.write_text("\n".join(json.dumps(p) for p in payouts("p1", "p2", "p3", "p4")) + "\n")
+    engine = PayoutEngine(auth.transfer(), str(journal_path))
+    report = engine.run(str(source))
+    engine.close()
+
+    assert sent == ["p3"]  # p3 was in doubt, not found, so resent; p4 was rejected
+    assert report.counts() == {"success": 1, "api_error": 0, "transport_error": 0, "skipped": 3}
+    assert PayoutJournal(journal_path).get("p2")["transfer_id"] == "t-p2"
+
+
+def test_throttled_payout_is_resent_and_missing_reference_is_reported(tmp_path):
+    sent = []
+
+    def handler(request):
+        if request.method == "GET":
+            return 404, {"status": False, "message": "not found"}
+        ref = json.loads(request.body)["reference"]
+        sent.append(ref)
+        if len(sent) == 1:
+            return 429, {"status": False, "message": "slow down"}, {"Retry-After": "0"}
+        return 200, {"status": True, "data": {"id": "t-" + ref}}
+
+    auth, _ = stub_auth(handler, retry_policy=RetryPolicy(max_attempts=1))
+    engine = PayoutEngine(auth.transfer(), PayoutJournal(tmp_path / "payouts.journal", fsync=False))
+    report = engine.run(payouts("p1") + [{"amount": 100}])
+
+    assert [result.outcome for result in report] == ["success", "api_error"]
+    assert isinstance(report[1].error, ValueError)
+    assert sent == ["p1", "p1"]
+    assert engine.journal.get("p1")["state"] == "done"
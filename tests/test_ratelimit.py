@@ -0,0 +1,41 @@
+import time
+
+from maplerad_python.ratelimit import MemoryBackend, RateLimiter, SQLiteBackend
+
+from .stub import stub_auth
+
+
+def test_bucket_allows_burst_then_asks_to_wait():
+    backend = MemoryBackend()
+    assert [backend.take("issuing", rate=10, capacity=3) for _ in range(3)] == [0, 0, 0]
+    assert 0 < backend.take("issuing", rate=10, capacity=3) <= 0.1
+
+
+def test_sqlite_backend_budget_is_shared_between_instances(tmp_path):
+    path = tmp_path / "buckets.db"
+    first, second = SQLiteBackend(path), SQLiteBackend(path)
+    assert first.take("transfers", rate=1, capacity=2) == 0
+    assert second.take("transfers", rate=1, capacity=2) == 0
+    assert first.take("transfers", rate=1, capacity=2) > 0
+    assert second.take("customers", rate=1, capacity=2) == 0
+
+
+def test_limiter_is_keyed_per_endpoint_family():
+    limiter = RateLimiter({"issuing": (50, 1)})
+    assert limiter.family("/issuing/abc/fund") == "issuing"
+    assert limiter.family("/customers?page=1") == "customers"
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire("/issuing/abc/fund")
+        limiter.acquire("/customers")
+    assert time.monotonic() - start >= 0.03
+
+
+def test_requests_wait_for_the_limiter():
+    limiter = RateLimiter(default=(100, 1))
+    auth, adapter = stub_auth((200, {}), rate_limiter=limiter)
+    start = time.monotonic()
+    for _ in range(4):
+        auth.__request__("GET", "/wallets")
+    assert time.monotonic() - start >= 0.03
+    assert len(adapter.requests) == 4
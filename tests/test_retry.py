@@ -0,0 +1,61 @@
+from email.utils import formatdate
+import time
+
+import pytest
+from requests.exceptions import ConnectionError, ConnectTimeout
+
+from maplerad_python.retry import RetryPolicy, parse_retry_after
+
+from .stub import stub_auth
+
+
+FAST = RetryPolicy(backoff_factor=0, jitter=None)
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=None)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_policy_gives_up_on_attempts_and_elapsed_budget():
+    policy = RetryPolicy(max_attempts=3, backoff_factor=1, jitter=None, max_elapsed=10)
+    assert policy.next_delay(1, 0) == 1
+    assert policy.next_delay(3, 0) is None
+    assert policy.next_delay(2, 9) is None
+
+
+def test_retry_after_header():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(formatdate(time.time() + 60, usegmt=True)) > 50
+    assert parse_retry_after("soon") is None
+    policy = RetryPolicy(jitter=None, backoff_factor=0.1)
+    assert policy.next_delay(1, 0, {"Retry-After": "2"}) == 2
+
+
+def test_get_is_retried_on_429_and_5xx():
+    auth, adapter = stub_auth((429, {}, {"Retry-After": "0"}), (503, {}), (200, {"status": True}), retry_policy=FAST)
+    response = auth.__request__("GET", "/customers")
+    assert response.status_code == 200
+    assert len(adapter.requests) == 3
+
+
+def test_post_is_not_retried_by_default():
+    auth, adapter = stub_auth((503, {}), (200, {}), retry_policy=FAST)
+    assert auth.__request__("POST", "/transfers", json={}).status_code == 503
+    assert len(adapter.requests) == 1
+    with pytest.raises(ConnectionError):
+        stub_auth(ConnectionError("reset"), (200, {}), retry_policy=FAST)[0].__request__("POST", "/transfers")
+
+
+def test_post_is_retried_when_the_connection_never_opened():
+    auth, adapter = stub_auth(ConnectTimeout("connect"), (201, {}), retry_policy=FAST)
+    assert auth.__request__("POST", "/transfers", json={}).status_code == 201
+    assert len(adapter.requests) == 2
+
+
+def test_per_method_policy():
+    auth, adapter = stub_auth(
+        (502, {}), (200, {}), retry_policy=FAST, method_retry_policies={"PATCH": FAST}
+    )
+    assert auth.__request__("PATCH", "/issuing/1/freeze").status_code == 200
+    assert len(adapter.requests) == 2
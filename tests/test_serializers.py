@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from maplerad_python import serializers
+from maplerad_python.serializers import JSONSerializer, get_serializer
+
+from .stub import stub_auth
+
+
+class Recording(JSONSerializer):
+    name = "recording"
+
+    def __init__(self):
+        self.encoded, self.decoded = [], []
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def test_named_backend_falls_back_when_not_installed(monkeypatch):
+    class Missing:
+        def __init__(self):
+            raise ImportError("not installed")
+
+    monkeypatch.setitem(serializers.SERIALIZERS, "orjson", Missing)
+    monkeypatch.setitem(serializers.SERIALIZERS, "msgspec", Missing)
+    assert get_serializer("orjson").name == "json"
+    assert get_serializer("auto").name == "json"
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_backends_round_trip(name):
+    serializer = get_serializer(name)
+    payload = {"amount": 1000, "meta": {"scheme": "DOM"}, "tags": ["a", "b"]}
+    assert json.loads(serializer.dumps(payload)) == payload
+    assert serializer.loads(json.dumps(payload).encode()) == payload
+
+
+def test_client_uses_serializer_both_ways():
+    recording = Recording()
+    auth, adapter = stub_auth((200, {"status": True, "data": {"id": "c1"}}), serializer=recording)
+    result = auth.issuing().fund_card("c1", 500)
+    assert json.loads(adapter.requests[0].body)["amount"] == 500
+    assert [body["amount"] for body in recording.encoded] == [500]
+    assert result["data"]["id"] == "c1"
+    assert len(recording.decoded) == 1
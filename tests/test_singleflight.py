@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from requests.exceptions import ConnectionError
+
+from maplerad_python.exceptions import PostException
+from maplerad_python.retry import RetryPolicy
+
+from .stub import stub_auth
+from .test_aio import make_auth
+
+
+def gated(result):
+    gate = threading.Event()
+
+    def handler(request):
+        gate.wait(5)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return gate, handler
+
+
+def test_identical_gets_share_one_call():
+    gate, handler = gated((200, {"status": True, "data": {"id": "c1", "status": "ACTIVE"}}))
+    auth, adapter = stub_auth(handler)
+    issuing = auth.issuing()
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(issuing.get_card, "c1") for _ in range(8)]
+        futures.append(pool.submit(issuing.get_card, "c2"))
+        time.sleep(0.2)
+        gate.set()
+        results = [future.result() for future in futures]
+
+    assert sorted(request.url.rsplit("/", 1)[1] for request in adapter.requests) == ["c1", "c2"]
+    assert len({id(result) for result in results}) == 9
+    assert all(result.data.id == "c1" for result in results[:8])
+    assert auth.single_flight.in_flight() == 0
+
+
+def test_errors_reach_every_waiter_and_coalescing_can_be_disabled():
+    gate, handler = gated(ConnectionError("reset"))
+    auth, adapter = stub_auth(handler, retry_policy=RetryPolicy(max_attempts=1))
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(auth.customer().get_customer, "cus_1") for _ in range(4)]
+        time.sleep(0.2)
+        gate.set()
+        for future in futures:
+            with pytest.raises(PostException):
+                future.result()
+    assert len(adapter.requests) == 1
+
+    gate, handler = gated((200, {"status": True, "data": {}}))
+    gate.set()
+    auth, adapter = stub_auth(handler, coalesce_gets=False)
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: auth.transfer().get_transfer("t1"), range(4)))
+    assert len(adapter.requests) == 4
+
+
+def test_gets_with_a_body_are_never_coalesced():
+    gate, handler = gated((200, {"status": True, "data": {}}))
+    auth, adapter = stub_auth(handler)
+    payloads = [{"amount": 100, "currency": "NGN"}, {"amount": 5000, "currency": "USD"}] * 2
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(auth.misc().credit_test_wallet, payload) for payload in payloads]
+        time.sleep(0.2)
+        gate.set()
+        for future in futures:
+            future.result()
+    assert len(adapter.requests) == 4
+
+
+def test_async_identical_gets_share_one_call():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"status": True, "data": {"id": "t1"}})
+
+    async def run():
+        async with make_auth(handler) as auth:
+            transfers = auth.transfer()
+            return await asyncio.gather(*(transfers.get_transfer("t1") for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert calls == ["/v1/transfers/t1"]
+    assert len({id(result) for result in results}) == 10
+    assert results[9].data.id == "t1"
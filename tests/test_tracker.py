@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+from requests.exceptions import ConnectionError
+
+from maplerad_python.retry import RetryPolicy
+from maplerad_python.tracker import TransferTracker
+
+from .stub import stub_auth
+
+
+def transfers_api(script):
+    """``script`` maps a transfer id to the statuses (or exceptions) of its successive polls."""
+    polls = {}
+    lock = threading.Lock()
+
+    def handler(request):
+        transfer_id = request.url.rsplit("/", 1)[1]
+        with lock:
+            count = polls[transfer_id] = polls.get(transfer_id, 0) + 1
+        steps = script[transfer_id]
+        step = steps[min(count, len(steps)) - 1]
+        if isinstance(step, BaseException):
+            raise step
+        return 200, {"status": True, "data": {"id": transfer_id, "status": step}}
+
+    return handler, polls
+
+
+def fast_tracker(auth, **options):
+    options.setdefault("min_interval", 0.01)
+    return TransferTracker(auth.transfer(), age_factor=0, budget=1000, burst=100, **options)
+
+
+def test_polls_until_terminal_and_calls_back():
+    handler, polls = transfers_api({
+        "t1": ["SUCCESS"],
+        "t2": ["PENDING", "PROCESSING", "FAILED"],
+        "t3": [ConnectionError("reset"), "successful"],
+    })
+    auth, _ = stub_auth(handler, retry_policy=RetryPolicy(max_attempts=1), coalesce_gets=False)
+    settled, own = [], []
+    with fast_tracker(auth, on_terminal=settled.append) as tracker:
+        tracker.track("t1", on_terminal=own.append)
+        tracker.track("t2")
+        tracker.track("t3")
+        tracker.track("t1")
+        assert tracker.join(timeout=5)
+
+    assert sorted((t.id, t.status) for t in settled) == [
+        ("t1", "SUCCESS"), ("t2", "FAILED"), ("t3", "successful")
+    ]
+    assert [t.id for t in own] == ["t1"]
+    assert polls == {"t1": 1, "t2": 3, "t3": 2}
+
+
+def test_backoff_grows_with_age_and_budget_is_shared():
+    tracker = TransferTracker(None, min_interval=2, max_interval=60, age_factor=0.1)
+    assert [tracker.interval(age) for age in (0, 50, 3600)] == [2, 5, 60]
+
+    handler, _ = transfers_api({f"t{i}": ["SUCCESS"] for i in range(6)})
+    auth, _ = stub_auth(handler)
+    started = time.monotonic()
+    with TransferTracker(auth.transfer(), budget=20, burst=1) as tracker:
+        for i in range(6):
+            tracker.track(f"t{i}")
+        assert tracker.join(timeout=5)
+    assert time.monotonic() - started >= 0.2
+
+
+def test_async_iteration_yields_settled_transfers():
+    handler, _ = transfers_api({"a": ["PENDING", "SUCCESS"], "b": ["REVERSED"]})
+    auth, _ = stub_auth(handler)
+
+    async def run():
+        with fast_tracker(auth) as tracker:
+            tracker.track("a")
+            tracker.track("b")
+            return [transfer.id async for transfer in tracker]
+
+    assert sorted(asyncio.run(run())) == ["a", "b"]
+
+
+def test_unexpected_poll_errors_reschedule_and_untrack_ends_iteration():
+    handler, polls = transfers_api({"t1": ["SUCCESS"]})
+
+    def flaky(request):
+        if not polls:
+            polls["t1"] = 0
+            return 200, "<html>maintenance</html>"
+        return handler(request)
+
+    auth, _ = stub_auth(flaky, coalesce_gets=False)
+    with fast_tracker(auth) as tracker:
+        tracker.track("t1")
+        assert tracker.join(timeout=3)
+    assert polls == {"t1": 1}
+
+    handler, _ = transfers_api({"slow": ["PENDING"]})
+    auth, _ = stub_auth(handler, coalesce_gets=False)
+
+    async def run():
+        with fast_tracker(auth) as tracker:
+            tracker.track("slow")
+            asyncio.get_running_loop().call_later(0.05, tracker.untrack, "slow")
+            return [transfer async for transfer in tracker]
+
+    assert asyncio.run(asyncio.wait_for(run(), 3)) == []
@@ -0,0 +1,114 @@
+import asyncio
+import base64
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from maplerad_python.exceptions import WebhookVerificationError
+from maplerad_python.models import Transfer
+from maplerad_python.webhooks import Dispatcher, WebhookHandler, sign, verify
+
+SECRET = "whsec_" + base64.b64encode(b"test-secret").decode()
+
+
+def signed(payload, message_id="msg_1", timestamp=None):
+    body = json.dumps(payload).encode()
+    timestamp = timestamp or int(time.time())
+    return body, {
+        "Svix-Id": message_id,
+        "Svix-Timestamp": str(timestamp),
+        "Svix-Signature": "v1,bogus " + sign(SECRET, message_id, timestamp, body),
+    }
+
+
+def test_verify_signature():
+    body, headers = signed({"event": "transfer.successful"})
+    assert verify(SECRET, headers, body) == "msg_1"
+    with pytest.raises(WebhookVerificationError):
+        verify(SECRET, headers, body + b" ")
+    with pytest.raises(WebhookVerificationError):
+        verify(SECRET, signed({}, timestamp=int(time.time()) - 3600)[1], body)
+    with pytest.raises(WebhookVerificationError):
+        verify(SECRET, {}, body)
+
+
+def test_wsgi_app_queues_typed_events_once():
+    received = []
+    dispatcher = Dispatcher()
+    dispatcher.on("transfer.*")(received.append)
+    webhooks = WebhookHandler(SECRET, dispatcher)
+    body, headers = signed({"event": "transfer.successful", "data": {"id": "t1", "status": "SUCCESS"}})
+
+    def post(body, headers):
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body),
+        }
+        environ.update({"HTTP_" + name.upper().replace("-", "_"): value for name, value in headers.items()})
+        statuses = []
+        webhooks.wsgi_app(environ, lambda status, headers: statuses.append(status))
+        return statuses[0]
+
+    assert post(body, headers) == "202 Accepted"
+    assert post(body, headers) == "200 OK"  # redelivery
+    assert post(body, dict(headers, **{"Svix-Signature": "v1,bad"})) == "401 Unauthorized"
+    assert dispatcher.join(timeout=5)
+    assert len(received) == 1
+    assert isinstance(received[0].data, Transfer) and received[0].data.status == "SUCCESS"
+
+
+def test_asgi_app():
+    webhooks = WebhookHandler(SECRET)
+    body, headers = signed({"event": "collection.successful", "id": "c1"})
+    sent = []
+    messages = [{"body": body[:10], "more_body": True}, {"body": body[10:]}]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "method": "POST",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+    asyncio.run(webhooks.asgi_app(scope, receive, send))
+    assert sent[0]["status"] == 202
+    assert webhooks.dispatcher.join(timeout=5)
+
+
+def test_replay_dispatches_batches_concurrently(tmp_path):
+    dispatcher = Dispatcher(max_workers=4, batch_size=10)
+    batches, singles, threads = [], [], set()
+    lock = threading.Lock()
+
+    @dispatcher.on("issuing.transaction", batch=True)
+    def on_batch(events):
+        batches.append([event.data.id for event in events])
+
+    @dispatcher.on("*")
+    def on_any(event):
+        with lock:
+            singles.append(event.id)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+
+    @dispatcher.on("issuing.*")
+    def broken(event):
+        raise RuntimeError("handler bug")
+
+    path = tmp_path / "events.ndjson"
+    path.write_text("\n".join(
+        json.dumps({"event": "issuing.transaction", "id": f"e{i}"}) for i in range(25)
+    ) + "\n")
+    results = WebhookHandler(SECRET, dispatcher).replay(str(path))
+
+    assert [status for status, _ in results] == [202] * 25
+    assert sorted(singles) == sorted(f"e{i}" for i in range(25))
+    assert sum(len(batch) for batch in batches) == 25 and max(len(b) for b in batches) <= 10
+    assert len(threads) > 1